@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+#   Benchmarks of the Graph class (see graph.py). Synthetic graphs
+#   of each family (Erdos-Renyi, power-law, grid, path and complete)
+#   are generated with a given number of vertices and the time and
+#   the peak of memory of each operation are measured in them. The
+#   results are written in JSON, as follows:
+#           {
+#               "python": "3.11.7",
+#               "results": [
+#                   {"family": "path", "vertices": 1000,
+#                    "operation": "is_connected", "calls": 1,
+#                    "seconds": 0.0004, "peak_bytes": 65536},
+#                   ...
+#               ]
+#           }
+#   And can be compared with the results of a previous run, the
+#   operations that became slower than a tolerance are reported.
+#
+#   Usage:
+#       python3 benchmark.py --scales 1000 10000 --output base.json
+#       python3 benchmark.py --scales 1000 10000 --compare base.json
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from platform import python_version
+from random import Random
+from time import perf_counter
+from graph import Graph
+
+#######################
+#     Generators      #
+#######################
+# Each generator returns the list of edges of a graph with
+# about n vertices, as pairs (vertex1, vertex2).
+
+def erdos_renyi(n, rng, degree=4):
+    """Edges of a random graph, where each pair of vertices is
+    connected with the same probability (degree / n). Small
+    graphs that can not have that degree are complete.
+
+    :param n: Number of vertices.
+    :param rng: The random number generator.
+    :param degree: Average degree of the vertices.
+    :rtype: list
+
+    """
+    edges = set()
+    target = min(n * degree // 2, n * (n - 1) // 2)
+    while len(edges) < target:
+        vertex1, vertex2 = rng.randrange(n), rng.randrange(n)
+        if vertex1 != vertex2:
+            edges.add((min(vertex1, vertex2), max(vertex1, vertex2)))
+    return list(edges)
+
+def power_law(n, rng, degree=4):
+    """Edges of a scale-free graph (Barabasi-Albert), where
+    each new vertex is connected with the vertices of higher
+    degree with higher probability
+
+    :param n: Number of vertices.
+    :param rng: The random number generator.
+    :param degree: Average degree of the vertices.
+    :rtype: list
+
+    """
+    m = max(1, degree // 2)
+    edges = [(i, i + 1) for i in range(m)]
+    # Each vertex appears once for each of its edges, so a
+    # uniform choice in it is proportional to the degree.
+    ends = [vertex for edge in edges for vertex in edge]
+    for vertex in range(m + 1, n):
+        targets = {rng.choice(ends) for _ in range(m)}
+        for target in targets:
+            edges.append((target, vertex))
+            ends += [target, vertex]
+    return edges
+
+def grid(n, rng=None):
+    """Edges of a square grid with about n vertices
+
+    :param n: Number of vertices.
+    :rtype: list
+
+    """
+    side = max(1, int(n ** 0.5))
+    edges = []
+    for x in range(side):
+        for y in range(side):
+            if x:
+                edges.append(((x - 1, y), (x, y)))
+            if y:
+                edges.append(((x, y - 1), (x, y)))
+    return edges
+
+def path(n, rng=None):
+    """Edges of a path with n vertices
+
+    :param n: Number of vertices.
+    :rtype: list
+
+    """
+    return [(i, i + 1) for i in range(n - 1)]
+
+def complete(n, rng=None):
+    """Edges of a complete graph with about n edges, so, with
+    about sqrt(2n) vertices, as a complete graph with n
+    vertices would not fit in memory for large n
+
+    :param n: Number of edges.
+    :rtype: list
+
+    """
+    k = max(2, int((2 * n) ** 0.5))
+    return [(i, j) for i in range(k) for j in range(i + 1, k)]
+
+FAMILIES = {
+    "erdos_renyi": erdos_renyi,
+    "power_law": power_law,
+    "grid": grid,
+    "path": path,
+    "complete": complete,
+}
+
+#######################
+#     Operations      #
+#######################
+# Each operation receives the edges and a graph built from
+# them, and returns a function to be measured and the number
+# of calls that it makes.
+
+def bulk_load(edges, graph, rng):
+    return (lambda: Graph.from_edges(edges)), 1
+
+def connect(edges, graph, rng):
+    def run():
+        built = Graph()
+        built.add_vertices_from(graph.vertices)
+        for vertex1, vertex2 in edges:
+            built.connect(vertex1, vertex2)
+    return run, len(edges)
+
+def get_degree(edges, graph, rng):
+    def run():
+        for vertex in graph.vertices:
+            graph.get_degree(vertex)
+    return run, graph.order()
+
+def is_connected(edges, graph, rng):
+    return graph.is_connected, 1
+
+def is_tree(edges, graph, rng):
+    return graph.is_tree, 1
+
+def has_cycle(edges, graph, rng):
+    return graph.has_cycle, 1
+
+def remove_vertex(edges, graph, rng):
+    victims = rng.sample(list(graph.vertices), min(1000, graph.order()))
+    copy = Graph({v: dict(adjacents) for v, adjacents in graph.vertices.items()})
+    def run():
+        for vertex in victims:
+            copy.remove_vertex(vertex)
+    return run, len(victims)
+
+OPERATIONS = {
+    "bulk_load": bulk_load,
+    "connect": connect,
+    "get_degree": get_degree,
+    "is_connected": is_connected,
+    "is_tree": is_tree,
+    "has_cycle": has_cycle,
+    "remove_vertex": remove_vertex,
+}
+
+def measure(run):
+    """Runs a function and returns the seconds that it took
+    and the peak of memory allocated while it ran
+
+    :param run: The function.
+    :rtype: tuple (float, int)
+
+    """
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    began = perf_counter()
+    run()
+    seconds = perf_counter() - began
+    return seconds, tracemalloc.get_traced_memory()[1] - before
+
+def run_benchmarks(scales, families=None, operations=None, repeat=3, seed=0):
+    """Measures each operation in each family of graphs at
+    each scale, keeping the fastest of the repetitions
+
+    :param scales: List with the numbers of vertices.
+    :param families: Names of the families, all by default.
+    :param operations: Names of the operations, all by default.
+    :param repeat: Times that each operation is measured.
+    :param seed: Seed of the random number generator.
+    :rtype: list
+
+    """
+    results = []
+    tracemalloc.start()
+    try:
+        for family in families or FAMILIES:
+            for n in scales:
+                rng = Random(seed)
+                edges = FAMILIES[family](n, rng)
+                graph = Graph.from_edges(edges)
+                for operation in operations or OPERATIONS:
+                    best = None
+                    for _ in range(repeat):
+                        run, calls = OPERATIONS[operation](edges, graph, rng)
+                        seconds, peak = measure(run)
+                        if best is None or seconds < best[0]:
+                            best = (seconds, peak)
+                    results.append({"family": family, "vertices": n,
+                        "operation": operation, "calls": calls,
+                        "seconds": best[0], "peak_bytes": best[1]})
+    finally:
+        tracemalloc.stop()
+    return results
+
+def compare(results, baseline, tolerance=1.5):
+    """Returns the results that are slower than the same
+    result in the baseline by more than a tolerance, as
+    tuples (result, baseline seconds, ratio)
+
+    :param results: List with the results.
+    :param baseline: List with the results of the baseline.
+    :param tolerance: Greatest accepted ratio between the
+        seconds of a result and of its baseline.
+    :rtype: list
+
+    """
+    key = lambda r: (r["family"], r["vertices"], r["operation"])
+    previous = {key(r): r["seconds"] for r in baseline}
+    slower = []
+    for result in results:
+        seconds = previous.get(key(result))
+        if seconds:
+            ratio = result["seconds"] / seconds
+            if ratio > tolerance:
+                slower.append((result, seconds, ratio))
+    return slower
+
+def main(arguments=None):
+    parser = ArgumentParser(description="Benchmarks of the Graph class.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1000, 10000],
+        help="numbers of vertices of the graphs (default: 1000 10000)")
+    parser.add_argument("--families", nargs="+", choices=sorted(FAMILIES),
+        help="families of graphs (default: all)")
+    parser.add_argument("--operations", nargs="+", choices=sorted(OPERATIONS),
+        help="measured operations (default: all)")
+    parser.add_argument("--repeat", type=int, default=3,
+        help="repetitions of each operation, the fastest is kept (default: 3)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file for the JSON results (default: stdout)")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+        help="greatest accepted slowdown when comparing (default: 1.5)")
+    arguments = parser.parse_args(arguments)
+
+    results = run_benchmarks(arguments.scales, arguments.families,
+        arguments.operations, arguments.repeat, arguments.seed)
+    report = json.dumps({"python": python_version(), "results": results}, indent=1)
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            output.write(report + "\n")
+    else:
+        print(report)
+
+    if arguments.compare:
+        with open(arguments.compare) as baseline:
+            slower = compare(results, json.load(baseline)["results"],
+                arguments.tolerance)
+        for result, seconds, ratio in slower:
+            print("%s %s (%d vertices): %.6fs, was %.6fs (%.2fx)" % (
+                result["operation"], result["family"], result["vertices"],
+                result["seconds"], seconds, ratio), file=sys.stderr)
+        return 1 if slower else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+#   A Graph (see graph.py) that can be shared between threads. Each
+#   public method of Graph is wrapped to hold a reader-writer lock
+#   while it runs: the methods that change the graph hold it alone
+#   (writing), any other ones hold it along with each other
+#   (reading). The lock is reentrant, so a method can call others,
+#   and a batch of changes can hold it once, as follows:
+#           with graph.transaction():
+#               graph.connect(a, b)
+#               graph.connect(b, c)
+#
+#   Long traversals (bfs, dfs and transitive_closure) run on a
+#   snapshot: a FrozenGraph (see frozen.py) with the version of the
+#   graph after the last change. It is built once per version, and
+#   writers are not blocked while it is traversed. The generators
+#   of other methods are consumed while the lock is held, and the
+#   views (as adjacents_view and subgraph) are replaced by copies,
+#   since a live view would be read without the lock.
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+from contextlib import contextmanager
+from functools import wraps
+from inspect import isfunction, isgenerator
+from threading import Condition, Lock, local, get_ident
+from graph import Graph
+
+# Methods of Graph that change it.
+WRITE_METHODS = {
+    "add_vertex", "remove_vertex", "connect", "disconnect",
+    "add_vertices_from", "add_edges_from", "track_connectivity",
+    "enable_journal", "apply_delta", "compact_journal",
+    "enable_cache", "disable_cache",
+}
+
+# Methods of Graph that run on the snapshot.
+SNAPSHOT_METHODS = {"bfs", "dfs", "transitive_closure"}
+
+# Views of Graph, and the methods that return their copies.
+VIEW_METHODS = {
+    "vertices_view": "get_vertices",
+    "adjacents_view": "get_adjacents",
+    "successors_view": "get_successors",
+    "predecessors_view": "get_predecessors",
+}
+
+# Methods of Graph that return a view of a subgraph.
+SUBGRAPH_METHODS = {"subgraph", "edge_subgraph"}
+
+class ReadWriteLock(object):
+    # A lock held by many readers or by one writer. Waiting
+    # writers go before new readers, so they are not starved.
+    # A thread can take the lock again while holding it, and
+    # can read while it writes, but not write while it reads.
+
+    def __init__(self):
+        self._condition = Condition(Lock())
+        self._readers = 0
+        self._writer = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self._local = local()
+
+    def acquire_read(self):
+        local = self._local
+        if self._writer == get_ident():
+            local.inner = getattr(local, "inner", 0) + 1
+            return
+        reads = getattr(local, "reads", 0)
+        if not reads:
+            with self._condition:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+                self._readers += 1
+        local.reads = reads + 1
+
+    def release_read(self):
+        local = self._local
+        if getattr(local, "inner", 0):
+            local.inner -= 1
+            return
+        local.reads -= 1
+        if not local.reads:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    def acquire_write(self):
+        me = get_ident()
+        if self._writer == me:
+            self._writer_depth += 1
+            return
+        if getattr(self._local, "reads", 0):
+            raise RuntimeError("A thread can not write while it reads.")
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self):
+        self._writer_depth -= 1
+        if not self._writer_depth:
+            with self._condition:
+                self._writer = None
+                self._condition.notify_all()
+
+    def writing(self):
+        # If the current thread holds the lock for writing.
+        return self._writer == get_ident()
+
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+class ConcurrentGraph(Graph):
+
+    def __init__(self, vertices=None, directed=False, valued=False):
+        """Constructs a instance of the graph G, that can be
+        shared between threads
+
+        :param vertices: The vertices of the graph,
+            each vertex is a dict. An empty graph
+            is constructed, by default.
+        :param directed: If is a graph directed or not,
+            it is not, by default.
+        :param valued: If is a graph valued or not,
+            it is not, by default.
+
+        """
+        Graph.__init__(self, vertices, directed, valued)
+        self._lock = ReadWriteLock()
+        self._snapshot = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_snapshot"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = ReadWriteLock()
+
+    def transaction(self):
+        """Holds the lock of G for writing, so the changes
+        made inside a with statement take it once and are
+        seen by the readers all at once
+
+        :rtype: context manager
+
+        """
+        return self._lock.write()
+
+    def reading(self):
+        """Holds the lock of G for reading, so the queries
+        made inside a with statement see the same version
+        of G and take the lock once
+
+        :rtype: context manager
+
+        """
+        return self._lock.read()
+
+    def snapshot(self):
+        """Returns a read-only copy of G, with the version of
+        G after the last change. The copy is built once for
+        each version. Inside a transaction, the copy has the
+        changes made so far, and it is not kept, so the other
+        threads do not see them before the transaction ends.
+
+        :rtype: FrozenGraph
+
+        """
+        if self._lock.writing():
+            return Graph.freeze(self)
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock.read():
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = Graph.freeze(self)
+        return snapshot
+
+def _writer(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock.write():
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._snapshot = None
+    return wrapper
+
+def _reader(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock.read():
+            result = method(self, *args, **kwargs)
+            if isgenerator(result):
+                result = iter(list(result))
+            return result
+    return wrapper
+
+def _copied(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return method(self, *args, **kwargs).copy()
+    return wrapper
+
+def _from_snapshot(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return getattr(self.snapshot(), method.__name__)(*args, **kwargs)
+    return wrapper
+
+for _name, _method in list(vars(Graph).items()):
+    if _name.startswith("_") or _name == "profile" or not isfunction(_method):
+        continue
+    if _name in WRITE_METHODS:
+        setattr(ConcurrentGraph, _name, _writer(_method))
+    elif _name in VIEW_METHODS:
+        setattr(ConcurrentGraph, _name, _reader(vars(Graph)[VIEW_METHODS[_name]]))
+    elif _name in SUBGRAPH_METHODS:
+        setattr(ConcurrentGraph, _name, _reader(_copied(_method)))
+    elif _name in SNAPSHOT_METHODS:
+        setattr(ConcurrentGraph, _name, _from_snapshot(_method))
+    else:
+        setattr(ConcurrentGraph, _name, _reader(_method))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+#   A disjoint set (union-find) structure, that keeps a
+#   partition of a set of elements. Each subset is a tree,
+#   represented by its root, as follows:
+#           parent = {a:a, b:a, c:a, d:d}
+#   Where {a, b, c} and {d} are the subsets. The trees are
+#   kept flat by union by rank and path compression, so each
+#   operation costs almost O(1), amortized.
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+
+class DisjointSet(object):
+
+    def __init__(self, elements=()):
+        """Constructs a instance of the disjoint set, each
+        element in its own subset
+
+        :param elements: Iterable with the elements,
+            none by default.
+
+        """
+        self._parent = {}
+        self._rank = {}
+        self._count = 0
+        for element in elements:
+            self.add(element)
+
+    def __len__(self):
+        return len(self._parent)
+
+    def __contains__(self, element):
+        return element in self._parent
+
+    def add(self, element):
+        """Add an element in its own subset, if it was
+        not added yet
+
+        :param element: The element that will be added.
+        :rtype: void
+
+        """
+        if element not in self._parent:
+            self._parent[element] = element
+            self._rank[element] = 0
+            self._count += 1
+
+    def find(self, element):
+        """Returns the representative of the subset of
+        a given element
+
+        :param element: An element of the set.
+        :rtype: auto
+
+        """
+        parent = self._parent
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+        return root
+
+    def union(self, element1, element2):
+        """Joins the subsets of two elements
+
+        :param element1: An element of the set.
+        :param element2: Another element of the set.
+        :rtype: bool, True if the subsets were different
+
+        """
+        root1, root2 = self.find(element1), self.find(element2)
+        if root1 == root2:
+            return False
+        if self._rank[root1] < self._rank[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        if self._rank[root1] == self._rank[root2]:
+            self._rank[root1] += 1
+        self._count -= 1
+        return True
+
+    def connected(self, element1, element2):
+        """Checks if two elements are in the same subset
+
+        :param element1: An element of the set.
+        :param element2: Another element of the set.
+        :rtype: bool
+
+        """
+        return self.find(element1) == self.find(element2)
+
+    def count(self):
+        """Shows the number of subsets
+
+        :rtype: int
+
+        """
+        return self._count
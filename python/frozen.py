@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+#   A read-only version of the Graph class (see graph.py), for
+#   graphs that are not changed after they are loaded. Each
+#   vertex is mapped to an integer id (its position in the list
+#   of labels) and the edges are stored in compressed sparse row
+#   (CSR) form, as follows:
+#           offsets = [0, 2, 3, 4]
+#           targets = [1, 2, 0, 0]
+#           weights = [5, 3, 5, 3]
+#   The adjacents of the vertex with id i are the ids in
+#   targets[offsets[i]:offsets[i + 1]], sorted, and the value of
+#   each edge is at the same position in weights. For digraphs,
+#   the predecessors of each vertex are stored in the same way
+#   (in_offsets and in_targets).
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+from array import array
+from bisect import bisect_left
+from collections import deque
+from itertools import islice
+from random import choice
+from graph_exceptions import VertexNotFound, NotDigraph, NotValued
+
+class FrozenGraph(object):
+
+    def __init__(self, labels, offsets, targets, weights=None,
+            in_offsets=None, in_targets=None, directed=False,
+            valued=False, size=None):
+        """Constructs a instance of the frozen graph G
+
+        :param labels: Sequence with the vertices of the graph,
+            the id of each vertex is its position.
+        :param offsets: Sequence with order + 1 positions
+            of targets, where the adjacents of each vertex
+            begin (and the last one ends).
+        :param targets: Sequence with the ids of the adjacents
+            of each vertex, sorted.
+        :param weights: Sequence with the value of each edge
+            in targets, None for non-valued graphs.
+        :param in_offsets: As offsets, for the predecessors
+            of each vertex of a digraph.
+        :param in_targets: As targets, for the predecessors
+            of each vertex of a digraph.
+        :param directed: If is a graph directed or not,
+            it is not, by default.
+        :param valued: If is a graph valued or not,
+            it is not, by default.
+        :param size: The number of edges of the graph,
+            counted from the targets, by default.
+
+        """
+        self.labels = labels
+        self.directed = directed
+        self.valued = valued
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+        if directed:
+            self._in_offsets = in_offsets
+            self._in_targets = in_targets
+        else:
+            self._in_offsets = offsets
+            self._in_targets = targets
+        # The labels are only mapped to their ids when a vertex
+        # is looked up, so opening a graph from a file (see
+        # graph_binary.py) does not read every label.
+        self._ids = None
+        if size is None:
+            size = len(targets)
+            if not directed:
+                loops = sum(1 for i in range(len(labels)) if self._has_edge(i, i))
+                size = (size + loops) // 2
+        self._size = size
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Constructs a frozen copy of a given graph
+
+        :param graph: The Graph that will be copied.
+        :rtype: FrozenGraph
+
+        """
+        labels = list(graph.vertices)
+        ids = {label: i for i, label in enumerate(labels)}
+        offsets = array("q", [0])
+        targets = array("q")
+        values = []
+        for label in labels:
+            row = sorted((ids[adjacent], value)
+                for adjacent, value in graph.vertices[label].items())
+            for target, value in row:
+                targets.append(target)
+                values.append(value)
+            offsets.append(len(targets))
+        weights = pack_values(values) if graph.valued else None
+        in_offsets = in_targets = None
+        if graph.directed:
+            in_offsets = array("q", [0])
+            in_targets = array("q")
+            for label in labels:
+                in_targets.extend(sorted(ids[predecessor]
+                    for predecessor in graph._predecessors[label]))
+                in_offsets.append(len(in_targets))
+        return cls(labels, offsets, targets, weights, in_offsets,
+            in_targets, graph.directed, graph.valued, graph.size())
+
+    def thaw(self):
+        """Returns a new (mutable) Graph with the vertices
+        and edges of G
+
+        :rtype: Graph
+
+        """
+        from graph import Graph
+        labels = self.labels
+        vertices = {}
+        for i, label in enumerate(labels):
+            start, end = self._offsets[i], self._offsets[i + 1]
+            if self._weights is None:
+                vertices[label] = dict.fromkeys(
+                    labels[j] for j in self._targets[start:end])
+            else:
+                vertices[label] = {labels[self._targets[k]]: self._weights[k]
+                    for k in range(start, end)}
+        return Graph(vertices, self.directed, self.valued)
+
+    def _index(self):
+        if self._ids is None:
+            self._ids = {label: i for i, label in enumerate(self.labels)}
+        return self._ids
+
+    def _id(self, vertex):
+        try:
+            return self._index()[vertex]
+        except (KeyError, TypeError):
+            raise VertexNotFound("Vertex not found. \
+                Use get_vertices() to see the vertices of the graph.")
+
+    def _has_edge(self, i, j):
+        start, end = self._offsets[i], self._offsets[i + 1]
+        k = bisect_left(self._targets, j, start, end)
+        return k < end and self._targets[k] == j
+
+    def _labels_of(self, targets, start, end):
+        labels = self.labels
+        return {labels[j] for j in targets[start:end]}
+
+    #######################
+    #    Basic Actions    #
+    #######################
+
+    def order(self):
+        """Shows the order of the graph G. Order of a graph
+        is the number of vertices of this graph.
+
+        :rtype: int
+
+        """
+        return len(self.labels)
+
+    def size(self):
+        """Shows the size of the graph G. Size of a graph
+        is the number of edges of this graph.
+
+        :rtype: int
+
+        """
+        return self._size
+
+    def get_vertices(self):
+        """Get the set with the vertices of G
+
+        :rtype: set
+
+        """
+        return set(self.labels)
+
+    def get_random_vertex(self):
+        """Returns a random vertex
+
+        :rtype: auto
+
+        """
+        return choice(self.labels)
+
+    def get_adjacents(self, vertex):
+        """Return a set with the vertex's adjacents. For
+        directed graphs, the adjacents of a vertex are
+        the vertices that point to it.
+
+        :param vertex: The vertex that their adjacents
+            will be added in the set.
+        :rtype: set
+
+        """
+        i = self._id(vertex)
+        return self._labels_of(self._in_targets,
+            self._in_offsets[i], self._in_offsets[i + 1])
+
+    def get_degree(self, vertex):
+        """Get the degree of a given vertex. Degree
+        of a vertex is the number of this adjacents
+        vertices
+
+        :param vetex: The vertex that the degree
+            will be returned
+        :rtype: int
+
+        """
+        i = self._id(vertex)
+        return self._in_offsets[i + 1] - self._in_offsets[i]
+
+    ########################
+    #   Specific Actions   #
+    ########################
+
+    def get_successors(self, vertex):
+        """For directed graphs (valued or not).
+        Returns a set with the successors vertices
+        of a given vertex
+
+        :param vertex: Given vertex that successors will
+            be returned.
+        :rtype: set
+
+        """
+        if self.directed:
+            i = self._id(vertex)
+            return self._labels_of(self._targets,
+                self._offsets[i], self._offsets[i + 1])
+        else:
+            raise NotDigraph("Method for digraphs. \
+                Try use get_adjacents(vertex)")
+
+    def get_predecessors(self, vertex):
+        """For directed graphs (valued or not).
+        Returns a set with the predecessors vertices
+        of a given vertex
+
+        :param vertex: Given vertex that predecessors will
+            be returned.
+        :rtype: set
+
+        """
+        if self.directed:
+            return self.get_adjacents(vertex)
+        else:
+            raise NotDigraph("Method for digraphs. \
+                Try use get_adjacents(vertex).")
+
+    def get_outdegree(self, vertex):
+        """For directed graphs (valued or not).
+        Get the degree of emission of a given vertex
+
+        :param vertex: The vertex that the degree of
+            emission will ve returned
+        :rtype: int
+
+        """
+        if self.directed:
+            i = self._id(vertex)
+            return self._offsets[i + 1] - self._offsets[i]
+        else:
+            raise NotDigraph("Method for digraphs. \
+                Try use get_degree(vertex).")
+
+    def get_indegree(self, vertex):
+        """For directed graphs (valued or not).
+        Get the degree of reception of a given vertex
+
+        :param vertex: The vertex that the degree of
+            reception will ve returned
+
+        :rtype: int
+
+        """
+        if self.directed:
+            return self.get_degree(vertex)
+        else:
+            raise NotDigraph("Method for digraphs. \
+                Try use get_degree(vertex).")
+
+    def get_value(self, vertex1, vertex2):
+        """For valued graphs (directed or not).
+        Get the value of a edge between the vertex1
+        and vertex2.
+
+        :param vertex1: A vertex.
+        :param vertex2: Another vertex.
+        :rtype: int
+
+        """
+        if self.valued:
+            ids = self._index()
+            i, j = ids.get(vertex1), ids.get(vertex2)
+            if i is None or j is None or not self._has_edge(i, j):
+                print("Impossible to get the value")
+                return None
+            k = bisect_left(self._targets, j,
+                self._offsets[i], self._offsets[i + 1])
+            return self._weights[k]
+        else:
+            raise NotValued()
+
+    ########################
+    #  Traversal Actions   #
+    ########################
+
+    def bfs(self, start):
+        """Iterates, in breadth-first order, over the
+        vertices of G reachable from a given vertex
+
+        :param start: The vertex where the search begins.
+        :rtype: generator
+
+        """
+        labels = self.labels
+        for i in self._bfs(self._id(start), bytearray(len(labels))):
+            yield labels[i]
+
+    def dfs(self, start):
+        """Iterates, in depth-first order, over the
+        vertices of G reachable from a given vertex
+
+        :param start: The vertex where the search begins.
+        :rtype: generator
+
+        """
+        labels = self.labels
+        for i in self._dfs(self._id(start), bytearray(len(labels))):
+            yield labels[i]
+
+    def _bfs(self, start, visited):
+        offsets, targets = self._offsets, self._targets
+        visited[start] = 1
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            yield i
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                if not visited[j]:
+                    visited[j] = 1
+                    queue.append(j)
+
+    def _dfs(self, start, visited):
+        offsets, targets = self._offsets, self._targets
+        visited[start] = 1
+        yield start
+        stack = [iter(targets[offsets[start]:offsets[start + 1]])]
+        while stack:
+            for j in stack[-1]:
+                if not visited[j]:
+                    visited[j] = 1
+                    yield j
+                    stack.append(iter(targets[offsets[j]:offsets[j + 1]]))
+                    break
+            else:
+                stack.pop()
+
+    ########################
+    #  Derivative Actions  #
+    ########################
+
+    def is_regular(self):
+        """Checks if the graph is a regular graph, so,
+        if each vertex of G has the same degree
+
+        :rtype: bool
+
+        """
+        offsets = self._in_offsets
+        degrees = {offsets[i + 1] - offsets[i] for i in range(self.order())}
+        return len(degrees) <= 1
+
+    def is_complete(self):
+        """Checks if the graph is a complete graph, so,
+        if every vertex is connect with all other
+        vertices of the graph G
+
+        :rtype: bool
+
+        """
+        n = self.order() - 1
+        edges = (n + 1) * n
+        if not self.directed:
+            edges //= 2
+        if self._size != edges:
+            return False
+        offsets = self._in_offsets
+        return all(offsets[i + 1] - offsets[i] == n for i in range(n + 1))
+
+    def transitive_closure(self, vertex, visited=None):
+        """Returns a set content every vertices of G that
+        are transitively reachable starting in "vertex"
+
+        :param vertex: Starting vertex to see every
+            vertex reachable from it.
+        :param visited: Set with the visited vertices, the
+            vertices on it are not expanded. It is filled
+            and returned, a new set is used by default.
+        :rtype: set
+
+        """
+        if visited is None:
+            visited = set()
+        marks = bytearray(self.order())
+        ids = self._index()
+        for v in visited:
+            if v in ids:
+                marks[ids[v]] = 1
+        labels = self.labels
+        for i in self._dfs(self._id(vertex), marks):
+            visited.add(labels[i])
+        return visited
+
+    def reachable_from_many(self, sources, width=64):
+        """Iterates over pairs (source, set), with the set of
+        vertices reachable from each source (as returned by
+        transitive_closure). The sources are searched in
+        blocks, at the same time: each vertex holds an
+        integer where the bit i is set if it is reachable
+        from the i-th source of the block.
+
+        :param sources: Iterable with the sources.
+        :param width: Number of sources of each block,
+            64 by default.
+        :rtype: generator
+
+        """
+        labels = self.labels
+        offsets, targets = self._offsets, self._targets
+        sources = iter(sources)
+        block = list(islice(sources, width))
+        while block:
+            masks = {}
+            for bit, source in enumerate(block):
+                i = self._id(source)
+                masks[i] = masks.get(i, 0) | 1 << bit
+            queue = deque(masks)
+            queued = set(masks)
+            while queue:
+                i = queue.popleft()
+                queued.discard(i)
+                bits = masks[i]
+                for j in targets[offsets[i]:offsets[i + 1]]:
+                    mask = masks.get(j, 0)
+                    if mask | bits != mask:
+                        masks[j] = mask | bits
+                        if j not in queued:
+                            queued.add(j)
+                            queue.append(j)
+            for bit, source in enumerate(block):
+                yield source, {labels[i] for i, mask in masks.items()
+                    if mask >> bit & 1}
+            block = list(islice(sources, width))
+
+    def is_connected(self):
+        """Checks if there is at least one path between
+        each pair of vertices of G. For digraphs, the
+        direction of the edges is ignored (G is weakly
+        connected). A graph without vertices is connected.
+
+        :rtype: bool
+
+        """
+        order = self.order()
+        if not order:
+            return True
+        rows = [(self._offsets, self._targets)]
+        if self.directed:
+            rows.append((self._in_offsets, self._in_targets))
+        visited = bytearray(order)
+        visited[0] = 1
+        queue = deque([0])
+        reached = 0
+        while queue:
+            i = queue.popleft()
+            reached += 1
+            for offsets, targets in rows:
+                for j in targets[offsets[i]:offsets[i + 1]]:
+                    if not visited[j]:
+                        visited[j] = 1
+                        queue.append(j)
+        return reached == order
+
+def pack_values(values):
+    """Packs the values of the edges of a graph in a
+    typed array, when all of them are integers or all
+    of them are real numbers, or in a list, otherwise
+    (so the values are not changed).
+
+    :param values: List with the values.
+    :rtype: array
+
+    """
+    kinds = {type(value) for value in values}
+    if kinds <= {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            return list(values)
+    if kinds == {float}:
+        return array("d", values)
+    return list(values)
@@ -18,8 +18,34 @@
 # :author: Caique Marques
 # :license: Gnu General Public License version 3
 #
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from heapq import heapify, heappush, heappop
+from itertools import chain, count, islice
 from random import choice
-from graph_exceptions import VertexNotFound, NotDigraph, NotValued
+from operator import itemgetter
+from graph_exceptions import VertexNotFound, NotDigraph, NotValued, \
+    NotUndirected, NegativeCycle, CycleFound
+from frozen import FrozenGraph
+from sampling import Sampler
+from journal import Journal, ADD_VERTEX, REMOVE_VERTEX, CONNECT, \
+    DISCONNECT, FULL, DIRECTED, VALUED, snapshot_changes, pack_delta, \
+    unpack_delta
+from query_cache import QueryCache, cached
+from disjoint_set import DisjointSet
+from profiling import GraphProfiler
+from views import AdjacencyView
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Colours of the vertices in the cycle search of digraphs,
+# a vertex without colour was not visited yet (white).
+GREY, BLACK = 1, 2
+
+INFINITY = float("inf")
 
 class Graph(object):
     #######################
@@ -28,20 +54,56 @@ class Graph(object):
     # Basic actions for a undirected graph, directed graph
     # valued directed graph or valued undirected graph.
 
-    def __init__(self, vertices={}, directed=False, valued=False):
+    def __init__(self, vertices=None, directed=False, valued=False):
         """Constructs a instance of the graph G
 
         :param vertices: The vertices of the graph,
-            each vertex is a dict.
+            each vertex is a dict. An empty graph
+            is constructed, by default.
         :param directed: If is a graph directed or not,
             it is not, by default.
         :param valued: If is a graph valued or not,
             it is not, by default.
 
         """
+        if vertices is None:
+            vertices = {}
         self.vertices = vertices
         self.directed = directed
         self.valued = valued
+        # For digraphs, each vertex is also mapped to the set of
+        # its predecessors, so the in-neighbours of a vertex can
+        # be found without scanning every vertex of G. For
+        # undirected graphs, self.vertices is already symmetric.
+        self._predecessors = {}
+        if directed:
+            for v in vertices:
+                self._predecessors.setdefault(v, set())
+                for adjacent in vertices[v]:
+                    self._predecessors.setdefault(adjacent, set()).add(v)
+        # Number of edges of G, each edge of an undirected graph
+        # is in the dicts of its two vertices (a loop only once).
+        self._size = sum(len(adjacents) for adjacents in vertices.values())
+        if not directed:
+            loops = sum(1 for v in vertices if v in vertices[v])
+            self._size = (self._size + loops) // 2
+        # The vertices of G are also kept in a list, with the
+        # position of each one, so a random vertex is drawn in
+        # O(1). A removed vertex is replaced by the last one.
+        self._vertex_list = list(vertices)
+        self._positions = {v: i for i, v in enumerate(self._vertex_list)}
+        # Components of G, kept by connect and add_vertex when
+        # the connectivity is tracked (see track_connectivity),
+        # None while they were not built or are outdated.
+        self._tracking = False
+        self._components = None
+        # Journal of the changes made in G (see enable_journal),
+        # None while they are not recorded.
+        self._journal = None
+        # Version of G, increased by each change, and the cache
+        # of the queries of the current version (see enable_cache).
+        self._version = 0
+        self._cache = None
 
     def add_vertex(self, vertex):
         """Add a vetex in the graph G
@@ -52,7 +114,7 @@ class Graph(object):
 
         """
         if vertex not in self.vertices:
-                self.vertices[vertex] = {}
+            self._insert_vertex(vertex)
 
     def remove_vertex(self, vertex):
         """Remove a vertex in the graph G
@@ -63,10 +125,35 @@ class Graph(object):
 
         """
         if vertex in self.vertices:
-            for v in self.vertices:
-                if vertex in self.vertices[v]:
-                    del self.vertices[v][vertex]
+            # Only the neighbours of the vertex are touched: its
+            # predecessors (for digraphs) or its adjacents (for
+            # undirected graphs) are the only vertices that can
+            # hold an edge to it.
+            if self.directed:
+                self._size -= len(self.vertices[vertex]) + \
+                    len(self._predecessors[vertex])
+                if vertex in self.vertices[vertex]:
+                    self._size += 1
+                for predecessor in self._predecessors.pop(vertex):
+                    del self.vertices[predecessor][vertex]
+                for successor in self.vertices[vertex]:
+                    if successor != vertex:
+                        self._predecessors[successor].discard(vertex)
+            else:
+                self._size -= len(self.vertices[vertex])
+                for adjacent in self.vertices[vertex]:
+                    if adjacent != vertex:
+                        self.vertices[adjacent].pop(vertex, None)
             del self.vertices[vertex]
+            last = self._vertex_list.pop()
+            position = self._positions.pop(vertex)
+            if last != vertex:
+                self._vertex_list[position] = last
+                self._positions[last] = position
+            self._components = None
+            self._version += 1
+            if self._journal is not None:
+                self._journal.record(REMOVE_VERTEX, vertex)
         else:
             raise VertexNotFound("Vertex not found. \
                 Use get_vertices() to see the vertices of the graph.")
@@ -89,15 +176,40 @@ class Graph(object):
 
         """
         if vertex1 in self.vertices and vertex2 in self.vertices:
-            if not self.directed:
-                self.vertices[vertex1][vertex2] = value
-                self.vertices[vertex2][vertex1] = value
-            else:
-                self.vertices[vertex1][vertex2] = value
+            self._insert_edge(vertex1, vertex2, value)
         else:
             raise VertexNotFound("Vertex (or vertices) not found. \
                 Use get_vertices() to see the vertices of the graph.")
 
+    def _insert_vertex(self, vertex):
+        # Adds a vertex that is not in G yet.
+        self.vertices[vertex] = {}
+        self._positions[vertex] = len(self._vertex_list)
+        self._vertex_list.append(vertex)
+        if self.directed:
+            self._predecessors[vertex] = set()
+        if self._components is not None:
+            self._components.add(vertex)
+        self._version += 1
+        if self._journal is not None:
+            self._journal.record(ADD_VERTEX, vertex)
+
+    def _insert_edge(self, vertex1, vertex2, value):
+        # Adds (or replaces) an edge between two vertices of G.
+        adjacents = self.vertices[vertex1]
+        if vertex2 not in adjacents:
+            self._size += 1
+        adjacents[vertex2] = value
+        if self.directed:
+            self._predecessors[vertex2].add(vertex1)
+        else:
+            self.vertices[vertex2][vertex1] = value
+        if self._components is not None:
+            self._components.union(vertex1, vertex2)
+        self._version += 1
+        if self._journal is not None:
+            self._journal.record(CONNECT, vertex1, vertex2, value)
+
     def disconnect(self, vertex1, vertex2):
         """Disconnects (remove the edges) between two given vertices
         If is a directed graph, the remove is, for example,
@@ -117,12 +229,23 @@ class Graph(object):
         if vertex1 in self.vertices and vertex2 in self.vertices:
             if not self.directed:
                 del self.vertices[vertex1][vertex2]
-                del self.vertices[vertex2][vertex1]
+                if vertex1 != vertex2:
+                    del self.vertices[vertex2][vertex1]
+                self._size -= 1
+                self._components = None
             else:
                 try:
                     del self.vertices[vertex1][vertex2]
                 except KeyError as e:
                     print("Impossible to disconnect")
+                    return
+                else:
+                    self._predecessors[vertex2].discard(vertex1)
+                    self._size -= 1
+                    self._components = None
+            self._version += 1
+            if self._journal is not None:
+                self._journal.record(DISCONNECT, vertex1, vertex2)
         else:
             raise VertexNotFound("Vertex (or vertices) not found. \
                 Use get_vertices() to see the vertices of the graph.")
@@ -136,6 +259,15 @@ class Graph(object):
         """
         return len(self.vertices)
 
+    def size(self):
+        """Shows the size of the graph G. Size of a graph
+        is the number of edges of this graph.
+
+        :rtype: int
+
+        """
+        return self._size
+
     def get_vertices(self):
         """Get the set with the vertices of G
 
@@ -151,21 +283,21 @@ class Graph(object):
         :rtype: auto
 
         """
-        return choice(list(self.vertices.keys()))
+        return choice(self._vertex_list)
 
     def get_adjacents(self, vertex):
-        """Return a set with the vertex's adjacents
+        """Return a set with the vertex's adjacents. For
+        directed graphs, the adjacents of a vertex are
+        the vertices that point to it.
 
         :param vertex: The vertex that their adjacents
             will be added in the set.
         :rtype: set
 
         """
-        set_adjacents = set()
-        for v in self.vertices:
-            if vertex in self.vertices[v]:
-                set_adjacents.add(v)
-        return set_adjacents
+        if self.directed:
+            return set(self._predecessors.get(vertex, ()))
+        return set(self.vertices.get(vertex, ()))
 
     def get_degree(self, vertex):
         """Get the degree of a given vertex. Degree
@@ -177,7 +309,389 @@ class Graph(object):
         :rtype: int
 
         """
-        return len(self.get_adjacents(vertex))
+        if self.directed:
+            return len(self._predecessors.get(vertex, ()))
+        return len(self.vertices.get(vertex, ()))
+
+    def iter_edges(self):
+        """Iterates over the edges of G, as triples
+        (vertex1, vertex2, value). Each edge of an
+        undirected graph is given once.
+
+        :rtype: generator
+
+        """
+        done = set()
+        for vertex, adjacents in self.vertices.items():
+            for adjacent, value in adjacents.items():
+                if self.directed or adjacent not in done:
+                    yield vertex, adjacent, value
+            if not self.directed:
+                done.add(vertex)
+
+    def copy(self):
+        """Returns a new Graph with the vertices and edges
+        of G, that can be changed without changing G
+
+        :rtype: Graph
+
+        """
+        vertices = {v: dict(adjacents) for v, adjacents in self.vertices.items()}
+        return Graph(vertices, self.directed, self.valued)
+
+    def freeze(self):
+        """Returns a read-only copy of G, that stores the
+        edges in compact arrays indexed by integers. It
+        is meant for graphs that are not changed anymore,
+        see frozen.py.
+
+        :rtype: FrozenGraph
+
+        """
+        return FrozenGraph.from_graph(self)
+
+    def sampler(self, seed=None, weighted=None):
+        """Returns a sampler of random vertices, neighbours
+        and walks of G, built on a frozen copy of G, see
+        sampling.py.
+
+        :param seed: Seed of the random number generators.
+        :param weighted: If the neighbours are drawn with a
+            probability proportional to the values of the
+            edges, by default, if G is valued.
+        :rtype: Sampler
+
+        """
+        return Sampler(self, seed, weighted)
+
+    def profile(self, loop_threshold=100):
+        """Returns a profiler of G, that counts the calls,
+        the time and the lookups of its methods while it
+        is active, see profiling.py. For example:
+            with graph.profile() as profiler:
+                graph.is_connected()
+            profiler.stats()
+
+        :param loop_threshold: Number of calls of an O(V)
+            method, from the same line, from which the line
+            is reported, 100 by default.
+        :rtype: GraphProfiler
+
+        """
+        return GraphProfiler(self, loop_threshold)
+
+    ########################
+    #        Views         #
+    ########################
+    # Read-only views backed by the dicts of G, they are not
+    # copied (as the sets returned by the get_* actions) and
+    # they follow the changes made in G. Counting them and
+    # checking if a vertex is in them costs O(1).
+
+    def vertices_view(self):
+        """Returns a view of the vertices of G
+
+        :rtype: AdjacencyView
+
+        """
+        return AdjacencyView(self.vertices)
+
+    def adjacents_view(self, vertex):
+        """Returns a view of the adjacents of a given vertex,
+        as get_adjacents. For directed graphs, the adjacents
+        of a vertex are the vertices that point to it.
+
+        :param vertex: The vertex whose adjacents are viewed.
+        :rtype: AdjacencyView
+
+        """
+        self._check_vertex(vertex)
+        if self.directed:
+            return AdjacencyView(self._predecessors[vertex])
+        return AdjacencyView(self.vertices[vertex])
+
+    def successors_view(self, vertex):
+        """For directed graphs (valued or not).
+        Returns a view of the successors of a given vertex
+
+        :param vertex: The vertex whose successors are viewed.
+        :rtype: AdjacencyView
+
+        """
+        if not self.directed:
+            raise NotDigraph("Method for digraphs. \
+                Try use adjacents_view(vertex)")
+        self._check_vertex(vertex)
+        return AdjacencyView(self.vertices[vertex])
+
+    def predecessors_view(self, vertex):
+        """For directed graphs (valued or not).
+        Returns a view of the predecessors of a given vertex
+
+        :param vertex: The vertex whose predecessors are viewed.
+        :rtype: AdjacencyView
+
+        """
+        if not self.directed:
+            raise NotDigraph("Method for digraphs. \
+                Try use adjacents_view(vertex)")
+        return self.adjacents_view(vertex)
+
+    def subgraph(self, vertices):
+        """Returns a view of the subgraph of G induced by
+        the given vertices, with the edges of G between
+        them. It costs O(len(vertices)), see subgraph.py.
+
+        :param vertices: Iterable with vertices of G.
+        :rtype: Subgraph
+
+        """
+        from subgraph import induced_subgraph
+        return induced_subgraph(self, vertices)
+
+    def edge_subgraph(self, edges):
+        """Returns a view of the subgraph of G with only
+        the given edges, and the vertices that they connect.
+        It costs O(len(edges)), see subgraph.py.
+
+        :param edges: Iterable with edges of G, as pairs
+            (vertex1, vertex2) or triples (vertex1, vertex2,
+            value).
+        :rtype: Subgraph
+
+        """
+        from subgraph import edge_subgraph
+        return edge_subgraph(self, edges)
+
+    def _check_vertex(self, vertex):
+        if vertex not in self.vertices:
+            raise VertexNotFound("Vertex not found. \
+                Use get_vertices() to see the vertices of the graph.")
+
+    ########################
+    #    Bulk Actions      #
+    ########################
+    # Actions that add many vertices or edges at once, the
+    # vertices of the edges are added if they are not in G.
+
+    @classmethod
+    def from_edges(cls, edges, directed=False, valued=False):
+        """Constructs a graph G with the given edges, see
+        add_edges_from
+
+        :param edges: Iterable with the edges of the graph.
+        :param directed: If is a graph directed or not,
+            it is not, by default.
+        :param valued: If is a graph valued or not,
+            it is not, by default.
+        :rtype: Graph
+
+        """
+        graph = cls(directed=directed, valued=valued)
+        graph.add_edges_from(edges)
+        return graph
+
+    def add_vertices_from(self, vertices):
+        """Add the vertices of an iterable in the graph G,
+        the ones already added are ignored
+
+        :param vertices: Iterable with the vertices.
+        :rtype: void
+
+        """
+        for vertex in vertices:
+            if vertex not in self.vertices:
+                self._insert_vertex(vertex)
+
+    def add_edges_from(self, edges):
+        """Connects the vertices of each edge of an iterable,
+        as connect does, adding the vertices that are not
+        in the graph G. The edges are read lazily, so the
+        iterable can be a generator over a large file.
+
+        :param edges: Iterable with pairs (vertex1, vertex2)
+            or triples (vertex1, vertex2, value), or a NumPy
+            array with two or three columns.
+        :rtype: void
+
+        """
+        if numpy is not None and isinstance(edges, numpy.ndarray):
+            edges = self._array_edges(edges)
+        vertices = self.vertices
+        insert_vertex = self._insert_vertex
+        insert_edge = self._insert_edge
+        for edge in edges:
+            if len(edge) == 2:
+                vertex1, vertex2 = edge
+                value = None
+            elif len(edge) == 3:
+                vertex1, vertex2, value = edge
+            else:
+                raise ValueError("Each edge must be a pair (vertex1, vertex2) \
+                    or a triple (vertex1, vertex2, value).")
+            if vertex1 not in vertices:
+                insert_vertex(vertex1)
+            if vertex2 not in vertices:
+                insert_vertex(vertex2)
+            insert_edge(vertex1, vertex2, value)
+
+    def _array_edges(self, edges, chunk=65536):
+        # The shape of the array is checked once, then its rows
+        # are converted to Python values a chunk at a time.
+        if edges.ndim != 2 or edges.shape[1] not in (2, 3):
+            raise ValueError("The array of edges must have \
+                two or three columns.")
+        for start in range(0, len(edges), chunk):
+            for edge in edges[start:start + chunk].tolist():
+                yield edge
+
+    ########################
+    #       Journal        #
+    ########################
+    # The changes made in G can be recorded, so a replica of
+    # G is updated with the changes made since its last
+    # update, see journal.py.
+
+    def enable_journal(self, max_entries=None):
+        """Starts recording the changes made in G, each one
+        with the next sequence number (from 1). If G is not
+        empty, its vertices and edges are the change 1, that
+        is only in the full deltas, so a replica of any
+        sequence before it is built again.
+
+        :param max_entries: Greatest number of changes kept,
+            the oldest ones are dropped, all are kept by
+            default.
+        :rtype: void
+
+        """
+        self._journal = Journal(max_entries)
+        if self.vertices:
+            self._journal.sequence = 1
+
+    def journal_sequence(self):
+        """Returns the sequence number of the last change
+        recorded in G, 0 if none was
+
+        :rtype: int
+
+        """
+        if self._journal is None:
+            raise ValueError("The changes of the graph are not recorded. \
+                Use enable_journal() before.")
+        return self._journal.sequence
+
+    def delta(self, since=None):
+        """Returns the changes made in G after a given
+        sequence number, written in binary. If they are no
+        longer in the journal (or since is None), all of G
+        is written, and the replica is built again from it.
+
+        :param since: The sequence number of the last change
+            applied in the replica, None by default.
+        :rtype: bytes
+
+        """
+        last = self.journal_sequence()
+        changes = None
+        if since is not None:
+            changes = self._journal.since(since)
+        if changes is None:
+            return pack_delta(snapshot_changes(self), 0, last, True,
+                self.directed, self.valued)
+        return pack_delta(changes, since, last, False,
+            self.directed, self.valued)
+
+    def apply_delta(self, data, sequence=None):
+        """Applies in G the changes written by delta (of
+        other graph), and returns the sequence number of
+        the last one. The changes of a full delta replace
+        the vertices and edges of G. The delta must be of a
+        graph directed and valued as G.
+
+        :param data: The bytes of the delta.
+        :param sequence: The sequence number of the last
+            delta applied in G, checked against the one
+            that the changes follow, if it is given.
+        :rtype: int
+
+        """
+        flags, since, last, changes = unpack_delta(data)
+        if bool(flags & DIRECTED) != self.directed or \
+                bool(flags & VALUED) != self.valued:
+            raise ValueError("The delta is of a graph %sdirected and %svalued."
+                % ("" if flags & DIRECTED else "not ",
+                "" if flags & VALUED else "not "))
+        if flags & FULL:
+            for vertex in list(self.vertices):
+                self.remove_vertex(vertex)
+        elif sequence is not None and since != sequence:
+            raise ValueError("The delta follows the change %d, not %d."
+                % (since, sequence))
+        for operation, vertex1, vertex2, value in changes:
+            if operation == ADD_VERTEX:
+                self.add_vertex(vertex1)
+            elif operation == REMOVE_VERTEX:
+                self.remove_vertex(vertex1)
+            elif operation == CONNECT:
+                self.connect(vertex1, vertex2, value)
+            else:
+                self.disconnect(vertex1, vertex2)
+        return last
+
+    def compact_journal(self):
+        """Drops the changes recorded in G, so the next
+        delta (of any sequence number before the current
+        one) is all of G
+
+        :rtype: void
+
+        """
+        if self._journal is not None:
+            self._journal.compact()
+
+    ########################
+    #        Cache         #
+    ########################
+    # The results of is_connected, is_tree, is_regular,
+    # is_complete and transitive_closure can be kept while G
+    # is not changed, see query_cache.py.
+
+    def enable_cache(self, max_entries=128, max_bytes=None):
+        """Starts keeping the results of the queries of G,
+        so they are computed once for each version of G
+
+        :param max_entries: Greatest number of results kept,
+            128 by default.
+        :param max_bytes: Greatest size of the results kept,
+            they are not bounded by their size, by default.
+        :rtype: void
+
+        """
+        self._cache = QueryCache(max_entries, max_bytes)
+
+    def disable_cache(self):
+        """Stops keeping the results of the queries of G,
+        and drops the ones kept
+
+        :rtype: void
+
+        """
+        self._cache = None
+
+    def cache_info(self):
+        """Returns the numbers of hits and misses of the
+        cache of G, and the number and size of the results
+        that it keeps, or None if G has no cache
+
+        :rtype: dict
+
+        """
+        cache = self._cache
+        if cache is None:
+            return None
+        return {"hits": cache.hits, "misses": cache.misses,
+            "entries": len(cache), "bytes": cache.bytes}
 
     ########################
     #   Specific Actions   #
@@ -243,7 +757,7 @@ class Graph(object):
 
         """
         if self.directed:
-            return len(self.get_adjacents(vertex))
+            return len(self._predecessors.get(vertex, ()))
         else:
             raise NotDigraph("Method for digraphs. \
                 Try use get_degree(vertex).")
@@ -273,12 +787,74 @@ class Graph(object):
         else:
             raise NotValued()
 
+    ########################
+    #  Traversal Actions   #
+    ########################
+    # Iterative traversals, they follow the edges of G
+    # (so, the successors of each vertex in a directed
+    # graph) and visit each vertex and edge once.
+
+    def bfs(self, start):
+        """Iterates, in breadth-first order, over the
+        vertices of G reachable from a given vertex
+
+        :param start: The vertex where the search begins.
+        :rtype: generator
+
+        """
+        return self._bfs(start, set())
+
+    def dfs(self, start):
+        """Iterates, in depth-first order, over the
+        vertices of G reachable from a given vertex
+
+        :param start: The vertex where the search begins.
+        :rtype: generator
+
+        """
+        return self._dfs(start, set())
+
+    def _bfs(self, start, visited):
+        if start not in self.vertices:
+            raise VertexNotFound("Vertex not found. \
+                Use get_vertices() to see the vertices of the graph.")
+        visited.add(start)
+        queue = deque([start])
+        while queue:
+            vertex = queue.popleft()
+            yield vertex
+            for adjacent in self.vertices[vertex]:
+                if adjacent not in visited:
+                    visited.add(adjacent)
+                    queue.append(adjacent)
+
+    def _dfs(self, start, visited):
+        if start not in self.vertices:
+            raise VertexNotFound("Vertex not found. \
+                Use get_vertices() to see the vertices of the graph.")
+        # The stack keeps an iterator over the adjacents of each
+        # vertex in the current path, so a vertex is resumed
+        # where it stopped instead of being expanded again.
+        visited.add(start)
+        yield start
+        stack = [iter(self.vertices[start])]
+        while stack:
+            for adjacent in stack[-1]:
+                if adjacent not in visited:
+                    visited.add(adjacent)
+                    yield adjacent
+                    stack.append(iter(self.vertices[adjacent]))
+                    break
+            else:
+                stack.pop()
+
     ########################
     #  Derivative Actions  #
     ########################
     # Derivative actions for a undirected graph
     # (except has_cycle)
 
+    @cached
     def is_regular(self):
         """Checks if the graph is a regular graph, so,
         if each vertex of G has the same degree
@@ -286,12 +862,15 @@ class Graph(object):
         :rtype: bool
 
         """
-        base_degree = self.get_degree(self.get_random_vertex())
+        if not self.vertices:
+            return True
+        base_degree = self.get_degree(next(iter(self.vertices)))
         for v in self.vertices:
             if self.get_degree(v) != base_degree:
                 return False
         return True
 
+    @cached
     def is_complete(self):
         """Checks if the graph is a complete graph, so,
         if every vertex is connect with all other 
@@ -301,57 +880,192 @@ class Graph(object):
 
         """
         n = self.order() - 1
+        # A complete graph has an edge between each pair of
+        # vertices (in both directions, for digraphs).
+        edges = (n + 1) * n
+        if not self.directed:
+            edges //= 2
+        if self._size != edges:
+            return False
         for v in self.vertices:
             if self.get_degree(v) != n:
                 return False
         return True
 
-    def transitive_closure(self, vertex, visited):
+    @cached
+    def transitive_closure(self, vertex, visited=None):
         """Returns a set content every vertices of G that
         are transitively reachable starting in "vertex"
 
         :param vertex: Starting vertex to see every 
             vertex reachable from it.
-        :param visited: Set with the visited vertices.
-        :rtype: bool
+        :param visited: Set with the visited vertices, the
+            vertices on it are not expanded. It is filled
+            and returned, a new set is used by default.
+        :rtype: set (frozenset, without visited, while G
+            has a cache, see enable_cache)
 
         """
-        visited.add(vertex)
-        for adjacent in self.get_adjacents(vertex):
-            if adjacent not in visited:
-                self.transitive_closure(adjacent, visited)
+        if visited is None:
+            visited = set()
+        for _ in self._dfs(vertex, visited):
+            pass
         return visited
 
+    def reachable_from_many(self, sources, workers=None, bitset=False):
+        """Iterates over pairs (source, set), with the set of
+        vertices reachable from each source (as returned by
+        transitive_closure). With workers, the pairs are
+        given as they are found, in any order.
+
+        :param sources: Iterable with the sources.
+        :param workers: Number of processes that share the
+            searches, they run in the current process, by
+            default. A frozen copy of G (see freeze) is sent
+            once to each process.
+        :param bitset: If the sources are searched 64 at a
+            time (see FrozenGraph.reachable_from_many), they
+            are searched one by one, by default.
+        :rtype: generator
+
+        """
+        if workers is None and not bitset:
+            for source in sources:
+                yield source, self.transitive_closure(source)
+            return
+        frozen = self.freeze()
+        if workers is None:
+            yield from frozen.reachable_from_many(sources)
+            return
+        with ProcessPoolExecutor(workers, initializer=_init_pool,
+                initargs=(frozen,)) as pool:
+            sources = iter(sources)
+            tasks = []
+            block = list(islice(sources, 64))
+            while block:
+                tasks.append(pool.submit(_pool_reachable, block, bitset))
+                block = list(islice(sources, 64))
+            for task in as_completed(tasks):
+                yield from task.result()
+
+    @cached
     def is_connected(self):
         """Checks if there is at least one path between
-        each pair of vertices of G
+        each pair of vertices of G. For digraphs, the
+        direction of the edges is ignored (G is weakly
+        connected). If the connectivity is tracked, it
+        costs O(1). A graph without vertices is connected.
 
         :rtype: bool
 
         """
-        return (set(self.vertices.keys())) == self.transitive_closure(self.get_random_vertex(), set())
-
-    def has_cycle(self, vertex, actual_v, previous_v, visited=set()):
+        if self._tracking:
+            return self._connectivity().count() <= 1
+        if self.directed:
+            return self.count_components() <= 1
+        # The search does not go through transitive_closure, so
+        # no closure is kept in the cache (see enable_cache).
+        start = next(iter(self.vertices), None)
+        if start is None:
+            return True
+        return sum(1 for _ in self._dfs(start, set())) == self.order()
+
+    def has_cycle(self, vertex=None, *args):
         """Checks if the graph G has a cycle
 
-        :param vetex: Initial vertex.
-        :param actual_v: Actual vertice to compare with
-            their adjacents vertices.
-        :param previous_v: Previous vertex of actual_v.
-        :param visited: Set with all vertices visited.
+        :param vetex: Initial vertex. If given, only the
+            vertices reachable from it are searched, every
+            vertex of G is searched, by default.
+        :param args: Ignored, kept for the calls made
+            with the arguments of the old recursive search
+            (actual_v, previous_v and visited).
         :rtype: bool
 
         """
-        if actual_v in visited:
-            return actual_v is vertex
-        visited.add(actual_v)
-        for adjacent in self.get_adjacents(actual_v):
-            if adjacent != previous_v:
-                if self.has_cycle(vertex, adjacent, actual_v, visited):
-                    return True
-        visited.remove(actual_v)
-        return False
+        return self.find_cycle(vertex) is not None
 
+    def find_cycle(self, vertex=None):
+        """Returns a list with the vertices of a cycle of G,
+        in the order that they are connected (the last vertex
+        is connected with the first one), or None if G has no
+        cycle. Undirected graphs are searched tracking the
+        parent of each vertex and digraphs colouring the
+        vertices, both in O(V + E).
+
+        :param vertex: Initial vertex. If given, only the
+            vertices reachable from it are searched, every
+            vertex of G is searched, by default.
+        :rtype: list
+
+        """
+        if vertex is None:
+            roots = self.vertices
+        elif vertex in self.vertices:
+            roots = (vertex,)
+        else:
+            raise VertexNotFound("Vertex not found. \
+                Use get_vertices() to see the vertices of the graph.")
+        if self.directed:
+            return self._find_directed_cycle(roots)
+        return self._find_undirected_cycle(roots)
+
+    def _find_undirected_cycle(self, roots):
+        # Every edge that is not the one used to reach a vertex
+        # and that leads to a visited vertex closes a cycle.
+        parent = {}
+        for root in roots:
+            if root in parent:
+                continue
+            parent[root] = None
+            stack = [(root, iter(self.vertices[root]))]
+            while stack:
+                vertex, adjacents = stack[-1]
+                for adjacent in adjacents:
+                    if adjacent not in parent:
+                        parent[adjacent] = vertex
+                        stack.append((adjacent, iter(self.vertices[adjacent])))
+                        break
+                    if adjacent == vertex or adjacent != parent[vertex]:
+                        return self._cycle_path(parent, vertex, adjacent)
+                else:
+                    stack.pop()
+        return None
+
+    def _find_directed_cycle(self, roots):
+        # An edge that leads to a grey vertex, so a vertex
+        # in the current path, closes a cycle.
+        colour = {}
+        parent = {}
+        for root in roots:
+            if root in colour:
+                continue
+            colour[root] = GREY
+            parent[root] = None
+            stack = [(root, iter(self.vertices[root]))]
+            while stack:
+                vertex, successors = stack[-1]
+                for successor in successors:
+                    state = colour.get(successor)
+                    if state is None:
+                        colour[successor] = GREY
+                        parent[successor] = vertex
+                        stack.append((successor, iter(self.vertices[successor])))
+                        break
+                    if state == GREY:
+                        return self._cycle_path(parent, vertex, successor)
+                else:
+                    colour[vertex] = BLACK
+                    stack.pop()
+        return None
+
+    def _cycle_path(self, parent, vertex, ancestor):
+        path = [vertex]
+        while path[-1] != ancestor:
+            path.append(parent[path[-1]])
+        path.reverse()
+        return path
+
+    @cached
     def is_tree(self):
         """Checks if the graph G is a tree, in other words,
         if G not has cycle and if G is a connected graph
@@ -359,5 +1073,653 @@ class Graph(object):
         :rtype: bool
 
         """
-        vertex = self.get_random_vertex()
-        return self.is_connected() and not(self.has_cycle(vertex, vertex, None))
+        if self._size != self.order() - 1:
+            return False
+        return self.is_connected() and not self.has_cycle()
+
+    ########################
+    #      Components      #
+    ########################
+    # Each vertex is labelled with the number of its
+    # component, in a single traversal of G.
+
+    def connected_components(self):
+        """Returns a dict with the number of the connected
+        component of each vertex of G, the components are
+        numbered from 0. For digraphs, the direction of
+        the edges is ignored (weak components).
+
+        :rtype: dict
+
+        """
+        labels = {}
+        component = 0
+        for root in self.vertices:
+            if root in labels:
+                continue
+            labels[root] = component
+            queue = deque([root])
+            while queue:
+                vertex = queue.popleft()
+                adjacents = self.vertices[vertex]
+                if self.directed:
+                    adjacents = chain(adjacents, self._predecessors[vertex])
+                for adjacent in adjacents:
+                    if adjacent not in labels:
+                        labels[adjacent] = component
+                        queue.append(adjacent)
+            component += 1
+        return labels
+
+    def track_connectivity(self, enabled=True):
+        """Keeps (or stops keeping) the components of G in a
+        disjoint set, updated by add_vertex and connect, so
+        is_connected (for undirected graphs), same_component
+        and count_components cost almost O(1). After a call
+        to disconnect or remove_vertex, the components are
+        built again when they are needed.
+
+        :param enabled: If the components will be kept,
+            they are, by default.
+        :rtype: void
+
+        """
+        self._tracking = enabled
+        if not enabled:
+            self._components = None
+
+    def same_component(self, vertex1, vertex2):
+        """Checks if two vertices are in the same connected
+        component of G (weak component, for digraphs)
+
+        :param vertex1: A vertex.
+        :param vertex2: Another vertex.
+        :rtype: bool
+
+        """
+        if vertex1 not in self.vertices or vertex2 not in self.vertices:
+            raise VertexNotFound("Vertex (or vertices) not found. \
+                Use get_vertices() to see the vertices of the graph.")
+        if self._tracking:
+            return self._connectivity().connected(vertex1, vertex2)
+        labels = self.connected_components()
+        return labels[vertex1] == labels[vertex2]
+
+    def count_components(self):
+        """Shows the number of connected components of G
+        (weak components, for digraphs)
+
+        :rtype: int
+
+        """
+        if self._tracking:
+            return self._connectivity().count()
+        return len(set(self.connected_components().values()))
+
+    def _connectivity(self):
+        if self._components is None:
+            components = DisjointSet(self.vertices)
+            for vertex, adjacents in self.vertices.items():
+                for adjacent in adjacents:
+                    components.union(vertex, adjacent)
+            self._components = components
+        return self._components
+
+    def strongly_connected_components(self):
+        """For directed graphs (valued or not).
+        Returns a dict with the number of the strongly
+        connected component of each vertex of G, so, two
+        vertices have the same number if each one can be
+        reached from the other. The components are
+        numbered in reverse topological order, found by
+        an iterative Tarjan's algorithm.
+
+        :rtype: dict
+
+        """
+        if not self.directed:
+            raise NotDigraph("Method for digraphs. \
+                Try use connected_components().")
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        labels = {}
+        component = 0
+        for root in self.vertices:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.vertices[root]))]
+            while work:
+                vertex, successors = work[-1]
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = low[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(self.vertices[successor])))
+                        break
+                    if successor in on_stack:
+                        low[vertex] = min(low[vertex], index[successor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[vertex])
+                    if low[vertex] == index[vertex]:
+                        # The vertex is the root of a component, made
+                        # by the vertices above it in the stack.
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            labels[member] = component
+                            if member == vertex:
+                                break
+                        component += 1
+        return labels
+
+    def condensation(self, labels=None):
+        """For directed graphs (valued or not).
+        Returns the condensation of G: a digraph, without
+        cycles, with a vertex for each strongly connected
+        component of G (its number) and an edge between
+        two components if there is an edge between their
+        vertices in G.
+
+        :param labels: The components of G, as returned by
+            strongly_connected_components(), that is called
+            by default.
+        :rtype: Graph
+
+        """
+        if labels is None:
+            labels = self.strongly_connected_components()
+        condensed = Graph(directed=True)
+        condensed.add_vertices_from(sorted(set(labels.values())))
+        for vertex, adjacents in self.vertices.items():
+            component = labels[vertex]
+            for adjacent in adjacents:
+                if labels[adjacent] != component:
+                    condensed._insert_edge(component, labels[adjacent], None)
+        return condensed
+
+    ########################
+    #   Acyclic Digraphs   #
+    ########################
+    # Actions for directed graphs (valued or not) without
+    # cycles. They raise CycleFound, with one of the cycles
+    # of G, when G has one.
+
+    def topological_sort(self):
+        """Iterates over the vertices of G in an order where
+        each vertex comes before its successors (Kahn's
+        algorithm). The vertices are given as they are
+        found, the cycles of G are only found at the end.
+
+        :rtype: generator
+
+        """
+        if not self.directed:
+            raise NotDigraph("Method for digraphs.")
+        indegree = {v: len(self._predecessors[v]) for v in self.vertices}
+        queue = deque(v for v, degree in indegree.items() if degree == 0)
+        found = 0
+        while queue:
+            vertex = queue.popleft()
+            found += 1
+            yield vertex
+            for successor in self.vertices[vertex]:
+                indegree[successor] -= 1
+                if indegree[successor] == 0:
+                    queue.append(successor)
+        if found < len(indegree):
+            self._raise_cycle()
+
+    def topological_layers(self):
+        """Returns a list with the layers of G: the first one
+        has the vertices without predecessors and each next
+        one the vertices whose predecessors are all in the
+        layers before it. The vertices of a layer do not
+        depend on each other, for example, tasks that can
+        run in parallel.
+
+        :rtype: list
+
+        """
+        if not self.directed:
+            raise NotDigraph("Method for digraphs.")
+        indegree = {v: len(self._predecessors[v]) for v in self.vertices}
+        layer = [v for v, degree in indegree.items() if degree == 0]
+        layers = []
+        found = 0
+        while layer:
+            layers.append(layer)
+            found += len(layer)
+            next_layer = []
+            for vertex in layer:
+                for successor in self.vertices[vertex]:
+                    indegree[successor] -= 1
+                    if indegree[successor] == 0:
+                        next_layer.append(successor)
+            layer = next_layer
+        if found < len(indegree):
+            self._raise_cycle()
+        return layers
+
+    def critical_path(self):
+        """For valued graphs. Returns the length and the
+        vertices of a longest path of G, where the length
+        of a path is the sum of the values of its edges.
+        For tasks with dependencies, where the value of an
+        edge is the duration of its origin, it is the
+        chain of tasks that bounds the total duration.
+        With negative values, a longest path may start
+        after the sources of G (or be a single vertex).
+
+        :rtype: tuple (int, list)
+
+        """
+        if not self.valued:
+            raise NotValued()
+        distances = {}
+        previous = {}
+        for vertex in self.topological_sort():
+            distances[vertex], previous[vertex] = 0, None
+            for predecessor in self._predecessors[vertex]:
+                distance = distances[predecessor] + \
+                    self.vertices[predecessor][vertex]
+                # Each vertex can start a path (of length 0), a
+                # predecessor is taken if it does not shorten it.
+                if distance > distances[vertex] or \
+                        previous[vertex] is None and distance == 0:
+                    distances[vertex], previous[vertex] = distance, predecessor
+        if not distances:
+            return 0, []
+        end = max(distances, key=distances.get)
+        return distances[end], self._build_path(previous, end)
+
+    def _raise_cycle(self):
+        raise CycleFound("The graph has a cycle, see the cycle \
+            attribute of this exception.", self.find_cycle())
+
+    ########################
+    #    Shortest Paths    #
+    ########################
+    # Actions for valued graphs (directed or not), the value
+    # of each edge is its length. The searches use a binary
+    # heap with lazy deletion: a vertex may be pushed many
+    # times and the outdated entries are skipped when popped.
+
+    def dijkstra(self, source, target=None):
+        """Returns the length of the shortest paths from
+        "source" to each vertex reachable from it, and the
+        previous vertex of each one in these paths. The
+        values of the edges must not be negative.
+
+        :param source: The vertex where the paths begin.
+        :param target: If given, the search stops as soon
+            as the shortest path to it is found.
+        :rtype: tuple (dict, dict)
+
+        """
+        self._check_valued(source)
+        distances = {source: 0}
+        previous = {source: None}
+        settled = set()
+        tie = count()
+        heap = [(0, next(tie), source)]
+        while heap:
+            distance, _, vertex = heappop(heap)
+            if vertex in settled:
+                continue
+            settled.add(vertex)
+            if vertex == target:
+                break
+            for adjacent, value in self.vertices[vertex].items():
+                if value < 0:
+                    raise ValueError("Negative value in the edges. \
+                        Try use bellman_ford(source).")
+                new_distance = distance + value
+                if new_distance < distances.get(adjacent, INFINITY):
+                    distances[adjacent] = new_distance
+                    previous[adjacent] = vertex
+                    heappush(heap, (new_distance, next(tie), adjacent))
+        return distances, previous
+
+    def shortest_path(self, source, target):
+        """Returns the length and the vertices of a shortest
+        path from "source" to "target", or None if there
+        is no path between them.
+
+        :param source: The vertex where the path begins.
+        :param target: The vertex where the path ends.
+        :rtype: tuple (int, list)
+
+        """
+        self._check_valued(target)
+        distances, previous = self.dijkstra(source, target)
+        if target not in distances:
+            return None
+        return distances[target], self._build_path(previous, target)
+
+    def bidirectional_dijkstra(self, source, target):
+        """As shortest_path, but searching from "source" and
+        from "target" (backwards) at the same time, which
+        settles far fewer vertices in large sparse graphs.
+
+        :param source: The vertex where the path begins.
+        :param target: The vertex where the path ends.
+        :rtype: tuple (int, list)
+
+        """
+        self._check_valued(source)
+        self._check_valued(target)
+        if source == target:
+            return 0, [source]
+        distances = ({source: 0}, {target: 0})
+        previous = ({source: None}, {target: None})
+        settled = (set(), set())
+        tie = count()
+        heaps = ([(0, next(tie), source)], [(0, next(tie), target)])
+        best, meeting = INFINITY, None
+        while heaps[0] and heaps[1]:
+            # No path through an unsettled vertex can be shorter
+            # than the sum of the smallest keys of both heaps.
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+            distance, _, vertex = heappop(heaps[side])
+            if vertex in settled[side]:
+                continue
+            settled[side].add(vertex)
+            for adjacent, value in self._valued_adjacents(vertex, side == 1):
+                if value < 0:
+                    raise ValueError("Negative value in the edges. \
+                        Try use bellman_ford(source).")
+                new_distance = distance + value
+                if new_distance < distances[side].get(adjacent, INFINITY):
+                    distances[side][adjacent] = new_distance
+                    previous[side][adjacent] = vertex
+                    heappush(heaps[side], (new_distance, next(tie), adjacent))
+                if adjacent in distances[1 - side]:
+                    length = distances[side][adjacent] + \
+                        distances[1 - side][adjacent]
+                    if length < best:
+                        best, meeting = length, adjacent
+        if meeting is None:
+            return None
+        path = self._build_path(previous[0], meeting)
+        vertex = previous[1][meeting]
+        while vertex is not None:
+            path.append(vertex)
+            vertex = previous[1][vertex]
+        return best, path
+
+    def astar(self, source, target, heuristic):
+        """As shortest_path, but the search is guided by
+        an estimate of the length of the path from each
+        vertex to "target". The estimate must never be
+        greater than the real length (admissible), and the
+        vertices are searched again when a shorter path to
+        them is found, so it does not need to be consistent.
+
+        :param source: The vertex where the path begins.
+        :param target: The vertex where the path ends.
+        :param heuristic: Function that receives a vertex
+            and "target" and returns the estimate.
+        :rtype: tuple (int, list)
+
+        """
+        self._check_valued(source)
+        self._check_valued(target)
+        distances = {source: 0}
+        previous = {source: None}
+        tie = count()
+        heap = [(heuristic(source, target), next(tie), 0, source)]
+        while heap:
+            _, _, distance, vertex = heappop(heap)
+            # An entry is outdated once a shorter path to its vertex
+            # is found. A vertex is expanded again when its distance
+            # improves, so an estimate that is not consistent (but
+            # never greater than the real length) is enough.
+            if distance > distances[vertex]:
+                continue
+            if vertex == target:
+                return distance, self._build_path(previous, target)
+            for adjacent, value in self.vertices[vertex].items():
+                new_distance = distance + value
+                if new_distance < distances.get(adjacent, INFINITY):
+                    distances[adjacent] = new_distance
+                    previous[adjacent] = vertex
+                    estimate = new_distance + heuristic(adjacent, target)
+                    heappush(heap, (estimate, next(tie), new_distance, adjacent))
+        return None
+
+    def bellman_ford(self, source):
+        """As dijkstra, but the values of the edges can be
+        negative. It is slower, O(V * E) in the worst case.
+
+        :param source: The vertex where the paths begin.
+        :rtype: tuple (dict, dict)
+
+        """
+        self._check_valued(source)
+        distances = {source: 0}
+        previous = {source: None}
+        for _ in range(self.order()):
+            changed = False
+            for vertex in list(distances):
+                distance = distances[vertex]
+                for adjacent, value in self.vertices[vertex].items():
+                    if distance + value < distances.get(adjacent, INFINITY):
+                        distances[adjacent] = distance + value
+                        previous[adjacent] = vertex
+                        changed = True
+            if not changed:
+                return distances, previous
+        # The lengths still change after V rounds, so there is
+        # a cycle whose total value is negative.
+        raise NegativeCycle("Negative cycle reachable from the source, \
+            the shortest paths are not defined.")
+
+    def all_pairs_distances(self, method=None, workers=None):
+        """Returns the list of vertices of G and the matrix
+        with the length of the shortest path between each
+        pair of them, in the order of the list (infinity if
+        there is no path). The matrix is a NumPy array if
+        NumPy is installed, a list of lists otherwise.
+
+        :param method: "floyd-warshall", that updates the
+            whole matrix for each vertex (for dense graphs),
+            or "dijkstra", that searches from each vertex
+            (for sparse graphs). Chosen by the density of
+            G, by default.
+        :param workers: Number of processes that share the
+            searches of "dijkstra", they run in the current
+            process, by default.
+        :rtype: tuple (list, numpy.ndarray)
+
+        """
+        if not self.valued:
+            raise NotValued()
+        n = self.order()
+        if method is None:
+            dense = numpy is not None and self._size * 10 >= n * n
+            method = "floyd-warshall" if dense else "dijkstra"
+        if method == "floyd-warshall":
+            return list(self.vertices), self._floyd_warshall()
+        elif method == "dijkstra":
+            vertices = list(self.vertices)
+            if workers is None:
+                rows = [self._distance_row(v) for v in vertices]
+            else:
+                with ProcessPoolExecutor(workers, initializer=_init_pool,
+                        initargs=(self,)) as pool:
+                    chunksize = max(1, n // (4 * workers))
+                    rows = list(pool.map(_pool_distance_row, vertices,
+                        chunksize=chunksize))
+            return vertices, rows if numpy is None else numpy.array(rows)
+        else:
+            raise ValueError("Unknown method. \
+                Try use \"floyd-warshall\" or \"dijkstra\".")
+
+    def _distance_row(self, source):
+        distances, _ = self.dijkstra(source)
+        return [distances.get(v, INFINITY) for v in self.vertices]
+
+    def _floyd_warshall(self):
+        ids = {v: i for i, v in enumerate(self.vertices)}
+        n = len(ids)
+        if numpy is not None:
+            matrix = numpy.full((n, n), INFINITY)
+            numpy.fill_diagonal(matrix, 0)
+        else:
+            matrix = [[INFINITY] * n for _ in range(n)]
+            for i in range(n):
+                matrix[i][i] = 0
+        for v, i in ids.items():
+            row = matrix[i]
+            for adjacent, value in self.vertices[v].items():
+                j = ids[adjacent]
+                if value < row[j]:
+                    row[j] = value
+        if numpy is not None:
+            # Each iteration updates the whole matrix with the
+            # paths through the vertex k at once.
+            for k in range(n):
+                numpy.minimum(matrix, matrix[:, k, None] + matrix[None, k, :],
+                    out=matrix)
+            negative = bool((numpy.diagonal(matrix) < 0).any())
+        else:
+            for k in range(n):
+                row_k = matrix[k]
+                for row in matrix:
+                    distance = row[k]
+                    if distance == INFINITY:
+                        continue
+                    for j in range(n):
+                        if distance + row_k[j] < row[j]:
+                            row[j] = distance + row_k[j]
+            negative = any(matrix[i][i] < 0 for i in range(n))
+        if negative:
+            raise NegativeCycle("Negative cycle in the graph, \
+                the shortest paths are not defined.")
+        return matrix
+
+    ########################
+    #   Spanning Trees     #
+    ########################
+    # Actions for valued undirected graphs. If G is not
+    # connected, there is a tree for each of its components
+    # (a spanning forest).
+
+    def minimum_spanning_tree(self, algorithm="kruskal"):
+        """Returns a new graph with the vertices of G and the
+        edges of a minimum spanning tree of G, so, a tree
+        that connects the vertices of each component of G
+        with the smallest sum of values of edges
+
+        :param algorithm: "kruskal" or "prim", see
+            iter_spanning_edges.
+        :rtype: Graph
+
+        """
+        tree = Graph(directed=False, valued=True)
+        tree.add_vertices_from(self.vertices)
+        tree.add_edges_from(self.iter_spanning_edges(algorithm))
+        return tree
+
+    def iter_spanning_edges(self, algorithm="kruskal"):
+        """Iterates over the edges of a minimum spanning tree
+        of G, as triples (vertex1, vertex2, value)
+
+        :param algorithm: "kruskal", that sorts every edge
+            and takes the ones that join two trees (found
+            with a disjoint set), or "prim", that grows
+            each tree from a vertex taking the smallest
+            edge that leaves it (found with a heap).
+        :rtype: generator
+
+        """
+        if not self.valued:
+            raise NotValued()
+        if self.directed:
+            raise NotUndirected("Method for undirected graphs.")
+        if algorithm == "kruskal":
+            return self._kruskal()
+        elif algorithm == "prim":
+            return self._prim()
+        else:
+            raise ValueError("Unknown algorithm. \
+                Try use \"kruskal\" or \"prim\".")
+
+    def _kruskal(self):
+        edges = list(self.iter_edges())
+        edges.sort(key=itemgetter(2))
+        trees = DisjointSet(self.vertices)
+        for edge in edges:
+            if trees.count() == 1:
+                break
+            if trees.union(edge[0], edge[1]):
+                yield edge
+
+    def _prim(self):
+        in_tree = set()
+        tie = count()
+        for root in self.vertices:
+            if root in in_tree:
+                continue
+            in_tree.add(root)
+            heap = [(value, next(tie), root, adjacent)
+                for adjacent, value in self.vertices[root].items()]
+            heapify(heap)
+            while heap:
+                value, _, vertex, adjacent = heappop(heap)
+                if adjacent in in_tree:
+                    continue
+                in_tree.add(adjacent)
+                yield vertex, adjacent, value
+                for other, other_value in self.vertices[adjacent].items():
+                    if other not in in_tree:
+                        heappush(heap, (other_value, next(tie), adjacent, other))
+
+    def _check_valued(self, vertex):
+        if not self.valued:
+            raise NotValued()
+        if vertex not in self.vertices:
+            raise VertexNotFound("Vertex not found. \
+                Use get_vertices() to see the vertices of the graph.")
+
+    def _valued_adjacents(self, vertex, backwards=False):
+        if backwards and self.directed:
+            return ((predecessor, self.vertices[predecessor][vertex])
+                for predecessor in self._predecessors[vertex])
+        return self.vertices[vertex].items()
+
+    def _build_path(self, previous, vertex):
+        path = []
+        while vertex is not None:
+            path.append(vertex)
+            vertex = previous[vertex]
+        path.reverse()
+        return path
+
+# Graph shared with the processes of a pool: it is sent once to
+# each process, by _init_pool, instead of once for each task.
+_pool_graph = None
+
+def _init_pool(graph):
+    global _pool_graph
+    _pool_graph = graph
+
+def _pool_distance_row(source):
+    return _pool_graph._distance_row(source)
+
+def _pool_reachable(sources, bitset):
+    if bitset:
+        return list(_pool_graph.reachable_from_many(sources))
+    return [(source, _pool_graph.transitive_closure(source))
+        for source in sources]
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+#   A binary file format for graphs, that is opened through
+#   mmap: the arrays of a FrozenGraph (see frozen.py) are read
+#   straight from the pages of the file, without copies, so
+#   many processes can share one copy of a large graph in the
+#   page cache. The file has a header followed by sections,
+#   each one starting at a multiple of 8 bytes:
+#           header      magic, version, flags and the lengths
+#                       of the sections (see HEADER)
+#           offsets     order + 1 integers
+#           targets     integers
+#           weights     integers or reals, for valued graphs
+#           in_offsets  order + 1 integers, for digraphs
+#           in_targets  integers, for digraphs
+#           labels      the vertices: integers, or the end of
+#                       each label followed by the labels,
+#                       written with repr()
+#   The numbers are 8 bytes long, in the byte order of the
+#   machine that wrote the file. The labels that are not integers
+#   are read from the file when they are first used.
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+from array import array
+from ast import literal_eval
+from collections.abc import Sequence
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+from sys import byteorder
+from frozen import FrozenGraph
+
+MAGIC = b"GRPH"
+VERSION = 1
+
+# Flags of the header.
+DIRECTED = 1
+VALUED = 2
+REAL_WEIGHTS = 4
+INTEGER_LABELS = 8
+BIG_ENDIAN = 16
+
+# magic, version, flags, order, size, len(targets),
+# len(in_targets) and length of the labels in bytes.
+HEADER = Struct("<4sHHQQQQQ")
+
+def save_binary(graph, file):
+    """Writes a graph in the binary format. The values of the
+    edges must be integers or real numbers, and the vertices
+    must be written and read back by repr() and
+    ast.literal_eval() (as numbers, strings and tuples).
+
+    :param graph: The Graph (or FrozenGraph) that will be written.
+    :param file: Path of the file.
+    :rtype: void
+
+    """
+    if not isinstance(graph, FrozenGraph):
+        graph = graph.freeze()
+    flags = 0
+    if graph.directed:
+        flags |= DIRECTED
+    weights = graph._weights
+    if graph.valued:
+        flags |= VALUED
+        if not isinstance(weights, array):
+            # Integers and real numbers together are written
+            # as real numbers.
+            if {type(value) for value in weights} != {int, float}:
+                raise ValueError("The values of the edges must be \
+                    integers or real numbers.")
+            weights = array("d", weights)
+        if weights.typecode == "d":
+            flags |= REAL_WEIGHTS
+    if byteorder == "big":
+        flags |= BIG_ENDIAN
+    labels = _pack_labels(graph.labels)
+    if labels.typecode == "q":
+        flags |= INTEGER_LABELS
+    sections = [graph._offsets, graph._targets]
+    if graph.valued:
+        sections.append(weights)
+    if graph.directed:
+        sections += [graph._in_offsets, graph._in_targets]
+    sections.append(labels)
+    in_targets = len(graph._in_targets) if graph.directed else 0
+    with open(file, "wb") as output:
+        output.write(HEADER.pack(MAGIC, VERSION, flags, graph.order(),
+            graph.size(), len(graph._targets), in_targets,
+            len(labels) * labels.itemsize))
+        position = HEADER.size
+        for section in sections:
+            padding = -position % 8
+            output.write(bytes(padding))
+            data = memoryview(section).cast("B")
+            output.write(data)
+            position += padding + len(data)
+
+def load_binary(file):
+    """Opens a graph written by save_binary. The file is
+    mapped in memory and read only when needed, it stays
+    open while the graph is used.
+
+    :param file: Path of the file.
+    :rtype: FrozenGraph
+
+    """
+    with open(file, "rb") as opened:
+        buffer = mmap(opened.fileno(), 0, access=ACCESS_READ)
+    magic, version, flags, order, size, targets, in_targets, labels = \
+        HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a graph file, or a file of other version.")
+    if bool(flags & BIG_ENDIAN) != (byteorder == "big"):
+        raise ValueError("The file was written in other byte order.")
+    view = memoryview(buffer)
+    position = HEADER.size
+
+    def section(typecode, length):
+        nonlocal position
+        position += -position % 8
+        start = position
+        position += 8 * length
+        return view[start:position].cast(typecode)
+
+    offsets = section("q", order + 1)
+    targets_view = section("q", targets)
+    weights = None
+    if flags & VALUED:
+        weights = section("d" if flags & REAL_WEIGHTS else "q", targets)
+    in_offsets = in_targets_view = None
+    if flags & DIRECTED:
+        in_offsets = section("q", order + 1)
+        in_targets_view = section("q", in_targets)
+    if flags & INTEGER_LABELS:
+        vertices = section("q", order)
+    else:
+        ends = section("q", order + 1)
+        start = position + -position % 8
+        vertices = _Labels(ends, view[start:start + labels - 8 * (order + 1)])
+    return FrozenGraph(vertices, offsets, targets_view, weights, in_offsets,
+        in_targets_view, bool(flags & DIRECTED), bool(flags & VALUED), size)
+
+def _pack_labels(labels):
+    # Integer labels are written as an array, any other
+    # labels as the end of each one followed by their text.
+    if all(type(label) is int for label in labels):
+        try:
+            return array("q", labels)
+        except OverflowError:
+            pass
+    ends = array("q", [0])
+    text = bytearray()
+    for label in labels:
+        written = repr(label)
+        try:
+            valid = literal_eval(written) == label
+        except (ValueError, SyntaxError):
+            valid = False
+        if not valid:
+            raise ValueError("The vertex %s can not be written." % written)
+        text += written.encode("utf-8")
+        ends.append(len(text))
+    packed = array("B", memoryview(ends).cast("B"))
+    packed.extend(text)
+    return packed
+
+class _Labels(Sequence):
+    # The labels written with repr(), each one is read back
+    # from the file (by its ends) when it is first used.
+
+    def __init__(self, ends, data):
+        self._ends = ends
+        self._data = data
+        self._read = {}
+
+    def __len__(self):
+        return len(self._ends) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("The id %d is not in the labels." % i)
+        if i not in self._read:
+            ends = self._ends
+            self._read[i] = literal_eval(
+                str(self._data[ends[i]:ends[i + 1]], "utf-8"))
+        return self._read[i]
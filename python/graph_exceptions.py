@@ -12,6 +12,19 @@
 # NotValued is raised when the actions is executed by a non-
 # valued graph in a method specified for a valued graph.
 #
+# NotUndirected is raised when the actions is executed by a
+# digraph in a method specified for a undirected graph.
+#
+# NegativeCycle is raised when a shortest path is searched in
+# a valued graph with a cycle whose total value is negative.
+#
+# CycleFound is raised when the actions is executed by a digraph
+# with cycles in a method specified for acyclic digraphs, the
+# vertices of one of the cycles are in its cycle attribute.
+#
+# ReadOnlyGraph is raised when the actions that change a graph
+# are executed by a view of another graph (see subgraph.py).
+#
 class VertexNotFound(Exception):
     def __init__(self, value):
         self.value = value
@@ -28,3 +41,32 @@ class NotDigraph(Exception):
 
 class NotValued(Exception):
     pass
+
+class NotUndirected(Exception):
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return repr(self.value)
+
+class NegativeCycle(Exception):
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return repr(self.value)
+
+class CycleFound(Exception):
+    def __init__(self, value, cycle):
+        self.value = value
+        self.cycle = cycle
+
+    def __str__(self):
+        return repr(self.value)
+
+class ReadOnlyGraph(Exception):
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return repr(self.value)
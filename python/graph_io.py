@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+#   Readers and writers of graphs (see graph.py) in text files.
+#   The supported formats are the edge list, with an edge in
+#   each line:
+#           v1 v2
+#           v1 v3
+#   (and a third column with the value of the edge, for valued
+#   graphs), and the adjacency list, with a vertex followed
+#   by its adjacents (or successors, for digraphs) in each line:
+#           v1 v2 v3
+#           v2 v1
+#           v3 v1
+#   The columns are separated by whitespace, by default, or by
+#   a given delimiter (as "," for CSV files). Empty lines and
+#   lines starting with "#" are ignored.
+#
+#   The files are read and written a line at a time, so only
+#   the graph itself is kept in memory.
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+from contextlib import contextmanager
+from graph import Graph
+
+# Size of the buffer of the files, in bytes.
+BUFFER_SIZE = 1 << 20
+
+def read_edgelist(source, directed=False, valued=False, delimiter=None,
+        vertex_type=str, value_type=float):
+    """Reads a graph from an edge list
+
+    :param source: Path of the file, or a file object.
+    :param directed: If is a graph directed or not,
+        it is not, by default.
+    :param valued: If is a graph valued or not (so, if
+        the lines have a third column), it is not, by default.
+    :param delimiter: String that separates the columns,
+        any whitespace, by default.
+    :param vertex_type: Function that converts the columns
+        to vertices, str by default.
+    :param value_type: Function that converts the third
+        column to the value of the edge, float by default.
+    :rtype: Graph
+
+    """
+    graph = Graph(directed=directed, valued=valued)
+    with _open(source, "r") as lines:
+        edges = iter_edgelist(lines, valued, delimiter, vertex_type, value_type)
+        graph.add_edges_from(_add_alone(graph, edges))
+    return graph
+
+def iter_edgelist(lines, valued=False, delimiter=None, vertex_type=str,
+        value_type=float):
+    """Iterates over the edges of the lines of an edge list,
+    as accepted by Graph.add_edges_from. A line with only
+    one column is a vertex without edges, given as
+    (vertex,).
+
+    :param lines: Iterable with the lines.
+    :rtype: generator
+
+    """
+    for number, columns in _split(lines, delimiter):
+        if len(columns) == 1:
+            yield vertex_type(columns[0]),
+        elif len(columns) == 2 and not valued:
+            yield vertex_type(columns[0]), vertex_type(columns[1])
+        elif len(columns) == 3 and valued:
+            yield vertex_type(columns[0]), vertex_type(columns[1]), \
+                value_type(columns[2])
+        else:
+            raise ValueError("Invalid edge in the line %d." % number)
+
+def write_edgelist(graph, destination, delimiter="\t"):
+    """Writes a graph as an edge list, the vertices
+    without edges are written alone in a line
+
+    :param graph: The graph that will be written.
+    :param destination: Path of the file, or a file object.
+    :param delimiter: String that separates the columns,
+        a tab by default.
+    :rtype: void
+
+    """
+    with _open(destination, "w") as output:
+        output.writelines(format_edgelist(graph, delimiter))
+
+def format_edgelist(graph, delimiter="\t"):
+    """Iterates over the lines of the edge list of a graph
+
+    :param graph: The graph that will be formatted.
+    :param delimiter: String that separates the columns,
+        a tab by default.
+    :rtype: generator
+
+    """
+    for vertex1, vertex2, value in graph.iter_edges():
+        columns = [vertex1, vertex2, value] if graph.valued else [vertex1, vertex2]
+        yield delimiter.join(str(column) for column in columns) + "\n"
+    for vertex, adjacents in graph.vertices.items():
+        if not adjacents and not graph.get_degree(vertex):
+            yield str(vertex) + "\n"
+
+def read_adjlist(source, directed=False, delimiter=None, vertex_type=str):
+    """Reads a (non-valued) graph from an adjacency list
+
+    :param source: Path of the file, or a file object.
+    :param directed: If is a graph directed or not,
+        it is not, by default.
+    :param delimiter: String that separates the columns,
+        any whitespace, by default.
+    :param vertex_type: Function that converts the columns
+        to vertices, str by default.
+    :rtype: Graph
+
+    """
+    graph = Graph(directed=directed)
+    with _open(source, "r") as lines:
+        for _, columns in _split(lines, delimiter):
+            vertex = vertex_type(columns[0])
+            graph.add_vertex(vertex)
+            graph.add_edges_from((vertex, vertex_type(adjacent))
+                for adjacent in columns[1:])
+    return graph
+
+def write_adjlist(graph, destination, delimiter="\t"):
+    """Writes a graph as an adjacency list, the values
+    of the edges are not written
+
+    :param graph: The graph that will be written.
+    :param destination: Path of the file, or a file object.
+    :param delimiter: String that separates the columns,
+        a tab by default.
+    :rtype: void
+
+    """
+    with _open(destination, "w") as output:
+        output.writelines(format_adjlist(graph, delimiter))
+
+def format_adjlist(graph, delimiter="\t"):
+    """Iterates over the lines of the adjacency list of a graph
+
+    :param graph: The graph that will be formatted.
+    :param delimiter: String that separates the columns,
+        a tab by default.
+    :rtype: generator
+
+    """
+    for vertex, adjacents in graph.vertices.items():
+        yield delimiter.join(str(v) for v in [vertex, *adjacents]) + "\n"
+
+def _add_alone(graph, edges):
+    # Adds the vertices without edges to the graph, and
+    # gives the edges to be added.
+    for edge in edges:
+        if len(edge) == 1:
+            graph.add_vertex(edge[0])
+        else:
+            yield edge
+
+def _split(lines, delimiter):
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield number, [column.strip() for column in line.split(delimiter)]
+
+@contextmanager
+def _open(file, mode):
+    # Paths are opened (and closed) here, file objects are
+    # used as they are.
+    if hasattr(file, "read") or hasattr(file, "write"):
+        yield file
+    else:
+        with open(file, mode, buffering=BUFFER_SIZE) as opened:
+            yield opened
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+#   An asyncio front-end for the queries of a Graph (see graph.py),
+#   so many clients can query one graph at the same time:
+#       - Identical queries (same method and arguments) made while
+#         one of them is running share its result, the query runs
+#         once.
+#       - The lookups of the neighbours of a vertex (get_adjacents,
+#         get_degree, get_value, ...) are cheap, they are queued
+#         and the ones queued in a turn of the event loop are
+#         answered together, in a single call to the executor.
+#       - The traversals (is_connected, transitive_closure,
+#         dijkstra, ...) run in the executor too.
+#   So the event loop never runs a query itself, and is not blocked
+#   while they run. The queries only read the graph. If it is
+#   changed by other threads while the service runs, it must be a
+#   ConcurrentGraph (see concurrent_graph.py): each batch of lookups
+#   holds its lock for reading once, and waits (in the executor) for
+#   the transactions of the writers.
+#
+#   The service is reached over TCP or a Unix socket, with a JSON
+#   object in each line, as follows:
+#           --> {"id": 1, "method": "get_adjacents", "params": ["a"]}
+#           <-- {"id": 1, "result": ["b", "c"]}
+#           --> {"id": 2, "method": "get_degree", "params": ["z"]}
+#           <-- {"id": 2, "error": {"type": "VertexNotFound",
+#                                   "message": "Vertex not found..."}}
+#   The requests of a connection are answered as they finish, not
+#   in order. Lists in the params are read as tuples (so tuples
+#   can be vertices), and sets and tuples in the results are
+#   written as lists.
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+import asyncio
+import json
+from contextlib import nullcontext
+from functools import partial
+from inspect import isgenerator
+
+# Methods answered together, once per turn of the event loop.
+LOOKUP_METHODS = {
+    "get_adjacents", "get_successors", "get_predecessors", "get_degree",
+    "get_outdegree", "get_indegree", "get_value", "order", "size",
+}
+
+# Methods that run in the executor.
+TRAVERSAL_METHODS = {
+    "get_vertices", "bfs", "dfs", "transitive_closure",
+    "reachable_from_many", "is_connected", "is_regular", "is_complete",
+    "is_tree", "has_cycle", "find_cycle", "connected_components",
+    "same_component", "count_components", "strongly_connected_components",
+    "topological_sort", "topological_layers", "critical_path", "dijkstra",
+    "shortest_path", "bidirectional_dijkstra", "bellman_ford",
+    "minimum_spanning_tree",
+}
+
+class GraphService(object):
+
+    def __init__(self, graph, executor=None):
+        """Constructs a query service of a given graph
+
+        :param graph: The Graph that is queried.
+        :param executor: The executor where the traversals
+            run, the default executor of the event loop (a
+            pool of threads), by default.
+
+        """
+        self.graph = graph
+        self.executor = executor
+        self._in_flight = {}
+        self._lookups = []
+
+    async def query(self, method, *args):
+        """Runs a query of the graph and returns its result.
+        The generators are returned as lists. The result of
+        identical queries running at the same time is the
+        same object, it must not be changed.
+
+        :param method: Name of a method of Graph, in
+            LOOKUP_METHODS or TRAVERSAL_METHODS.
+        :param args: The arguments of the method.
+        :rtype: auto
+
+        """
+        key = (method, args)
+        future = self._in_flight.get(key)
+        if future is None:
+            if method in LOOKUP_METHODS:
+                future = self._lookup(method, args)
+            elif method in TRAVERSAL_METHODS:
+                loop = asyncio.get_running_loop()
+                future = loop.run_in_executor(self.executor,
+                    partial(self._run, method, args))
+            else:
+                raise ValueError("The method %r can not be queried." % method)
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    def _run(self, method, args):
+        result = getattr(self.graph, method)(*args)
+        if isgenerator(result):
+            result = list(result)
+        return result
+
+    def _lookup(self, method, args):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._lookups:
+            loop.call_soon(self._answer_lookups)
+        self._lookups.append((future, method, args))
+        return future
+
+    def _answer_lookups(self):
+        lookups, self._lookups = self._lookups, []
+        calls = [(method, args) for _, method, args in lookups]
+        batch = asyncio.get_running_loop().run_in_executor(self.executor,
+            self._run_lookups, calls)
+        batch.add_done_callback(partial(self._settle_lookups, lookups))
+
+    def _run_lookups(self, calls):
+        # Runs in the executor, returns a pair (succeeded, result
+        # or exception) for each lookup.
+        reading = getattr(self.graph, "reading", None)
+        answers = []
+        with reading() if reading is not None else nullcontext():
+            for method, args in calls:
+                try:
+                    answers.append((True, self._run(method, args)))
+                except Exception as exception:
+                    answers.append((False, exception))
+        return answers
+
+    def _settle_lookups(self, lookups, batch):
+        if batch.cancelled() or batch.exception() is not None:
+            failure = batch.exception() if not batch.cancelled() \
+                else asyncio.CancelledError()
+            answers = [(False, failure)] * len(lookups)
+        else:
+            answers = batch.result()
+        for (future, _, _), (succeeded, answer) in zip(lookups, answers):
+            if future.done():
+                continue
+            if succeeded:
+                future.set_result(answer)
+            else:
+                future.set_exception(answer)
+
+    async def start_server(self, host="127.0.0.1", port=0):
+        """Starts serving the queries over TCP, port 0 takes
+        any free port (see server.sockets)
+
+        :param host: The address where the service listens.
+        :param port: The port where the service listens.
+        :rtype: asyncio.Server
+
+        """
+        return await asyncio.start_server(self._serve, host, port)
+
+    async def start_unix_server(self, path):
+        """Starts serving the queries over a Unix socket
+
+        :param path: Path of the socket.
+        :rtype: asyncio.Server
+
+        """
+        return await asyncio.start_unix_server(self._serve, path)
+
+    async def _serve(self, reader, writer):
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    task = asyncio.ensure_future(self._answer(line, writer))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _answer(self, line, writer):
+        identifier = None
+        try:
+            request = json.loads(line)
+            identifier = request.get("id")
+            params = [_hashable(param) for param in request.get("params", [])]
+            result = await self.query(request["method"], *params)
+            response = {"id": identifier, "result": _jsonable(result)}
+        except Exception as exception:
+            response = {"id": identifier, "error": {
+                "type": type(exception).__name__, "message": str(exception)}}
+        writer.write(json.dumps(response).encode("utf-8") + b"\n")
+        await writer.drain()
+
+def _hashable(value):
+    # JSON lists are read as tuples, recursively.
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+def _jsonable(value):
+    # Sets and tuples are written as lists (the sets sorted,
+    # if they can be), dicts with keys that are not strings
+    # as lists of pairs [key, value].
+    if isinstance(value, (set, frozenset)):
+        items = [_jsonable(item) for item in value]
+        try:
+            items.sort()
+        except TypeError:
+            pass
+        return items
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value):
+            return {key: _jsonable(item) for key, item in value.items()}
+        return [[_jsonable(key), _jsonable(item)] for key, item in value.items()]
+    return value
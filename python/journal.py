@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+#   A journal of the changes made in a Graph (see graph.py), so a
+#   replica of the graph is kept up to date with the changes made
+#   since it was last updated, instead of a copy of the whole
+#   graph. Each change (add_vertex, remove_vertex, connect and
+#   disconnect) gets the next sequence number, as follows:
+#           graph.enable_journal(max_entries=100000)
+#           ...
+#           data = graph.delta(since=sequence)   # in the graph
+#           sequence = replica.apply_delta(data) # in the replica
+#   When the changes after a sequence are no longer in the journal
+#   (or since is None), the delta is a full snapshot of the graph:
+#   the replica is cleared and built again from it. So a journal
+#   with at most max_entries changes is enough, the oldest ones
+#   are dropped (or all of them, by compact_journal()).
+#
+#   A delta is written in binary, with a header followed by two
+#   sections, each one starting at a multiple of 8 bytes:
+#           header      magic, version, flags, the size of
+#                       the integers of the changes, the
+#                       sequence it follows, its last sequence,
+#                       the number of changes, the number of
+#                       terms and their length in bytes (see
+#                       HEADER)
+#           changes     4 integers for each change: the
+#                       operation and the positions of its
+#                       vertices and value in terms (or -1),
+#                       2, 4 or 8 bytes long, the fewest that
+#                       fit the number of terms
+#           terms       number of terms + 1 ends of the terms,
+#                       followed by the terms, written with
+#                       repr()
+#   Each vertex (or value) is written once in the terms, however
+#   many changes have it. The other numbers are 8 bytes long.
+#   All of them are little endian.
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+from array import array
+from ast import literal_eval
+from collections import deque
+from itertools import islice
+from struct import Struct
+from sys import byteorder
+
+MAGIC = b"GRPD"
+VERSION = 1
+
+# Operations of the changes.
+ADD_VERTEX = 1
+REMOVE_VERTEX = 2
+CONNECT = 3
+DISCONNECT = 4
+
+# Flags of the header.
+FULL = 1
+DIRECTED = 2
+VALUED = 4
+
+# magic, version, flags, size of the integers of the changes,
+# sequence it follows, last sequence, number of changes,
+# number of terms and length of the text of the terms in bytes.
+HEADER = Struct("<4sHHHQQQQQ")
+
+# Typecodes of the integers of the changes, by their size.
+TYPECODES = {2: "h", 4: "i", 8: "q"}
+
+class Journal(object):
+
+    def __init__(self, max_entries=None):
+        """Constructs an empty journal
+
+        :param max_entries: Greatest number of changes kept,
+            the oldest ones are dropped, all are kept by
+            default.
+
+        """
+        self.max_entries = max_entries
+        self.sequence = 0
+        self._entries = deque(maxlen=max_entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def record(self, operation, vertex1, vertex2=None, value=None):
+        """Adds a change to the journal, with the next
+        sequence number
+
+        :param operation: ADD_VERTEX, REMOVE_VERTEX, CONNECT
+            or DISCONNECT.
+        :param vertex1: The vertex changed.
+        :param vertex2: The other vertex of an edge.
+        :param value: The value of a connected edge.
+        :rtype: void
+
+        """
+        self._entries.append((operation, vertex1, vertex2, value))
+        self.sequence += 1
+
+    def since(self, sequence):
+        """Returns the list of changes made after a given
+        sequence number, or None if some of them are no
+        longer in the journal
+
+        :param sequence: The sequence number.
+        :rtype: list
+
+        """
+        if sequence > self.sequence:
+            raise ValueError("The sequence %d was not reached yet." % sequence)
+        missing = self.sequence - sequence
+        if missing > len(self._entries):
+            return None
+        return list(islice(self._entries, len(self._entries) - missing, None))
+
+    def compact(self):
+        """Drops the changes of the journal, the sequence
+        numbers go on from the last one
+
+        :rtype: void
+
+        """
+        self._entries.clear()
+
+def snapshot_changes(graph):
+    """Returns the list of changes that build a given
+    graph from an empty one
+
+    :param graph: The Graph.
+    :rtype: list
+
+    """
+    changes = [(ADD_VERTEX, vertex, None, None) for vertex in graph.vertices]
+    changes += [(CONNECT, vertex1, vertex2, value)
+        for vertex1, vertex2, value in graph.iter_edges()]
+    return changes
+
+def pack_delta(changes, since, last, full=False, directed=False, valued=False):
+    """Writes a list of changes in the binary format. The
+    vertices and values must be written and read back by
+    repr() and ast.literal_eval() (as numbers, strings
+    and tuples).
+
+    :param changes: List of tuples (operation, vertex1,
+        vertex2, value).
+    :param since: The sequence number that the changes follow.
+    :param last: The sequence number of the last change.
+    :param full: If the changes build the whole graph.
+    :param directed: If the graph is directed.
+    :param valued: If the graph is valued.
+    :rtype: bytes
+
+    """
+    ids = {}
+    ends = array("q", [0])
+    text = bytearray()
+
+    def term(value):
+        written = repr(value)
+        position = ids.get(written)
+        if position is None:
+            try:
+                valid = literal_eval(written) == value
+            except (ValueError, SyntaxError):
+                valid = False
+            if not valid:
+                raise ValueError("The term %s can not be written." % written)
+            text.extend(written.encode("utf-8"))
+            ends.append(len(text))
+            position = ids[written] = len(ids)
+        return position
+
+    packed = array("q")
+    for operation, vertex1, vertex2, value in changes:
+        packed.append(operation)
+        packed.append(term(vertex1))
+        if operation in (CONNECT, DISCONNECT):
+            packed.append(term(vertex2))
+        else:
+            packed.append(-1)
+        packed.append(term(value) if operation == CONNECT else -1)
+    for width in sorted(TYPECODES):
+        if len(ids) < 1 << (8 * width - 1):
+            packed = array(TYPECODES[width], packed)
+            break
+    if byteorder == "big":
+        packed.byteswap()
+        ends.byteswap()
+    flags = (FULL if full else 0) | (DIRECTED if directed else 0) | \
+        (VALUED if valued else 0)
+    data = bytearray(HEADER.pack(MAGIC, VERSION, flags, width, since,
+        last, len(changes), len(ids), len(text)))
+    data += bytes(-len(data) % 8)
+    data += memoryview(packed).cast("B")
+    data += bytes(-len(data) % 8)
+    data += memoryview(ends).cast("B")
+    data += text
+    return bytes(data)
+
+def unpack_delta(data):
+    """Reads a delta written by pack_delta
+
+    :param data: The bytes of the delta.
+    :rtype: tuple (int, int, int, list), with the flags,
+        the sequence that the changes follow, the last
+        sequence and the list of changes.
+
+    """
+    magic, version, flags, width, since, last, count, terms, length = \
+        HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a delta, or a delta of other version.")
+    position = HEADER.size + -HEADER.size % 8
+
+    def section(typecode, length):
+        nonlocal position
+        position += -position % 8
+        start = position
+        section = array(typecode)
+        position += section.itemsize * length
+        section.frombytes(data[start:position])
+        if byteorder == "big":
+            section.byteswap()
+        return section
+
+    packed = section(TYPECODES[width], 4 * count)
+    ends = section("q", terms + 1)
+    text = data[position:position + length]
+    terms = [literal_eval(str(text[ends[i]:ends[i + 1]], "utf-8"))
+        for i in range(terms)]
+    changes = []
+    for i in range(0, len(packed), 4):
+        operation, vertex1, vertex2, value = packed[i:i + 4]
+        changes.append((operation, terms[vertex1],
+            terms[vertex2] if vertex2 >= 0 else None,
+            terms[value] if value >= 0 else None))
+    return flags, since, last, changes
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+#   Instrumentation of a Graph (see graph.py). While a profiler is
+#   active, the public methods of the graph are replaced, in the
+#   instance only, by wrappers that count the calls, the wall time
+#   (including the time of nested calls) and the lookups in the
+#   dict of vertices, as follows:
+#           with graph.profile() as profiler:
+#               ...
+#           profiler.stats()
+#           {
+#               "methods": {
+#                   "connect": {"calls": 10, "seconds": 0.001,
+#                               "lookups": 40},
+#                   ...
+#               },
+#               "scans_in_loops": [
+#                   {"method": "is_connected", "file": "job.py",
+#                    "line": 12, "calls": 500},
+#               ]
+#           }
+#   A lookup is counted for the innermost profiled method running
+#   when it happens. The methods that cost O(V) or more, called
+#   many times from the same line of code, are reported in
+#   "scans_in_loops", they are usually quadratic patterns.
+#
+#   Nothing is replaced while the profiler is not active, so a
+#   graph that is not profiled has no extra cost. While it is, the
+#   dict of vertices is wrapped (not copied) by a proxy that counts
+#   the lookups, so starting and stopping the profiler cost O(1)
+#   and the changes are made in the dict itself.
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+import sys
+from collections.abc import MutableMapping
+from inspect import isgenerator
+from time import perf_counter
+
+# Methods of Graph that visit every vertex (or edge) of G.
+LINEAR_METHODS = {
+    "get_vertices", "iter_edges", "freeze", "sampler", "delta",
+    "bfs", "dfs", "transitive_closure", "is_connected", "is_regular",
+    "is_complete", "has_cycle", "find_cycle", "is_tree",
+    "connected_components", "strongly_connected_components",
+    "condensation", "count_components", "same_component",
+    "reachable_from_many", "topological_sort", "topological_layers",
+    "critical_path", "dijkstra", "bellman_ford", "all_pairs_distances",
+    "minimum_spanning_tree", "iter_spanning_edges",
+}
+
+class GraphProfiler(object):
+
+    def __init__(self, graph, loop_threshold=100):
+        """Constructs a profiler of a given graph, it is
+        not active until start() is called (or the
+        profiler is used in a with statement)
+
+        :param graph: The profiled Graph.
+        :param loop_threshold: Number of calls of a method in
+            LINEAR_METHODS, from the same line, from which the
+            line is reported, 100 by default.
+
+        """
+        self.graph = graph
+        self.loop_threshold = loop_threshold
+        self._methods = {}
+        self._call_sites = {}
+        self._running = []
+        self._original = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exception):
+        self.stop()
+
+    def start(self):
+        """Replaces the public methods of the graph by the
+        wrappers that measure them
+
+        :rtype: void
+
+        """
+        if self._original is not None:
+            return
+        graph = self.graph
+        for name in dir(type(graph)):
+            if name.startswith("_") or name == "profile":
+                continue
+            attribute = getattr(graph, name)
+            if callable(attribute) and getattr(attribute, "__self__", None) is graph:
+                graph.__dict__[name] = self._wrap(name, attribute)
+        self._original = graph.vertices
+        graph.vertices = _CountingVertices(self, graph.vertices)
+
+    def stop(self):
+        """Restores the methods and the dict of vertices of
+        the graph
+
+        :rtype: void
+
+        """
+        if self._original is None:
+            return
+        graph = self.graph
+        for name in list(graph.__dict__):
+            if isinstance(graph.__dict__[name], _Wrapper):
+                del graph.__dict__[name]
+        graph.vertices = self._original
+        self._original = None
+
+    def reset(self):
+        """Clears the measures taken so far
+
+        :rtype: void
+
+        """
+        self._methods.clear()
+        self._call_sites.clear()
+
+    def stats(self):
+        """Returns a snapshot of the measures, see the
+        documentation of this file
+
+        :rtype: dict
+
+        """
+        methods = {name: dict(measures) for name, measures in self._methods.items()}
+        scans = [{"method": method, "file": file, "line": line, "calls": calls}
+            for (method, file, line), calls in self._call_sites.items()
+            if calls >= self.loop_threshold]
+        scans.sort(key=lambda scan: -scan["calls"])
+        return {"methods": methods, "scans_in_loops": scans}
+
+    def _wrap(self, name, method):
+        return _Wrapper(self, name, method)
+
+    def _measures(self, name):
+        measures = self._methods.get(name)
+        if measures is None:
+            measures = self._methods[name] = {"calls": 0, "seconds": 0.0, "lookups": 0}
+        return measures
+
+    def _lookup(self, count=1):
+        if self._running:
+            self._measures(self._running[-1])["lookups"] += count
+
+class _Wrapper(object):
+    # Measures the calls of a bound method, and the iteration of
+    # the generators that it returns.
+
+    def __init__(self, profiler, name, method):
+        self.profiler = profiler
+        self.name = name
+        self.method = method
+
+    def __call__(self, *args, **kwargs):
+        profiler = self.profiler
+        measures = profiler._measures(self.name)
+        measures["calls"] += 1
+        if self.name in LINEAR_METHODS and not profiler._running:
+            caller = sys._getframe(1)
+            site = (self.name, caller.f_code.co_filename, caller.f_lineno)
+            profiler._call_sites[site] = profiler._call_sites.get(site, 0) + 1
+        result = self._run(self.method, args, kwargs)
+        if isgenerator(result):
+            return self._iterate(result)
+        return result
+
+    def _run(self, function, args=(), kwargs={}):
+        profiler = self.profiler
+        profiler._running.append(self.name)
+        began = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profiler._measures(self.name)["seconds"] += perf_counter() - began
+            profiler._running.pop()
+
+    def _iterate(self, generator):
+        while True:
+            try:
+                item = self._run(next, (generator,))
+            except StopIteration:
+                return
+            yield item
+
+class _CountingVertices(MutableMapping):
+    # A proxy of the dict of vertices of a profiled graph, that
+    # counts the adjacency dicts read from it. The views of the
+    # graph made while profiling (see views.py) hold the proxy,
+    # which goes on reading the dict after the profiler stops.
+
+    def __init__(self, profiler, vertices):
+        self._profiler = profiler
+        self._vertices = vertices
+
+    def __getitem__(self, vertex):
+        self._profiler._lookup()
+        return self._vertices[vertex]
+
+    def __setitem__(self, vertex, adjacents):
+        self._vertices[vertex] = adjacents
+
+    def __delitem__(self, vertex):
+        del self._vertices[vertex]
+
+    def __contains__(self, vertex):
+        return vertex in self._vertices
+
+    def __iter__(self):
+        return iter(self._vertices)
+
+    def __len__(self):
+        return len(self._vertices)
+
+    def get(self, vertex, default=None):
+        self._profiler._lookup()
+        return self._vertices.get(vertex, default)
+
+    def items(self):
+        for item in self._vertices.items():
+            self._profiler._lookup()
+            yield item
+
+    def values(self):
+        for adjacents in self._vertices.values():
+            self._profiler._lookup()
+            yield adjacents
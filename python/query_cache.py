@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+#   A cache of the results of the queries of a Graph (see
+#   graph.py), as is_connected or transitive_closure, so they are
+#   not computed again while the graph is not changed. The graph
+#   has a version, increased by each change made in it, and the
+#   cache only keeps the results of the current version: they are
+#   dropped as soon as the cache is used with a newer one.
+#
+#   The least recently used results are dropped when there are
+#   more than max_entries of them, or when their size is larger
+#   than max_bytes. The size of a result is measured by
+#   sys.getsizeof, with the size of its items for containers
+#   (but not of the items of the items).
+#
+#   The sets are kept (and returned) as frozensets, so a cached
+#   result is returned in O(1), without a copy.
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+from collections import OrderedDict
+from functools import wraps
+from sys import getsizeof
+from threading import Lock
+
+# Returned by QueryCache.get when a result is not cached.
+MISSING = object()
+
+class QueryCache(object):
+
+    def __init__(self, max_entries=128, max_bytes=None):
+        """Constructs an empty cache
+
+        :param max_entries: Greatest number of results kept,
+            128 by default.
+        :param max_bytes: Greatest size of the results kept,
+            they are not bounded by their size, by default.
+
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._results = OrderedDict()
+        # The readers of a ConcurrentGraph (see
+        # concurrent_graph.py) use the cache at the same time.
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._results)
+
+    def __getstate__(self):
+        # The results are not copied with the cache.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_results"] = OrderedDict()
+        state["bytes"] = 0
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def get(self, key, version):
+        """Returns the result of a query in a given version
+        of the graph, or MISSING if it is not cached
+
+        :param key: Tuple with the method and its arguments.
+        :param version: The version of the graph.
+        :rtype: auto
+
+        """
+        with self._lock:
+            self._check_version(version)
+            entry = self._results.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            self._results.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, version, result):
+        """Keeps the result of a query in a given version of
+        the graph, dropping the least recently used ones
+        that do not fit
+
+        :param key: Tuple with the method and its arguments.
+        :param version: The version of the graph.
+        :param result: The result of the query.
+        :rtype: void
+
+        """
+        size = _size(result)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            self._check_version(version)
+            old = self._results.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._results[key] = (result, size)
+            self.bytes += size
+            while len(self._results) > self.max_entries or \
+                    (self.max_bytes is not None and self.bytes > self.max_bytes):
+                self.bytes -= self._results.popitem(last=False)[1][1]
+
+    def clear(self):
+        """Drops the results kept
+
+        :rtype: void
+
+        """
+        with self._lock:
+            self._results.clear()
+            self.bytes = 0
+
+    def _check_version(self, version):
+        if version != self.version:
+            self._results.clear()
+            self.bytes = 0
+            self.version = version
+
+def cached(method):
+    """Decorates a method of Graph, so its results are kept
+    in the cache of the graph, while it has one. The sets
+    are returned as frozensets, they can not be changed by
+    the caller. The calls with arguments that can not be
+    keys of a dict are not cached.
+
+    :param method: The method.
+    :rtype: function
+
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self._cache
+        if cache is None or kwargs:
+            return method(self, *args, **kwargs)
+        key = (name,) + args
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, *args)
+        version = self._version
+        result = cache.get(key, version)
+        if result is MISSING:
+            result = method(self, *args)
+            if isinstance(result, set):
+                result = frozenset(result)
+            cache.put(key, version, result)
+        return result
+    return wrapper
+
+def _size(result):
+    # The size of a result and of its items, if it is a
+    # container.
+    size = getsizeof(result)
+    if isinstance(result, dict):
+        size += sum(getsizeof(key) + getsizeof(value)
+            for key, value in result.items())
+    elif isinstance(result, (set, frozenset, list, tuple)):
+        size += sum(getsizeof(item) for item in result)
+    return size
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+#   Random sampling of vertices, neighbours and walks on a graph,
+#   for jobs (as random-walk embeddings) that draw them many times.
+#   The sampler is built on a FrozenGraph (see frozen.py), so each
+#   vertex has an integer id and its neighbours are a slice of an
+#   array: a uniform vertex or neighbour is drawn in O(1).
+#
+#   For valued graphs, the neighbours are drawn with a probability
+#   proportional to the value of the edge, using an alias table for
+#   each vertex (Vose's method): each position k of the adjacents
+#   of the vertex keeps a probability and an alias, then, a
+#   position is drawn uniformly and its own target is taken with
+#   that probability, or its alias, otherwise. So a weighted
+#   neighbour is also drawn in O(1).
+#
+#   The walks are made of vertex ids, the label of each id is in
+#   sampler.labels. With NumPy, they are returned as arrays and
+#   the walks of a batch are advanced together, as follows:
+#           sampler = Sampler(graph, seed=42)
+#           for walks in sampler.random_walks(starts, length=80, n=10):
+#               ...  # walks.shape == (rows, 81)
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+from array import array
+from random import Random
+from frozen import FrozenGraph
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class Sampler(object):
+
+    def __init__(self, graph, seed=None, weighted=None):
+        """Constructs a sampler of a given graph. The
+        sampler is not changed with the graph, a new one
+        must be built after the graph is changed.
+
+        :param graph: The Graph (or FrozenGraph) sampled.
+        :param seed: Seed of the random number generators.
+        :param weighted: If the neighbours are drawn with a
+            probability proportional to the values of the
+            edges, by default, if the graph is valued.
+
+        """
+        if not isinstance(graph, FrozenGraph):
+            graph = graph.freeze()
+        self.graph = graph
+        self.labels = graph.labels
+        self._random = Random(seed)
+        self._numpy_random = None
+        if numpy is not None:
+            self._numpy_random = numpy.random.default_rng(seed)
+        self._offsets = graph._offsets
+        self._targets = graph._targets
+        if weighted is None:
+            weighted = graph.valued
+        self._probabilities = self._aliases = None
+        if weighted:
+            self._build_alias_tables()
+        self._numpy_arrays = None
+
+    def _build_alias_tables(self):
+        # For each position k of targets, the probability of
+        # keeping targets[k] and the id of its alias.
+        weights = self.graph._weights
+        if weights is None:
+            raise ValueError("Only the neighbours of valued graphs \
+                can be drawn by weight.")
+        offsets, targets = self._offsets, self._targets
+        probabilities = array("d", bytes(8 * len(targets)))
+        aliases = array("q", targets)
+        for i in range(len(self.labels)):
+            start, end = offsets[i], offsets[i + 1]
+            degree = end - start
+            if not degree:
+                continue
+            row = [float(weights[k]) for k in range(start, end)]
+            if min(row) < 0:
+                raise ValueError("The values of the edges must not be \
+                    negative to draw the neighbours by weight.")
+            total = sum(row)
+            if not total:
+                row = [1.0] * degree
+                total = float(degree)
+            scaled = [weight * degree / total for weight in row]
+            small = [k for k in range(degree) if scaled[k] < 1.0]
+            large = [k for k in range(degree) if scaled[k] >= 1.0]
+            while small and large:
+                less, more = small.pop(), large.pop()
+                probabilities[start + less] = scaled[less]
+                aliases[start + less] = targets[start + more]
+                scaled[more] -= 1.0 - scaled[less]
+                if scaled[more] < 1.0:
+                    small.append(more)
+                else:
+                    large.append(more)
+            # The ones left are 1, but for rounding errors.
+            for k in small + large:
+                probabilities[start + k] = 1.0
+        self._probabilities = probabilities
+        self._aliases = aliases
+
+    def random_vertex(self):
+        """Returns a random vertex, all of them with the
+        same probability
+
+        :rtype: auto
+
+        """
+        return self.labels[self._random.randrange(len(self.labels))]
+
+    def random_neighbor(self, vertex):
+        """Returns a random neighbour of a given vertex (a
+        successor, for digraphs), or None if it has none
+
+        :param vertex: The vertex.
+        :rtype: auto
+
+        """
+        next_id = self._step(self.graph._id(vertex), self._random.random)
+        if next_id < 0:
+            return None
+        return self.labels[next_id]
+
+    def _step(self, i, random):
+        # Id of a random neighbour of the vertex with id i,
+        # or -1 if it has none.
+        start = self._offsets[i]
+        degree = self._offsets[i + 1] - start
+        if not degree:
+            return -1
+        k = start + int(random() * degree)
+        if self._probabilities is None or random() < self._probabilities[k]:
+            return self._targets[k]
+        return self._aliases[k]
+
+    def random_walks(self, starts, length, n=1, batch=1024):
+        """Generates n random walks from each given vertex,
+        in batches. Each walk has the id of its start and
+        of the length vertices reached from it, a walk that
+        reaches a vertex without neighbours is filled with
+        -1. The batches are NumPy arrays with a walk in each
+        row, or lists of arrays of ids, without NumPy.
+
+        :param starts: Iterable with the vertices where the
+            walks start.
+        :param length: Number of steps of each walk.
+        :param n: Number of walks from each vertex.
+        :param batch: Greatest number of walks of a batch.
+        :rtype: generator
+
+        """
+        ids = [self.graph._id(vertex) for vertex in starts for _ in range(n)]
+        for begin in range(0, len(ids), batch):
+            chunk = ids[begin:begin + batch]
+            if numpy is not None:
+                yield self._numpy_walks(chunk, length)
+            else:
+                yield [self._walk(i, length) for i in chunk]
+
+    def _walk(self, i, length):
+        walk = array("q", [i])
+        random = self._random.random
+        for _ in range(length):
+            if i >= 0:
+                i = self._step(i, random)
+            walk.append(i)
+        return walk
+
+    def _numpy_walks(self, starts, length):
+        if self._numpy_arrays is None:
+            self._numpy_arrays = (
+                numpy.asarray(self._offsets, dtype=numpy.int64),
+                numpy.asarray(self._targets, dtype=numpy.int64),
+                None if self._probabilities is None else
+                    numpy.asarray(self._probabilities),
+                None if self._aliases is None else
+                    numpy.asarray(self._aliases, dtype=numpy.int64))
+        offsets, targets, probabilities, aliases = self._numpy_arrays
+        rng = self._numpy_random
+        walks = numpy.full((len(starts), length + 1), -1, dtype=numpy.int64)
+        current = numpy.array(starts, dtype=numpy.int64)
+        walks[:, 0] = current
+        for step in range(1, length + 1):
+            alive = numpy.flatnonzero(current >= 0)
+            if not len(alive):
+                break
+            vertices = current[alive]
+            start = offsets[vertices]
+            degree = offsets[vertices + 1] - start
+            has_neighbours = degree > 0
+            alive, start, degree = alive[has_neighbours], \
+                start[has_neighbours], degree[has_neighbours]
+            k = start + (rng.random(len(alive)) * degree).astype(numpy.int64)
+            following = targets[k]
+            if probabilities is not None:
+                keep = rng.random(len(alive)) < probabilities[k]
+                following = numpy.where(keep, following, aliases[k])
+            current = numpy.full(len(starts), -1, dtype=numpy.int64)
+            current[alive] = following
+            walks[:, step] = current
+        return walks
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+#   Subgraphs of a Graph (see graph.py) that are views: nothing is
+#   copied when they are created, the adjacents of each vertex are
+#   filtered from the dicts of the graph when they are read, and the
+#   changes made in the graph are seen by them. A Subgraph is a
+#   Graph, so every action that does not change it can be run in
+#   it, as follows:
+#           region = graph.subgraph(["a", "b", "c"])
+#           region.is_connected()
+#   The changes must be made in the graph, the subgraph raises
+#   ReadOnlyGraph. Use copy() to get a subgraph that can be changed.
+#
+#   The subgraph induced by a set of vertices has the edges of the
+#   graph between them. The subgraph of a set of edges has only
+#   those edges, and the vertices that they connect.
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+from collections.abc import Mapping, Set
+from graph import Graph
+from graph_exceptions import VertexNotFound, ReadOnlyGraph
+
+class Subgraph(Graph):
+
+    def __init__(self, graph, vertices, successors=None, predecessors=None):
+        """Constructs a view of a subgraph of a given graph
+
+        :param graph: The Graph that is viewed.
+        :param vertices: Set with the vertices of the subgraph.
+        :param successors: Dict with, for each vertex, the set
+            of the vertices that it can be connected to, None
+            for the subgraph induced by the vertices.
+        :param predecessors: As successors, the vertices that
+            can be connected to each vertex of a digraph.
+
+        """
+        self.graph = graph
+        self.directed = graph.directed
+        self.valued = graph.valued
+        self.vertices = _Vertices(graph, "vertices", vertices, successors)
+        self._predecessors = {}
+        if graph.directed:
+            self._predecessors = _Vertices(graph, "_predecessors",
+                vertices, predecessors)
+        self._tracking = False
+        self._components = None
+        self._journal = None
+        self._cache = None
+
+    @property
+    def _size(self):
+        size = sum(len(adjacents) for adjacents in self.vertices.values())
+        if not self.directed:
+            loops = sum(1 for v, adjacents in self.vertices.items() if v in adjacents)
+            size = (size + loops) // 2
+        return size
+
+    @property
+    def _version(self):
+        # The subgraph changes only with its graph.
+        return self.graph._version
+
+    @property
+    def _vertex_list(self):
+        return list(self.vertices)
+
+    def _read_only(self, *args, **kwargs):
+        raise ReadOnlyGraph("A subgraph can not be changed. \
+            Change its graph, or use copy().")
+
+    add_vertex = remove_vertex = connect = disconnect = _read_only
+    add_vertices_from = add_edges_from = track_connectivity = _read_only
+    enable_journal = apply_delta = _read_only
+
+def induced_subgraph(graph, vertices):
+    """Returns a view of the subgraph of a given graph
+    induced by the given vertices
+
+    :param graph: The Graph.
+    :param vertices: Iterable with vertices of the graph.
+    :rtype: Subgraph
+
+    """
+    vertices = set(vertices)
+    for vertex in vertices:
+        if vertex not in graph.vertices:
+            raise VertexNotFound("Vertex not found. \
+                Use get_vertices() to see the vertices of the graph.")
+    return Subgraph(graph, vertices)
+
+def edge_subgraph(graph, edges):
+    """Returns a view of the subgraph of a given graph
+    with the given edges
+
+    :param graph: The Graph.
+    :param edges: Iterable with edges of the graph, as pairs
+        (vertex1, vertex2) or triples (vertex1, vertex2, value).
+    :rtype: Subgraph
+
+    """
+    successors, predecessors = {}, {}
+    for edge in edges:
+        vertex1, vertex2 = edge[0], edge[1]
+        if vertex1 not in graph.vertices or vertex2 not in graph.vertices:
+            raise VertexNotFound("Vertex (or vertices) not found. \
+                Use get_vertices() to see the vertices of the graph.")
+        if vertex2 not in graph.vertices[vertex1]:
+            raise ValueError("There is no edge between %r and %r."
+                % (vertex1, vertex2))
+        successors.setdefault(vertex1, set()).add(vertex2)
+        if graph.directed:
+            predecessors.setdefault(vertex2, set()).add(vertex1)
+        else:
+            successors.setdefault(vertex2, set()).add(vertex1)
+    vertices = set(successors).union(predecessors)
+    for vertex in vertices:
+        successors.setdefault(vertex, set())
+        predecessors.setdefault(vertex, set())
+    return Subgraph(graph, vertices, successors, predecessors)
+
+class _Vertices(Mapping):
+    # The vertices of a subgraph, mapped to their adjacents (or
+    # predecessors) in it. The vertices removed from the graph
+    # are left out.
+
+    def __init__(self, graph, attribute, vertices, allowed):
+        self._graph = graph
+        self._attribute = attribute
+        self._vertices = vertices
+        self._allowed = allowed
+
+    def _mapping(self):
+        # Read on each access, the profiler of the graph (see
+        # profiling.py) replaces its dict of vertices.
+        return getattr(self._graph, self._attribute)
+
+    def __contains__(self, vertex):
+        return vertex in self._vertices and vertex in self._graph.vertices
+
+    def __getitem__(self, vertex):
+        if vertex not in self:
+            raise KeyError(vertex)
+        allowed = self._vertices if self._allowed is None else self._allowed[vertex]
+        adjacents = self._mapping()[vertex]
+        if isinstance(adjacents, Set):
+            return _Adjacents(adjacents, allowed)
+        return _AdjacentsDict(adjacents, allowed)
+
+    def __iter__(self):
+        vertices = self._graph.vertices
+        return (vertex for vertex in self._vertices if vertex in vertices)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+class _Filtered(object):
+    # The adjacents (or predecessors) of a vertex of the graph
+    # that are allowed in the subgraph. The smaller of the two
+    # containers is the one iterated.
+
+    def __init__(self, adjacents, allowed):
+        self._adjacents = adjacents
+        self._allowed = allowed
+
+    def __contains__(self, vertex):
+        return vertex in self._allowed and vertex in self._adjacents
+
+    def __iter__(self):
+        if len(self._allowed) < len(self._adjacents):
+            adjacents = self._adjacents
+            return (v for v in self._allowed if v in adjacents)
+        allowed = self._allowed
+        return (v for v in self._adjacents if v in allowed)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+class _Adjacents(_Filtered, Set):
+    # A filtered set of predecessors.
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+
+class _AdjacentsDict(_Filtered, Mapping):
+    # A filtered dict of adjacents, that maps each adjacent
+    # to the value of the edge.
+
+    def __getitem__(self, vertex):
+        if vertex not in self._allowed:
+            raise KeyError(vertex)
+        return self._adjacents[vertex]
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+from random import Random
+from unittest import TestCase, main
+from graph import Graph
+from benchmark import FAMILIES, run_benchmarks, compare
+
+class TestBenchmark(TestCase):
+    def test_families(self):
+        for name, family in FAMILIES.items():
+            graph = Graph.from_edges(family(100, Random(0)))
+            self.assertGreater(graph.size(), 0, name)
+        self.assertEqual(Graph.from_edges(FAMILIES["path"](100)).order(), 100)
+        self.assertEqual(Graph.from_edges(FAMILIES["grid"](100)).order(), 100)
+        self.assertTrue(Graph.from_edges(FAMILIES["path"](100)).is_tree())
+        self.assertTrue(Graph.from_edges(FAMILIES["complete"](100)).is_complete())
+        # Too few vertices for the degree, the graph is complete.
+        self.assertEqual(len(FAMILIES["erdos_renyi"](4, Random(0))), 6)
+
+    def test_run_and_compare(self):
+        results = run_benchmarks([50], ["path"], ["is_connected", "remove_vertex"],
+            repeat=1)
+        self.assertEqual([r["operation"] for r in results],
+            ["is_connected", "remove_vertex"])
+        self.assertEqual(results[1]["calls"], 50)
+
+        baseline = [dict(r, seconds=r["seconds"] / 10) for r in results]
+        self.assertEqual(len(compare(results, baseline, tolerance=2)), 2)
+        self.assertEqual(compare(results, results), [])
+
+if __name__ == "__main__":
+    main()
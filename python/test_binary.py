@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from graph import Graph
+from graph_binary import save_binary, load_binary
+
+class TestBinary(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.file = path.join(self.directory.name, "graph.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip_undirected(self):
+        graph = Graph({
+                "a":{"b":None, "c":None},
+                "b":{"a":None},
+                "c":{"a":None},
+                ("d", 1):{}
+            })
+        save_binary(graph, self.file)
+        loaded = load_binary(self.file)
+
+        self.assertFalse(loaded.directed)
+        self.assertFalse(loaded.valued)
+        self.assertEqual(loaded.order(), 4)
+        self.assertEqual(loaded.size(), 2)
+        self.assertEqual(loaded.get_vertices(), {"a", "b", "c", ("d", 1)})
+        self.assertEqual(loaded.get_adjacents("a"), {"b", "c"})
+        self.assertEqual(loaded.get_degree(("d", 1)), 0)
+        self.assertFalse(loaded.is_connected())
+        self.assertEqual(loaded.thaw().vertices, graph.vertices)
+
+    def test_round_trip_valued_digraph(self):
+        dg = Graph.from_edges([(i, (i + 1) % 50, i / 2) for i in range(50)],
+            directed=True, valued=True)
+        save_binary(dg, self.file)
+        loaded = load_binary(self.file)
+
+        self.assertTrue(loaded.directed)
+        self.assertTrue(loaded.valued)
+        self.assertEqual(loaded.size(), 50)
+        self.assertEqual(loaded.get_value(3, 4), 1.5)
+        self.assertEqual(loaded.get_successors(49), {0})
+        self.assertEqual(loaded.get_predecessors(0), {49})
+        self.assertEqual(loaded.transitive_closure(10), set(range(50)))
+        self.assertEqual(loaded.thaw().vertices, dg.vertices)
+
+        dg2 = Graph({"a":{"b":7}, "b":{}}, directed=True, valued=True)
+        save_binary(dg2.freeze(), self.file)
+        self.assertEqual(load_binary(self.file).get_value("a", "b"), 7)
+
+        dg3 = Graph({"a":{"b":7, "c":0.5}, "b":{}, "c":{}}, directed=True,
+            valued=True)
+        save_binary(dg3, self.file)
+        self.assertEqual(load_binary(self.file).get_value("a", "b"), 7.0)
+
+    def test_labels_read_when_used(self):
+        graph = Graph.from_edges([("v%d" % i, "v%d" % (i + 1)) for i in range(20)])
+        save_binary(graph, self.file)
+        loaded = load_binary(self.file)
+
+        self.assertEqual(loaded.order(), 21)
+        self.assertEqual(len(loaded.labels._read), 0)
+        labels = graph.freeze().labels
+        self.assertEqual(loaded.labels[-1], labels[-1])
+        self.assertEqual(len(loaded.labels._read), 1)
+        self.assertEqual(list(loaded.labels), list(labels))
+        self.assertEqual(loaded.get_adjacents("v3"), {"v2", "v4"})
+
+    def test_invalid(self):
+        graph = Graph({"a":{"b":"x"}, "b":{"a":"x"}}, valued=True)
+        self.assertRaises(ValueError, save_binary, graph, self.file)
+        self.assertRaises(ValueError, save_binary, Graph({object():{}}), self.file)
+        with open(self.file, "wb") as output:
+            output.write(bytes(64))
+        self.assertRaises(ValueError, load_binary, self.file)
+
+if __name__ == "__main__":
+    main()
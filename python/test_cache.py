@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+import pickle
+from sys import getsizeof
+from unittest import TestCase, main
+from graph import Graph
+from concurrent_graph import ConcurrentGraph
+from query_cache import QueryCache, MISSING
+
+class TestCache(TestCase):
+    def setUp(self):
+        self.graph = Graph({
+                "a":{"b":None},
+                "b":{"a":None, "c":None},
+                "c":{"b":None}
+            })
+
+    def test_version(self):
+        graph = self.graph
+        version = graph._version
+        graph.add_vertex("d")
+        graph.add_vertex("d")
+        graph.connect("c", "d")
+        graph.disconnect("c", "d")
+        graph.remove_vertex("d")
+        self.assertEqual(graph._version, version + 4)
+
+    def test_cached_queries(self):
+        graph = self.graph
+        self.assertIsNone(graph.cache_info())
+        graph.enable_cache()
+
+        self.assertTrue(graph.is_tree())
+        self.assertTrue(graph.is_tree())
+        self.assertEqual(graph.cache_info()["hits"], 1)
+        closure = graph.transitive_closure("a")
+        self.assertIsInstance(closure, frozenset)
+        self.assertIs(graph.transitive_closure("a"), closure)
+        self.assertEqual(closure, {"a", "b", "c"})
+
+        graph.connect("a", "c")
+        self.assertFalse(graph.is_tree())
+        self.assertTrue(graph.is_complete())
+        graph.add_vertex("d")
+        self.assertFalse(graph.is_connected())
+        self.assertEqual(list(graph._cache._results), [("is_connected",)])
+        self.assertEqual(graph.transitive_closure("d"), {"d"})
+        self.assertEqual(graph.cache_info()["entries"], 2)
+
+        visited = set()
+        graph.transitive_closure("a", visited)
+        self.assertEqual(visited, {"a", "b", "c"})
+
+        graph.disable_cache()
+        self.assertIsNone(graph.cache_info())
+
+    def test_subgraph_uses_version_of_graph(self):
+        region = self.graph.subgraph(["a", "b"])
+        region.enable_cache()
+        self.assertTrue(region.is_complete())
+        self.graph.disconnect("a", "b")
+        self.assertFalse(region.is_complete())
+
+    def test_concurrent_graph(self):
+        graph = ConcurrentGraph(self.graph.vertices)
+        graph.enable_cache()
+        self.assertTrue(graph.is_connected())
+        self.assertTrue(graph.is_connected())
+        self.assertEqual(graph.cache_info()["hits"], 1)
+
+        copy = pickle.loads(pickle.dumps(graph))
+        self.assertEqual(copy.cache_info()["entries"], 0)
+        self.assertTrue(copy.is_connected())
+
+    def test_eviction(self):
+        cache = QueryCache(max_entries=2)
+        for vertex in range(3):
+            cache.put(("transitive_closure", vertex), 0, {vertex})
+        self.assertIs(cache.get(("transitive_closure", 0), 0), MISSING)
+        self.assertEqual(cache.get(("transitive_closure", 2), 0), {2})
+        self.assertIs(cache.get(("transitive_closure", 2), 1), MISSING)
+        self.assertEqual(len(cache), 0)
+
+        size = getsizeof({1}) + getsizeof(1)
+        small = QueryCache(max_bytes=2 * size)
+        small.put(("a",), 0, set(range(1000)))
+        self.assertEqual(len(small), 0)
+        small.put(("b",), 0, {1})
+        small.put(("c",), 0, {2})
+        small.put(("d",), 0, {3})
+        self.assertEqual(small.bytes, 2 * size)
+        self.assertIs(small.get(("b",), 0), MISSING)
+        self.assertEqual(small.get(("d",), 0), {3})
+
+        # The items of the results are counted.
+        large = QueryCache(max_bytes=getsizeof({"x"}) + 100)
+        large.put(("e",), 0, {"x" * 1000})
+        self.assertEqual(len(large), 0)
+
+if __name__ == "__main__":
+    main()
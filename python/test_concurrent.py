@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+from pickle import dumps, loads
+from threading import Thread
+from unittest import TestCase, main
+from concurrent_graph import ConcurrentGraph, ReadWriteLock
+from frozen import FrozenGraph
+from graph_exceptions import VertexNotFound
+
+class TestConcurrent(TestCase):
+    def test_graph_actions(self):
+        graph = ConcurrentGraph.from_edges([("a", "b"), ("b", "c")])
+        self.assertIsInstance(graph, ConcurrentGraph)
+        self.assertEqual(graph.get_adjacents("b"), {"a", "c"})
+        self.assertTrue(graph.is_connected())
+        self.assertTrue(graph.is_tree())
+        self.assertEqual(list(graph.bfs("a")), ["a", "b", "c"])
+        self.assertEqual(len(list(graph.iter_edges())), 2)
+        self.assertRaises(VertexNotFound, graph.transitive_closure, "z")
+        self.assertIsInstance(graph.adjacents_view("b"), set)
+
+        with graph.transaction():
+            graph.add_vertex("d")
+            graph.connect("c", "d")
+            self.assertEqual(graph.get_degree("d"), 1)
+        self.assertEqual(graph.transitive_closure("a"), {"a", "b", "c", "d"})
+
+    def test_snapshot(self):
+        graph = ConcurrentGraph.from_edges([(1, 2)], directed=True)
+        snapshot = graph.snapshot()
+        self.assertIsInstance(snapshot, FrozenGraph)
+        self.assertIs(graph.snapshot(), snapshot)
+
+        graph.add_edges_from([(2, 3)])
+        self.assertEqual(snapshot.get_vertices(), {1, 2})
+        self.assertIsNot(graph.snapshot(), snapshot)
+        self.assertEqual(graph.snapshot().get_successors(2), {3})
+
+    def test_snapshot_in_transaction(self):
+        graph = ConcurrentGraph.from_edges([(1, 2), (2, 3)])
+        seen = []
+
+        def read():
+            seen.append(graph.transitive_closure(1))
+
+        with graph.transaction():
+            graph.disconnect(2, 3)
+            self.assertEqual(graph.transitive_closure(1), {1, 2})
+            reader = Thread(target=read)
+            reader.start()
+            reader.join(0.1)
+            # The reader waits for the transaction to end.
+            self.assertEqual(seen, [])
+            graph.connect(2, 3)
+        reader.join()
+        self.assertEqual(seen, [{1, 2, 3}])
+
+    def test_pickle(self):
+        graph = ConcurrentGraph.from_edges([(1, 2, 5)], valued=True)
+        copy = loads(dumps(graph))
+        copy.add_edges_from([(2, 3, 1)])
+        self.assertEqual(copy.shortest_path(1, 3), (6, [1, 2, 3]))
+        self.assertEqual(graph.order(), 2)
+
+    def test_threads(self):
+        graph = ConcurrentGraph()
+        graph.add_vertex(0)
+        errors = []
+
+        def write():
+            for i in range(1, 500):
+                with graph.transaction():
+                    graph.add_vertex(i)
+                    graph.connect(i - 1, i)
+
+        def read():
+            try:
+                for _ in range(50):
+                    graph.get_vertices()
+                    graph.is_connected()
+                    for vertex in graph.bfs(0):
+                        pass
+                    graph.get_adjacents(0)
+            except Exception as error:
+                errors.append(error)
+
+        threads = [Thread(target=write)] + [Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(graph.size(), 499)
+        self.assertTrue(graph.is_connected())
+
+    def test_lock(self):
+        lock = ReadWriteLock()
+        with lock.write():
+            with lock.write():
+                with lock.read():
+                    pass
+        with lock.read():
+            with lock.read():
+                self.assertRaises(RuntimeError, lock.acquire_write)
+        with lock.write():
+            pass
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 from unittest import TestCase, main
 from graph import Graph
-from graph_exceptions import VertexNotFound, NotValued
+from graph_exceptions import VertexNotFound, NotDigraph, NotValued, CycleFound
 
 class TestDirected(TestCase):
 
@@ -19,6 +19,7 @@ class TestDirected(TestCase):
         self.assertEqual(graph.get_indegree("c"), 1)
         self.assertEqual(graph.get_indegree("d"), 1)
         self.assertEqual(graph.get_indegree("e"), 1)
+        self.assertEqual(graph.get_indegree("z"), 0)
 
         self.assertEqual(graph.get_outdegree("a"), 2)
         self.assertEqual(graph.get_outdegree("b"), 1)
@@ -82,6 +83,85 @@ class TestDirected(TestCase):
         self.assertEqual(digraph.get_predecessors("c"), {"b"})
         self.assertEqual(digraph.get_predecessors("d"), {"c"})
 
+    def test_remove_vertex(self):
+        digraph = Graph({
+                "a":{"b":None, "c":None},
+                "b":{"c":None},
+                "c":{"a":None},
+                "d":{"c":None}
+            }, directed=True)
+
+        digraph.remove_vertex("b")
+        self.assertEqual(digraph.get_predecessors("c"), {"a", "d"})
+        self.assertEqual(digraph.get_indegree("c"), 2)
+
+        digraph.remove_vertex("c")
+        self.assertEqual(digraph.get_successors("a"), set())
+        self.assertEqual(digraph.get_predecessors("a"), set())
+        self.assertEqual(digraph.get_indegree("a"), 0)
+
+        digraph.add_vertex("e")
+        digraph.connect("e", "a")
+        digraph.connect("d", "a")
+        self.assertEqual(digraph.get_predecessors("a"), {"d", "e"})
+        self.assertEqual(digraph.get_degree("a"), 2)
+
+        digraph.connect("a", "a")
+        digraph.remove_vertex("a")
+        self.assertEqual(digraph.get_successors("d"), set())
+        self.assertEqual(digraph.get_successors("e"), set())
+
+    def test_size_and_complete(self):
+        digraph = Graph({
+                "a":{"b":None},
+                "b":{"a":None, "b":None},
+                "c":{}
+            }, directed=True)
+        self.assertEqual(digraph.size(), 3)
+        self.assertFalse(digraph.is_complete())
+
+        digraph.disconnect("b", "b")
+        for v1, v2 in [("a", "c"), ("c", "a"), ("b", "c"), ("c", "b")]:
+            digraph.connect(v1, v2)
+        self.assertEqual(digraph.size(), 6)
+        self.assertTrue(digraph.is_complete())
+        self.assertTrue(digraph.is_regular())
+
+        digraph.connect("a", "a")
+        digraph.remove_vertex("a")
+        self.assertEqual(digraph.size(), 2)
+
+    def test_add_edges_from(self):
+        digraph = Graph.from_edges(((str(i), str(i + 1)) for i in range(4)),
+            directed=True)
+        self.assertEqual(digraph.order(), 5)
+        self.assertEqual(digraph.size(), 4)
+        self.assertEqual(digraph.get_successors("1"), {"2"})
+        self.assertEqual(digraph.get_predecessors("1"), {"0"})
+
+        digraph.add_edges_from([("4", "0"), ("0", "5")])
+        self.assertEqual(digraph.get_predecessors("0"), {"4"})
+        self.assertEqual(digraph.get_indegree("5"), 1)
+        self.assertTrue(digraph.has_cycle())
+
+    def test_views(self):
+        digraph = Graph({
+                "a":{"b":None},
+                "b":{},
+                "c":{"b":None}
+            }, directed=True)
+        successors = digraph.successors_view("a")
+        predecessors = digraph.predecessors_view("b")
+        self.assertEqual(successors, {"b"})
+        self.assertEqual(predecessors, {"a", "c"})
+        self.assertEqual(digraph.adjacents_view("b"), predecessors)
+
+        digraph.disconnect("c", "b")
+        digraph.connect("a", "c")
+        self.assertEqual(successors, {"b", "c"})
+        self.assertEqual(len(predecessors), 1)
+        self.assertNotIn("c", predecessors)
+
     def test_connect_without_vertices(self):
         graph = Graph({}, directed=True)
 
@@ -179,6 +259,128 @@ class TestDirected(TestCase):
         self.assertFalse(dg1.has_cycle(random_dg1, random_dg1, None))
         self.assertTrue(dg2.has_cycle(random_dg2, random_dg2, None))
 
+        cycle = dg2.find_cycle()
+        self.assertEqual(len(cycle), 3)
+        for i in range(3):
+            self.assertIn(cycle[(i + 1) % 3], dg2.get_successors(cycle[i]))
+
+        dg3 = Graph({
+                "a":{"b":None, "c":None},
+                "b":{"d":None},
+                "c":{"d":None},
+                "d":{}
+            }, directed=True)
+        self.assertFalse(dg3.has_cycle())
+        dg3.connect("d", "a")
+        self.assertTrue(dg3.has_cycle())
+        self.assertTrue(dg3.has_cycle("d"))
+
+    def test_transitive_closure(self):
+        digraph = Graph({
+                "a":{"b":None},
+                "b":{"c":None},
+                "c":{},
+                "d":{"a":None}
+            }, directed=True)
+
+        self.assertEqual(digraph.transitive_closure("a"), {"a", "b", "c"})
+        self.assertEqual(digraph.transitive_closure("c"), {"c"})
+        self.assertEqual(digraph.transitive_closure("d"), {"a", "b", "c", "d"})
+        self.assertEqual(list(digraph.bfs("d")), ["d", "a", "b", "c"])
+        self.assertEqual(list(digraph.dfs("d")), ["d", "a", "b", "c"])
+
+    def test_is_connected(self):
+        tree = Graph({"a":{"b":None, "c":None}, "b":{}, "c":{}}, directed=True)
+        forest = Graph({"a":{"b":None}, "b":{}, "c":{}}, directed=True)
+        # The direction of the edges is ignored, whatever
+        # vertex the search would start from.
+        for _ in range(20):
+            self.assertTrue(tree.is_connected())
+            self.assertTrue(tree.is_tree())
+            self.assertFalse(forest.is_connected())
+            self.assertFalse(forest.is_tree())
+        self.assertTrue(Graph(directed=True).is_connected())
+        forest.connect("c", "b")
+        self.assertTrue(forest.is_connected())
+
+    def test_strongly_connected_components(self):
+        digraph = Graph({
+                "a":{"b":None},
+                "b":{"c":None},
+                "c":{"a":None, "d":None},
+                "d":{"e":None},
+                "e":{"d":None, "f":None},
+                "f":{},
+                "g":{"f":None}
+            }, directed=True)
+        labels = digraph.strongly_connected_components()
+        self.assertEqual(labels["a"], labels["b"])
+        self.assertEqual(labels["a"], labels["c"])
+        self.assertEqual(labels["d"], labels["e"])
+        self.assertEqual(len(set(labels.values())), 4)
+        # Reverse topological order: a sink gets a smaller number.
+        self.assertLess(labels["f"], labels["d"])
+        self.assertLess(labels["d"], labels["a"])
+
+        condensed = digraph.condensation(labels)
+        self.assertTrue(condensed.directed)
+        self.assertEqual(condensed.order(), 4)
+        self.assertEqual(condensed.size(), 3)
+        self.assertFalse(condensed.has_cycle())
+        self.assertEqual(condensed.get_successors(labels["a"]), {labels["d"]})
+
+        weak = digraph.connected_components()
+        self.assertEqual(len(set(weak.values())), 1)
+
+    def test_long_cycle_components(self):
+        digraph = Graph.from_edges(((i, (i + 1) % 5000) for i in range(5000)),
+            directed=True)
+        self.assertEqual(set(digraph.strongly_connected_components().values()), {0})
+
+    def test_reachable_from_many(self):
+        digraph = Graph.from_edges([(i, i + 1) for i in range(99)] +
+            [(i, i - 50) for i in range(50, 100, 10)], directed=True)
+        expected = {v: digraph.transitive_closure(v) for v in digraph.vertices}
+
+        for workers, bitset in [(None, False), (None, True), (2, False), (2, True)]:
+            found = dict(digraph.reachable_from_many(iter(range(100)),
+                workers=workers, bitset=bitset))
+            self.assertEqual(found, expected)
+        self.assertRaises(VertexNotFound, list,
+            digraph.reachable_from_many(["z"], bitset=True))
+
+    def test_topological_sort(self):
+        digraph = Graph({
+                "shirt":{"tie":None, "belt":None},
+                "tie":{"jacket":None},
+                "pants":{"belt":None, "shoes":None},
+                "belt":{"jacket":None},
+                "socks":{"shoes":None},
+                "shoes":{},
+                "jacket":{},
+                "watch":{}
+            }, directed=True)
+        order = list(digraph.topological_sort())
+        self.assertEqual(set(order), digraph.get_vertices())
+        for vertex in order:
+            for successor in digraph.get_successors(vertex):
+                self.assertLess(order.index(vertex), order.index(successor))
+
+        layers = digraph.topological_layers()
+        self.assertEqual(set(layers[0]), {"shirt", "pants", "socks", "watch"})
+        self.assertEqual(set(layers[1]), {"tie", "belt", "shoes"})
+        self.assertEqual(layers[2], ["jacket"])
+
+        digraph.connect("jacket", "shirt")
+        with self.assertRaises(CycleFound) as raised:
+            list(digraph.topological_sort())
+        cycle = raised.exception.cycle
+        self.assertIn("jacket", cycle)
+        for i in range(len(cycle)):
+            self.assertIn(cycle[i], digraph.get_successors(cycle[i - 1]))
+        self.assertRaises(CycleFound, digraph.topological_layers)
+        self.assertRaises(NotDigraph, next, Graph({"a":{}}).topological_sort())
+
     def test_specific_actions(self):
         g = Graph({
                 "a":{"b":None},
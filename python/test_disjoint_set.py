@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+from unittest import TestCase, main
+from disjoint_set import DisjointSet
+
+class TestDisjointSet(TestCase):
+    def test_union_and_find(self):
+        subsets = DisjointSet("abcde")
+        self.assertEqual(len(subsets), 5)
+        self.assertEqual(subsets.count(), 5)
+
+        self.assertTrue(subsets.union("a", "b"))
+        self.assertTrue(subsets.union("c", "d"))
+        self.assertFalse(subsets.union("b", "a"))
+        self.assertEqual(subsets.count(), 3)
+        self.assertTrue(subsets.connected("a", "b"))
+        self.assertFalse(subsets.connected("a", "c"))
+
+        subsets.union("b", "d")
+        self.assertTrue(subsets.connected("a", "c"))
+        self.assertEqual(subsets.find("c"), subsets.find("a"))
+        self.assertEqual(subsets.count(), 2)
+
+        subsets.add("f")
+        subsets.add("a")
+        self.assertIn("f", subsets)
+        self.assertEqual(len(subsets), 6)
+        self.assertEqual(subsets.count(), 3)
+
+    def test_long_chain(self):
+        subsets = DisjointSet(range(10000))
+        for i in range(9999):
+            subsets.union(i, i + 1)
+        self.assertEqual(subsets.count(), 1)
+        self.assertTrue(subsets.connected(0, 9999))
+
+if __name__ == "__main__":
+    main()
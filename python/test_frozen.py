@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+from unittest import TestCase, main
+from graph import Graph
+from frozen import FrozenGraph
+from graph_exceptions import VertexNotFound, NotDigraph, NotValued
+
+class TestFrozen(TestCase):
+    def test_freeze_undirected(self):
+        graph = Graph({
+                "a":{"b":None, "c":None},
+                "b":{"a":None, "c":None},
+                "c":{"a":None, "b":None, "d":None},
+                "d":{"c":None},
+                "e":{}
+            })
+        frozen = graph.freeze()
+
+        self.assertIsInstance(frozen, FrozenGraph)
+        self.assertEqual(frozen.order(), 5)
+        self.assertEqual(frozen.size(), 4)
+        self.assertEqual(frozen.get_vertices(), {"a", "b", "c", "d", "e"})
+        self.assertEqual(frozen.get_adjacents("c"), {"a", "b", "d"})
+        self.assertEqual(frozen.get_adjacents("e"), set())
+        self.assertEqual(frozen.get_degree("c"), 3)
+        self.assertEqual(frozen.transitive_closure("a"), {"a", "b", "c", "d"})
+        self.assertEqual(list(frozen.bfs("d")), ["d", "c", "a", "b"])
+        self.assertEqual(set(frozen.dfs("a")), {"a", "b", "c", "d"})
+        self.assertFalse(frozen.is_connected())
+        self.assertFalse(frozen.is_regular())
+        self.assertFalse(frozen.is_complete())
+        self.assertIn(frozen.get_random_vertex(), graph.get_vertices())
+
+        self.assertRaises(NotDigraph, frozen.get_successors, "a")
+        self.assertRaises(NotDigraph, frozen.get_indegree, "a")
+        self.assertRaises(NotValued, frozen.get_value, "a", "b")
+        self.assertRaises(VertexNotFound, frozen.get_adjacents, "z")
+
+    def test_freeze_directed(self):
+        digraph = Graph({
+                "a":{"b":None, "c":None},
+                "b":{"c":None},
+                "c":{"a":None},
+                "d":{"c":None}
+            }, directed=True)
+        frozen = digraph.freeze()
+
+        self.assertEqual(frozen.size(), 5)
+        self.assertEqual(frozen.get_successors("a"), {"b", "c"})
+        self.assertEqual(frozen.get_predecessors("c"), {"a", "b", "d"})
+        self.assertEqual(frozen.get_adjacents("c"), {"a", "b", "d"})
+        self.assertEqual(frozen.get_indegree("c"), 3)
+        self.assertEqual(frozen.get_outdegree("d"), 1)
+        self.assertEqual(frozen.transitive_closure("a"), {"a", "b", "c"})
+        self.assertEqual(frozen.transitive_closure("d"), {"a", "b", "c", "d"})
+        self.assertTrue(frozen.is_connected())
+        tree = Graph({"a":{"b":None, "c":None}, "b":{}, "c":{}}, directed=True)
+        self.assertTrue(tree.freeze().is_connected())
+        digraph.add_vertex("e")
+        self.assertFalse(digraph.freeze().is_connected())
+
+    def test_freeze_valued(self):
+        graph = Graph({
+                "a":{"b":2, "c":3},
+                "b":{"a":2, "c":6},
+                "c":{"a":3, "b":6}
+            }, valued=True)
+        frozen = graph.freeze()
+
+        self.assertEqual(frozen.get_value("a", "b"), 2)
+        self.assertEqual(frozen.get_value("c", "b"), 6)
+        self.assertIsNone(frozen.get_value("a", "z"))
+        self.assertTrue(frozen.is_complete())
+        self.assertTrue(frozen.is_regular())
+        self.assertTrue(frozen.is_connected())
+
+    def test_freeze_mixed_values(self):
+        graph = Graph({
+                "a":{"b":2 ** 53 + 1, "c":0.5},
+                "b":{"a":2 ** 53 + 1},
+                "c":{"a":0.5}
+            }, valued=True)
+        frozen = graph.freeze()
+
+        self.assertEqual(frozen.get_value("a", "b"), 2 ** 53 + 1)
+        self.assertIs(type(frozen.get_value("a", "b")), int)
+        self.assertEqual(frozen.get_value("c", "a"), 0.5)
+        self.assertEqual(frozen.thaw().vertices, graph.vertices)
+
+    def test_reachable_from_many(self):
+        graph = Graph.from_edges([(0, 1), (1, 2), (3, 4), (5, 5)])
+        frozen = graph.freeze()
+        found = dict(frozen.reachable_from_many(range(6), width=4))
+        self.assertEqual(found, {
+                0:{0, 1, 2}, 1:{0, 1, 2}, 2:{0, 1, 2},
+                3:{3, 4}, 4:{3, 4}, 5:{5}
+            })
+
+    def test_thaw(self):
+        graph = Graph({
+                "a":{"b":1.5},
+                "b":{},
+                "c":{"a":("x", 1)}
+            }, directed=True, valued=True)
+        thawed = graph.freeze().thaw()
+
+        self.assertEqual(thawed.vertices, graph.vertices)
+        self.assertTrue(thawed.directed)
+        self.assertEqual(thawed.get_predecessors("a"), {"c"})
+        thawed.connect("b", "c", 2)
+        self.assertEqual(graph.get_successors("b"), set())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+from io import StringIO
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from graph import Graph
+from graph_io import read_edgelist, write_edgelist, read_adjlist, \
+    write_adjlist, format_edgelist
+
+class TestIO(TestCase):
+    def test_read_edgelist(self):
+        graph = read_edgelist(StringIO(
+            "# comment\n"
+            "a\tb\n"
+            "\n"
+            "b\tc\n"
+            "d\n"))
+        self.assertEqual(graph.get_vertices(), {"a", "b", "c", "d"})
+        self.assertEqual(graph.get_adjacents("b"), {"a", "c"})
+        self.assertEqual(graph.get_degree("d"), 0)
+
+        self.assertRaises(ValueError, read_edgelist, StringIO("a b c\n"))
+
+    def test_read_weighted_csv(self):
+        dg = read_edgelist(StringIO("1,2,0.5\n2,3,1.5\n"), directed=True,
+            valued=True, delimiter=",", vertex_type=int)
+        self.assertEqual(dg.get_successors(1), {2})
+        self.assertEqual(dg.get_value(2, 3), 1.5)
+
+    def test_edgelist_round_trip(self):
+        dg = Graph({
+                "a":{"b":2.0, "c":3.0},
+                "b":{"c":1.0},
+                "c":{},
+                "d":{}
+            }, directed=True, valued=True)
+        with TemporaryDirectory() as directory:
+            file = path.join(directory, "graph.tsv")
+            write_edgelist(dg, file)
+            loaded = read_edgelist(file, directed=True, valued=True)
+        self.assertEqual(loaded.vertices, dg.vertices)
+
+        graph = Graph({
+                "a":{"b":None},
+                "b":{"a":None}
+            })
+        self.assertEqual(list(format_edgelist(graph, ",")), ["a,b\n"])
+
+    def test_adjlist_round_trip(self):
+        graph = Graph({
+                "a":{"b":None, "c":None},
+                "b":{"a":None},
+                "c":{"a":None},
+                "d":{}
+            })
+        output = StringIO()
+        write_adjlist(graph, output)
+        loaded = read_adjlist(StringIO(output.getvalue()))
+        self.assertEqual(loaded.vertices, graph.vertices)
+        self.assertEqual(loaded.size(), 2)
+
+if __name__ == "__main__":
+    main()
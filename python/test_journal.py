@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+from unittest import TestCase, main
+from graph import Graph
+from journal import Journal, unpack_delta, ADD_VERTEX, CONNECT, \
+    DISCONNECT, REMOVE_VERTEX, FULL
+
+class TestJournal(TestCase):
+    def test_record_changes(self):
+        graph = Graph()
+        graph.enable_journal()
+        graph.add_vertex("a")
+        graph.add_vertex("a")
+        graph.add_edges_from([("a", "b"), ("b", "c")])
+        graph.disconnect("a", "b")
+        graph.remove_vertex("c")
+
+        self.assertEqual(graph.journal_sequence(), 7)
+        flags, since, last, changes = unpack_delta(graph.delta(2))
+        self.assertEqual((flags, since, last), (0, 2, 7))
+        self.assertEqual(changes, [
+                (CONNECT, "a", "b", None),
+                (ADD_VERTEX, "c", None, None),
+                (CONNECT, "b", "c", None),
+                (DISCONNECT, "a", "b", None),
+                (REMOVE_VERTEX, "c", None, None)
+            ])
+        self.assertEqual(unpack_delta(graph.delta(7))[3], [])
+        self.assertRaises(ValueError, graph.delta, 8)
+        self.assertRaises(ValueError, Graph().journal_sequence)
+
+    def test_replica(self):
+        graph = Graph({
+                "a":{"b":1.5},
+                "b":{},
+                (1, 2):{"a":-3}
+            }, directed=True, valued=True)
+        graph.enable_journal(max_entries=2)
+        replica = Graph(directed=True, valued=True)
+
+        sequence = replica.apply_delta(graph.delta())
+        self.assertEqual(sequence, 1)
+        self.assertEqual(replica.vertices, graph.vertices)
+
+        graph.connect("b", (1, 2), "x")
+        graph.disconnect("a", "b")
+        sequence = replica.apply_delta(graph.delta(sequence), sequence)
+        self.assertEqual(sequence, 3)
+        self.assertEqual(replica.vertices, graph.vertices)
+        self.assertEqual(replica.get_predecessors((1, 2)), {"b"})
+
+        # Three changes, but only the last two are kept.
+        graph.add_vertex("c")
+        graph.connect("c", "c", 7)
+        graph.remove_vertex("b")
+        data = graph.delta(sequence)
+        self.assertTrue(unpack_delta(data)[0] & FULL)
+        sequence = replica.apply_delta(data)
+        self.assertEqual(sequence, 6)
+        self.assertEqual(replica.vertices, graph.vertices)
+        self.assertEqual(replica.size(), graph.size())
+
+        graph.compact_journal()
+        self.assertTrue(unpack_delta(graph.delta(5))[0] & FULL)
+        self.assertFalse(unpack_delta(graph.delta(6))[0] & FULL)
+        graph.add_vertex("d")
+        self.assertRaises(ValueError, replica.apply_delta, graph.delta(6), 5)
+
+    def test_journal_of_graph_with_vertices(self):
+        graph = Graph({"a":{"b":None}, "b":{}}, directed=True)
+        graph.enable_journal()
+        self.assertEqual(graph.journal_sequence(), 1)
+        self.assertTrue(unpack_delta(graph.delta(0))[0] & FULL)
+        self.assertEqual(unpack_delta(graph.delta(1))[3], [])
+
+        graph.connect("b", "a")
+        replica = Graph(directed=True)
+        sequence = replica.apply_delta(graph.delta(0), 0)
+        self.assertEqual(sequence, 2)
+        self.assertEqual(replica.vertices, graph.vertices)
+        graph.add_vertex("c")
+        sequence = replica.apply_delta(graph.delta(sequence), sequence)
+        self.assertEqual(replica.vertices, graph.vertices)
+
+        empty = Graph()
+        empty.enable_journal()
+        self.assertEqual(empty.journal_sequence(), 0)
+
+    def test_other_kind_of_graph(self):
+        digraph = Graph({"a":{"b":2}, "b":{}}, directed=True, valued=True)
+        digraph.enable_journal()
+        data = digraph.delta()
+        self.assertRaises(ValueError, Graph(valued=True).apply_delta, data)
+        self.assertRaises(ValueError, Graph(directed=True).apply_delta, data)
+        replica = Graph(directed=True, valued=True)
+        replica.apply_delta(data)
+        self.assertEqual(replica.vertices, digraph.vertices)
+
+    def test_unwritable_terms(self):
+        graph = Graph()
+        graph.enable_journal()
+        graph.add_vertex(object())
+        self.assertRaises(ValueError, graph.delta, 0)
+
+    def test_compact(self):
+        journal = Journal()
+        for vertex in range(5):
+            journal.record(ADD_VERTEX, vertex)
+        self.assertEqual(len(journal.since(2)), 3)
+        journal.compact()
+        self.assertEqual(journal.sequence, 5)
+        self.assertIsNone(journal.since(2))
+        self.assertEqual(journal.since(5), [])
+
+if __name__ == "__main__":
+    main()
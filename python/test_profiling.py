@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+from unittest import TestCase, main
+from graph import Graph
+from profiling import GraphProfiler
+
+class TestProfiling(TestCase):
+    def test_stats(self):
+        graph = Graph.from_edges([("a", "b"), ("b", "c")])
+        vertices = graph.vertices
+
+        with graph.profile(loop_threshold=5) as profiler:
+            graph.add_vertex("d")
+            graph.connect("c", "d")
+            self.assertTrue(graph.is_connected())
+            self.assertEqual(list(graph.bfs("a")), ["a", "b", "c", "d"])
+            for _ in range(6):
+                graph.is_tree()
+        stats = profiler.stats()
+
+        methods = stats["methods"]
+        self.assertEqual(methods["connect"]["calls"], 1)
+        self.assertEqual(methods["is_tree"]["calls"], 6)
+        self.assertEqual(methods["bfs"]["calls"], 1)
+        self.assertEqual(methods["bfs"]["lookups"], 4)
+        self.assertGreater(methods["is_connected"]["lookups"], 0)
+        self.assertGreaterEqual(methods["is_tree"]["seconds"], 0)
+        # Nested calls are measured, but not reported as scans.
+        self.assertEqual(methods["is_connected"]["calls"], 7)
+        scans = stats["scans_in_loops"]
+        self.assertEqual([(s["method"], s["calls"]) for s in scans], [("is_tree", 6)])
+        self.assertTrue(scans[0]["file"].endswith("test_profiling.py"))
+
+        # The graph is restored, with the changes made meanwhile.
+        self.assertIs(graph.vertices, vertices)
+        self.assertIs(type(graph.vertices), dict)
+        self.assertEqual(graph.get_adjacents("d"), {"c"})
+        self.assertNotIn("connect", graph.__dict__)
+        graph.connect("a", "d")
+        self.assertEqual(profiler.stats()["methods"]["connect"]["calls"], 1)
+
+    def test_views_while_profiling(self):
+        graph = Graph.from_edges([(1, 2)])
+        before = graph.vertices_view()
+        with graph.profile() as profiler:
+            during = graph.vertices_view()
+            graph.add_vertex(3)
+            self.assertIn(3, before)
+        graph.add_vertex(4)
+        self.assertEqual(set(before), {1, 2, 3, 4})
+        self.assertEqual(set(during), {1, 2, 3, 4})
+        self.assertEqual(graph.get_vertices(), {1, 2, 3, 4})
+
+    def test_reset(self):
+        graph = Graph.from_edges([(1, 2)])
+        profiler = GraphProfiler(graph)
+        profiler.start()
+        graph.get_degree(1)
+        profiler.reset()
+        graph.get_degree(2)
+        profiler.stop()
+        self.assertEqual(profiler.stats()["methods"]["get_degree"]["calls"], 1)
+
+if __name__ == "__main__":
+    main()
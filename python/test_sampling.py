@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+from collections import Counter
+from unittest import TestCase, main
+from graph import Graph
+from sampling import Sampler, numpy
+from graph_exceptions import VertexNotFound
+
+class TestSampling(TestCase):
+    def test_random_vertex_after_removals(self):
+        graph = Graph.from_edges((i, i + 1) for i in range(9))
+        graph.remove_vertex(0)
+        graph.remove_vertex(5)
+        graph.add_vertex(10)
+
+        self.assertEqual(sorted(graph._vertex_list), sorted(graph.vertices))
+        for vertex, position in graph._positions.items():
+            self.assertEqual(graph._vertex_list[position], vertex)
+        for _ in range(50):
+            self.assertIn(graph.get_random_vertex(), graph.vertices)
+
+    def test_random_neighbor(self):
+        graph = Graph({
+                "a":{"b":None, "c":None},
+                "b":{"a":None},
+                "c":{"a":None},
+                "d":{}
+            })
+        sampler = graph.sampler(seed=1)
+
+        self.assertIsInstance(sampler, Sampler)
+        self.assertEqual({sampler.random_vertex() for _ in range(100)},
+            {"a", "b", "c", "d"})
+        self.assertEqual({sampler.random_neighbor("a") for _ in range(100)},
+            {"b", "c"})
+        self.assertEqual(sampler.random_neighbor("b"), "a")
+        self.assertIsNone(sampler.random_neighbor("d"))
+        self.assertRaises(VertexNotFound, sampler.random_neighbor, "z")
+
+    def test_weighted_neighbor(self):
+        digraph = Graph({
+                "a":{"b":1, "c":3, "d":0},
+                "b":{}, "c":{}, "d":{}
+            }, directed=True, valued=True)
+        sampler = Sampler(digraph, seed=7)
+        drawn = Counter(sampler.random_neighbor("a") for _ in range(4000))
+
+        self.assertNotIn("d", drawn)
+        self.assertAlmostEqual(drawn["c"] / drawn["b"], 3, delta=0.5)
+        uniform = Sampler(digraph, seed=7, weighted=False)
+        self.assertIn("d", {uniform.random_neighbor("a") for _ in range(100)})
+
+        negative = Graph({"a":{"b":-1}, "b":{}}, directed=True, valued=True)
+        self.assertRaises(ValueError, Sampler, negative)
+        self.assertRaises(ValueError, Sampler, Graph({"a":{}}), weighted=True)
+
+    def test_random_walks(self):
+        digraph = Graph.from_edges([(0, 1), (1, 2), (2, 0), (2, 3)],
+            directed=True)
+        sampler = digraph.sampler(seed=3)
+        batches = list(sampler.random_walks([0, 3], length=5, n=3, batch=4))
+
+        self.assertEqual([len(walks) for walks in batches], [4, 2])
+        walks = [list(walk) for batch in batches for walk in batch]
+        edges = {(vertex1, vertex2) for vertex1, vertex2, _ in digraph.iter_edges()}
+        for walk in walks:
+            self.assertEqual(len(walk), 6)
+            labels = [sampler.labels[i] if i >= 0 else None for i in walk]
+            for vertex1, vertex2 in zip(labels, labels[1:]):
+                if vertex2 is not None:
+                    self.assertIn((vertex1, vertex2), edges)
+                elif vertex1 is not None:
+                    self.assertEqual(vertex1, 3)
+        self.assertEqual([sampler.labels[walk[0]] for walk in walks],
+            [0, 0, 0, 3, 3, 3])
+        self.assertEqual(walks[-1][1:], [-1] * 5)
+        if numpy is not None:
+            self.assertEqual(batches[0].shape, (4, 6))
+
+if __name__ == "__main__":
+    main()
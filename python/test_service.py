@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+import asyncio
+import json
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase, main
+from threading import Event, Thread
+from graph import Graph
+from concurrent_graph import ConcurrentGraph
+from graph_service import GraphService
+from graph_exceptions import VertexNotFound, NotDigraph
+
+class CountingGraph(Graph):
+    # Counts the calls of the traversals.
+
+    calls = 0
+
+    def transitive_closure(self, vertex, visited=None):
+        CountingGraph.calls += 1
+        return Graph.transitive_closure(self, vertex, visited)
+
+class TestService(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.graph = Graph({
+                "a":{"b":2, "c":5},
+                "b":{"a":2, "c":1},
+                "c":{"a":5, "b":1},
+                (1, 2):{}
+            }, valued=True)
+        self.service = GraphService(self.graph)
+
+    async def test_query(self):
+        service = self.service
+        self.assertEqual(await service.query("get_adjacents", "a"), {"b", "c"})
+        self.assertEqual(await service.query("shortest_path", "a", "c"),
+            (3, ["a", "b", "c"]))
+        self.assertFalse(await service.query("is_connected"))
+        self.assertEqual(await service.query("bfs", "c"), ["c", "a", "b"])
+        with self.assertRaises(VertexNotFound):
+            await service.query("transitive_closure", "z")
+        with self.assertRaises(ValueError):
+            await service.query("remove_vertex", "a")
+
+    async def test_batched_lookups(self):
+        turns = []
+        run = self.service._run_lookups
+        self.service._run_lookups = lambda calls: turns.append(calls) or run(calls)
+        degrees = await asyncio.gather(
+            *(self.service.query("get_degree", v) for v in "abc"),
+            self.service.query("get_value", "a", "b"),
+            self.service.query("get_successors", "a"),
+            return_exceptions=True)
+        self.assertEqual(degrees[:4], [2, 2, 2, 2])
+        self.assertIsInstance(degrees[4], NotDigraph)
+        self.assertEqual(len(turns), 1)
+        self.assertEqual(self.service._in_flight, {})
+
+    async def test_writer_does_not_block_the_loop(self):
+        graph = ConcurrentGraph.from_edges([("a", "b")])
+        service = GraphService(graph)
+        locked, release = Event(), Event()
+        self.addCleanup(release.set)
+
+        def write():
+            with graph.transaction():
+                graph.add_edges_from([("a", "c")])
+                locked.set()
+                release.wait()
+
+        writer = Thread(target=write)
+        writer.start()
+        self.assertTrue(locked.wait(5))
+        lookup = asyncio.ensure_future(service.query("get_adjacents", "a"))
+        # The loop goes on while the lookup waits for the writer.
+        await asyncio.sleep(0.05)
+        self.assertFalse(lookup.done())
+        release.set()
+        self.assertEqual(await lookup, {"b", "c"})
+        writer.join()
+
+    async def test_coalesced_queries(self):
+        CountingGraph.calls = 0
+        service = GraphService(CountingGraph(self.graph.vertices, valued=True))
+        closures = await asyncio.gather(
+            *(service.query("transitive_closure", "a") for _ in range(10)))
+        self.assertEqual(CountingGraph.calls, 1)
+        self.assertTrue(all(closure is closures[0] for closure in closures))
+
+        await service.query("transitive_closure", "a")
+        self.assertEqual(CountingGraph.calls, 2)
+
+    async def request(self, reader, writer, *requests):
+        for request in requests:
+            writer.write(json.dumps(request).encode("utf-8") + b"\n")
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in requests]
+        return sorted(responses, key=lambda response: response["id"])
+
+    async def test_tcp_server(self):
+        server = await self.service.start_server()
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        responses = await self.request(reader, writer,
+            {"id": 1, "method": "get_adjacents", "params": ["a"]},
+            {"id": 2, "method": "dijkstra", "params": ["a"]},
+            {"id": 3, "method": "get_degree", "params": [[1, 2]]},
+            {"id": 4, "method": "bfs", "params": ["z"]},
+            {"id": 5, "method": "connect", "params": ["a", "z"]})
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+        self.assertEqual(responses[0], {"id": 1, "result": ["b", "c"]})
+        self.assertEqual(responses[1]["result"],
+            [{"a": 0, "b": 2, "c": 3}, {"a": None, "b": "a", "c": "b"}])
+        self.assertEqual(responses[2], {"id": 3, "result": 0})
+        self.assertEqual(responses[3]["error"]["type"], "VertexNotFound")
+        self.assertEqual(responses[4]["error"]["type"], "ValueError")
+
+    async def test_unix_server(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.sock")
+            server = await self.service.start_unix_server(path)
+            reader, writer = await asyncio.open_unix_connection(path)
+            responses = await self.request(reader, writer,
+                {"id": 1, "method": "is_tree"},
+                {"id": 2, "method": "size"})
+            writer.close()
+            server.close()
+            await server.wait_closed()
+        self.assertEqual(responses, [{"id": 1, "result": False},
+            {"id": 2, "result": 3}])
+
+if __name__ == "__main__":
+    main()
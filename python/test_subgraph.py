@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+from unittest import TestCase, main
+from graph import Graph
+from subgraph import Subgraph
+from concurrent_graph import ConcurrentGraph
+from graph_exceptions import VertexNotFound, ReadOnlyGraph
+
+class TestSubgraph(TestCase):
+    def setUp(self):
+        self.graph = Graph({
+                "a":{"b":None, "c":None},
+                "b":{"a":None, "c":None},
+                "c":{"a":None, "b":None, "d":None},
+                "d":{"c":None, "e":None},
+                "e":{"d":None}
+            })
+
+    def test_induced_subgraph(self):
+        region = self.graph.subgraph(["a", "b", "c"])
+
+        self.assertIsInstance(region, Subgraph)
+        self.assertEqual(region.order(), 3)
+        self.assertEqual(region.size(), 3)
+        self.assertEqual(region.get_adjacents("c"), {"a", "b"})
+        self.assertEqual(region.get_degree("c"), 2)
+        self.assertTrue(region.is_connected())
+        self.assertTrue(region.is_regular())
+        self.assertTrue(region.is_complete())
+        self.assertFalse(region.is_tree())
+        self.assertEqual(region.transitive_closure("a"), {"a", "b", "c"})
+        self.assertIn(region.get_random_vertex(), {"a", "b", "c"})
+        self.assertFalse(self.graph.subgraph(["a", "e"]).is_connected())
+        self.assertTrue(self.graph.subgraph(["c", "d", "e"]).is_tree())
+        self.assertRaises(VertexNotFound, self.graph.subgraph, ["a", "z"])
+
+    def test_follows_the_graph(self):
+        region = self.graph.subgraph(["a", "b", "c"])
+        self.graph.disconnect("a", "b")
+        self.assertEqual(region.size(), 2)
+        self.assertTrue(region.is_tree())
+
+        self.graph.remove_vertex("c")
+        self.assertEqual(region.get_vertices(), {"a", "b"})
+        self.assertFalse(region.is_connected())
+
+    def test_edge_subgraph(self):
+        path = self.graph.edge_subgraph([("a", "c"), ("c", "d", None)])
+
+        self.assertEqual(path.get_vertices(), {"a", "c", "d"})
+        self.assertEqual(path.get_adjacents("c"), {"a", "d"})
+        self.assertEqual(path.size(), 2)
+        self.assertTrue(path.is_tree())
+        self.assertRaises(ValueError, self.graph.edge_subgraph, [("a", "e")])
+        self.assertRaises(VertexNotFound, self.graph.edge_subgraph, [("a", "z")])
+
+    def test_directed_subgraph(self):
+        digraph = Graph({
+                "a":{"b":1},
+                "b":{"c":2},
+                "c":{"a":3, "d":4},
+                "d":{}
+            }, directed=True, valued=True)
+        cycle = digraph.subgraph(["a", "b", "c"])
+
+        self.assertEqual(cycle.get_successors("c"), {"a"})
+        self.assertEqual(cycle.get_predecessors("a"), {"c"})
+        self.assertEqual(cycle.get_indegree("a"), 1)
+        self.assertEqual(cycle.get_value("c", "a"), 3)
+        self.assertTrue(cycle.has_cycle())
+        self.assertEqual(cycle.size(), 3)
+
+        chain = digraph.edge_subgraph([("a", "b"), ("b", "c")])
+        self.assertFalse(chain.has_cycle())
+        self.assertEqual(list(chain.topological_sort()), ["a", "b", "c"])
+        self.assertEqual(chain.get_predecessors("a"), set())
+        self.assertEqual(chain.subgraph(["b", "c"]).size(), 1)
+
+    def test_read_only_and_copy(self):
+        region = self.graph.subgraph(["a", "b", "c"])
+        self.assertRaises(ReadOnlyGraph, region.add_vertex, "f")
+        self.assertRaises(ReadOnlyGraph, region.connect, "a", "b")
+        self.assertRaises(ReadOnlyGraph, region.remove_vertex, "a")
+
+        copy = region.copy()
+        self.assertNotIsInstance(copy, Subgraph)
+        copy.disconnect("a", "b")
+        self.assertEqual(copy.size(), 2)
+        self.assertIn("b", self.graph.get_adjacents("a"))
+
+        graph = self.graph.copy()
+        graph.remove_vertex("a")
+        self.assertEqual(self.graph.order(), 5)
+
+    def test_concurrent_subgraph(self):
+        graph = ConcurrentGraph(self.graph.vertices)
+        region = graph.subgraph(["a", "b"])
+        self.assertNotIsInstance(region, Subgraph)
+        self.assertEqual(region.size(), 1)
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 from unittest import TestCase, main
 from graph import Graph
-from graph_exceptions import NotDigraph, NotValued
+from graph_exceptions import VertexNotFound, NotDigraph, NotValued
 
 class TestUndirected(TestCase):
     def test_construct_undirected_graph(self):
@@ -50,6 +50,20 @@ class TestUndirected(TestCase):
 
         self.assertEqual(graph.get_vertices(), {"a", "b", "c"})
 
+    def test_from_edges(self):
+        graph = Graph.from_edges([("a", "b"), ("b", "c"), ("a", "b")])
+        self.assertEqual(graph.get_vertices(), {"a", "b", "c"})
+        self.assertEqual(graph.get_adjacents("b"), {"a", "c"})
+        self.assertEqual(graph.size(), 2)
+
+        graph.add_vertices_from(["c", "d", "e"])
+        graph.add_edges_from((i, i + 1) for i in range(3))
+        self.assertEqual(graph.order(), 9)
+        self.assertEqual(graph.size(), 5)
+        self.assertEqual(graph.get_degree("d"), 0)
+        self.assertEqual(graph.get_adjacents(1), {0, 2})
+        self.assertRaises(ValueError, graph.add_edges_from, [("a",)])
+
     def test_remove_vertex(self):
         graph = Graph({
                 "a":{"c":None, "b":None, "d":None},
@@ -74,6 +88,17 @@ class TestUndirected(TestCase):
         self.assertEqual(graph.get_adjacents("b"), {"e"})
         self.assertEqual(graph.get_adjacents("d"), {"e"})
 
+    def test_remove_vertex_with_loop(self):
+        graph = Graph({
+                "a":{"a":None, "b":None},
+                "b":{"a":None}
+            })
+
+        graph.remove_vertex("a")
+        self.assertEqual(graph.get_vertices(), {"b"})
+        self.assertEqual(graph.get_adjacents("b"), set())
+        self.assertRaises(VertexNotFound, graph.remove_vertex, "a")
+
     def test_connect(self):
         graph = Graph({
                 "a":{},
@@ -161,6 +186,26 @@ class TestUndirected(TestCase):
         self.assertEqual(graph2.order(), 7)
         self.assertEqual(graph3.order(), 0)
 
+    def test_size(self):
+        graph = Graph({
+                "a":{"b":None, "c":None},
+                "b":{"a":None},
+                "c":{"a":None, "c":None}
+            })
+        self.assertEqual(graph.size(), 3)
+
+        graph.connect("a", "b")
+        self.assertEqual(graph.size(), 3)
+        graph.add_vertex("d")
+        graph.connect("b", "d")
+        self.assertEqual(graph.size(), 4)
+        graph.disconnect("a", "b")
+        graph.disconnect("c", "c")
+        self.assertEqual(graph.size(), 2)
+        graph.remove_vertex("a")
+        self.assertEqual(graph.size(), 1)
+        self.assertEqual(Graph().size(), 0)
+
     def test_get_vertices(self):
         graph1 = Graph({
                 "a":{},
@@ -209,6 +254,28 @@ class TestUndirected(TestCase):
         self.assertEqual(graph.get_adjacents("i"), {"e", "h"})
         self.assertEqual(graph.get_adjacents("j"), {"f"})
 
+    def test_views(self):
+        graph = Graph({
+                "a":{"b":None, "c":None},
+                "b":{"a":None},
+                "c":{"a":None}
+            })
+        vertices = graph.vertices_view()
+        adjacents = graph.adjacents_view("a")
+        self.assertEqual(len(vertices), 3)
+        self.assertEqual(adjacents, {"b", "c"})
+        self.assertIn("b", adjacents)
+        self.assertEqual(adjacents & {"b", "d"}, {"b"})
+        self.assertIsInstance(adjacents | {"d"}, set)
+
+        graph.add_vertex("d")
+        graph.connect("a", "d")
+        self.assertEqual(len(vertices), 4)
+        self.assertEqual(sorted(adjacents), ["b", "c", "d"])
+        self.assertRaises(VertexNotFound, graph.adjacents_view, "z")
+        self.assertRaises(NotDigraph, graph.successors_view, "a")
+        self.assertRaises(NotDigraph, graph.predecessors_view, "a")
+
     def test_get_random(self):
         graph = Graph({
                 "a":{"b":None, "c":None, "d":None},
@@ -238,6 +305,20 @@ class TestUndirected(TestCase):
         self.assertTrue(graph1.is_complete())
         self.assertFalse(graph2.is_complete())
 
+        graph3 = Graph({
+                "a":{"b":None},
+                "b":{"a":None},
+                "c":{"d":None},
+                "d":{"c":None}
+            })
+        self.assertTrue(graph3.is_regular())
+        self.assertFalse(graph3.is_complete())
+        graph3.connect("a", "c")
+        graph3.connect("a", "d")
+        graph3.connect("b", "c")
+        graph3.connect("b", "d")
+        self.assertTrue(graph3.is_complete())
+
     def test_transitive_closure(self):
        graph = Graph({
                "a":{"b":None, "f":None},
@@ -255,6 +336,37 @@ class TestUndirected(TestCase):
        self.assertEqual(graph.transitive_closure("b", set()),
             {"a", "b", "c", "d", "e", "f", "g", "h", "i"})
 
+    def test_bfs_and_dfs(self):
+        graph = Graph({
+                "a":{"b":None, "c":None},
+                "b":{"a":None, "d":None},
+                "c":{"a":None, "d":None},
+                "d":{"b":None, "c":None, "e":None},
+                "e":{"d":None},
+                "f":{}
+            })
+        bfs = list(graph.bfs("a"))
+        dfs = list(graph.dfs("a"))
+        self.assertEqual(bfs[0], "a")
+        self.assertEqual(set(bfs[1:3]), {"b", "c"})
+        self.assertEqual(bfs[3:], ["d", "e"])
+        self.assertEqual(dfs[0], "a")
+        self.assertEqual(set(dfs), {"a", "b", "c", "d", "e"})
+        self.assertEqual(len(dfs), 5)
+        self.assertEqual(list(graph.bfs("f")), ["f"])
+        self.assertRaises(VertexNotFound, next, graph.bfs("z"))
+        self.assertRaises(VertexNotFound, next, graph.dfs("z"))
+
+    def test_long_path_is_connected(self):
+        graph = Graph()
+        for i in range(5000):
+            graph.add_vertex(i)
+            if i:
+                graph.connect(i - 1, i)
+        self.assertTrue(graph.is_connected())
+        self.assertEqual(len(graph.transitive_closure(4999)), 5000)
+        self.assertEqual(list(graph.dfs(0)), list(range(5000)))
+
     def test_is_connected(self):
         graph1 = Graph({
                 "a":{"b":None},
@@ -270,6 +382,52 @@ class TestUndirected(TestCase):
         self.assertTrue(graph1.is_connected())
         self.assertFalse(graph2.is_connected())
 
+    def test_connected_components(self):
+        graph = Graph({
+                "a":{"b":None},
+                "b":{"a":None, "c":None},
+                "c":{"b":None},
+                "d":{"e":None},
+                "e":{"d":None},
+                "f":{}
+            })
+        labels = graph.connected_components()
+        self.assertEqual(labels["a"], labels["b"])
+        self.assertEqual(labels["a"], labels["c"])
+        self.assertEqual(labels["d"], labels["e"])
+        self.assertEqual(len(set(labels.values())), 3)
+        self.assertEqual(set(labels.values()), {0, 1, 2})
+        self.assertEqual(Graph().connected_components(), {})
+        self.assertRaises(NotDigraph, graph.strongly_connected_components)
+
+    def test_track_connectivity(self):
+        graph = Graph({
+                "a":{"b":None},
+                "b":{"a":None},
+                "c":{}
+            })
+        for tracking in (False, True):
+            graph.track_connectivity(tracking)
+            self.assertFalse(graph.is_connected())
+            self.assertEqual(graph.count_components(), 2)
+            self.assertTrue(graph.same_component("a", "b"))
+            self.assertFalse(graph.same_component("a", "c"))
+
+        graph.connect("b", "c")
+        self.assertTrue(graph.is_connected())
+        self.assertTrue(graph.same_component("a", "c"))
+        graph.add_vertex("d")
+        self.assertEqual(graph.count_components(), 2)
+
+        graph.disconnect("a", "b")
+        self.assertEqual(graph.count_components(), 3)
+        self.assertFalse(graph.same_component("a", "c"))
+        graph.connect("a", "d")
+        graph.remove_vertex("c")
+        self.assertEqual(graph.count_components(), 2)
+        self.assertTrue(graph.same_component("a", "d"))
+        self.assertRaises(VertexNotFound, graph.same_component, "a", "c")
+
     def test_is_tree(self):
         g1 = Graph({
                "a":{"b":None, "c":None},
@@ -300,6 +458,47 @@ class TestUndirected(TestCase):
         self.assertFalse(g3.is_tree())
         self.assertFalse(g4.is_tree())
 
+    def test_has_cycle(self):
+        g1 = Graph({
+               "a":{"b":None, "c":None},
+               "b":{"a":None, "d":None},
+               "c":{"a":None},
+               "d":{"b":None}
+           })
+        g2 = Graph({
+               "a":{"b":None},
+               "b":{"a":None, "c":None, "d":None},
+               "c":{"b":None, "d":None},
+               "d":{"b":None, "c":None},
+               "e":{}
+           })
+        g3 = Graph({
+               "a":{"a":None}
+           })
+        self.assertFalse(g1.has_cycle())
+        self.assertFalse(g1.has_cycle("a", "a", None))
+        self.assertIsNone(g1.find_cycle())
+        self.assertTrue(g2.has_cycle())
+        self.assertTrue(g2.has_cycle("a"))
+        self.assertFalse(g2.has_cycle("e"))
+        self.assertEqual(set(g2.find_cycle()), {"b", "c", "d"})
+        self.assertEqual(g3.find_cycle(), ["a"])
+        self.assertRaises(VertexNotFound, g1.find_cycle, "z")
+
+    def test_is_tree_dense(self):
+        graph = Graph()
+        for i in range(40):
+            graph.add_vertex(i)
+        for i in range(40):
+            for j in range(i + 1, 40):
+                graph.connect(i, j)
+        self.assertFalse(graph.is_tree())
+        self.assertTrue(graph.has_cycle())
+        cycle = graph.find_cycle()
+        self.assertGreaterEqual(len(cycle), 3)
+        for i in range(len(cycle)):
+            self.assertIn(cycle[i - 1], graph.get_adjacents(cycle[i]))
+
     def test_specific_actions(self):
         g = Graph({
                 "a":{"b":None},
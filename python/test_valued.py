@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 from unittest import TestCase, main
+from random import Random
 from graph import Graph
+from graph_exceptions import VertexNotFound, NotValued, NotUndirected, \
+    NegativeCycle, CycleFound
 
 class TestValued(TestCase):
     def test_construct_valued_undirected(self):
@@ -26,5 +29,189 @@ class TestValued(TestCase):
         self.assertEqual(dg.get_value("b", "c"), 4)
         self.assertEqual(dg.get_value("c", "a"), 2)
 
+    def test_from_edges(self):
+        dg = Graph.from_edges([("a", "b", 3), ("b", "c", 4), ("c", "a", 2)],
+            directed=True, valued=True)
+        self.assertEqual(dg.get_value("a", "b"), 3)
+        self.assertEqual(dg.get_value("c", "a"), 2)
+
+        graph = Graph.from_edges([("a", "b", 2), ("b", "c")], valued=True)
+        self.assertEqual(graph.get_value("b", "a"), 2)
+        self.assertIsNone(graph.get_value("c", "b"))
+
+    def test_shortest_path(self):
+        graph = Graph({
+                "a":{"b":7, "c":9, "f":14},
+                "b":{"a":7, "c":10, "d":15},
+                "c":{"a":9, "b":10, "d":11, "f":2},
+                "d":{"b":15, "c":11, "e":6},
+                "e":{"d":6, "f":9},
+                "f":{"a":14, "c":2, "e":9},
+                "g":{}
+            }, valued=True)
+
+        distances, previous = graph.dijkstra("a")
+        self.assertEqual(distances, {"a":0, "b":7, "c":9, "d":20, "e":20, "f":11})
+        self.assertEqual(previous["e"], "f")
+        self.assertEqual(graph.shortest_path("a", "e"), (20, ["a", "c", "f", "e"]))
+        self.assertEqual(graph.bidirectional_dijkstra("a", "e"), (20, ["a", "c", "f", "e"]))
+        self.assertEqual(graph.astar("a", "e", lambda v, t: 0), (20, ["a", "c", "f", "e"]))
+        self.assertEqual(graph.bellman_ford("a")[0], distances)
+        self.assertEqual(graph.shortest_path("a", "a"), (0, ["a"]))
+        self.assertIsNone(graph.shortest_path("a", "g"))
+        self.assertIsNone(graph.bidirectional_dijkstra("a", "g"))
+        self.assertIsNone(graph.astar("a", "g", lambda v, t: 0))
+
+        # h(b) = 5 is admissible (b is 6 away from t), but not
+        # consistent, as b -> a costs 1 and h(a) = 0.
+        digraph = Graph({
+                "s":{"a":4, "b":1},
+                "b":{"a":1},
+                "a":{"t":5},
+                "t":{}
+            }, directed=True, valued=True)
+        estimates = {"s":0, "a":0, "b":5, "t":0}
+        self.assertEqual(digraph.astar("s", "t", lambda v, t: estimates[v]),
+            (7, ["s", "b", "a", "t"]))
+        self.assertRaises(VertexNotFound, graph.dijkstra, "z")
+        self.assertRaises(NotValued, Graph({"a":{}}).dijkstra, "a")
+
+    def test_directed_shortest_path(self):
+        dg = Graph({
+                "a":{"b":1, "c":4},
+                "b":{"c":2, "d":6},
+                "c":{"d":3},
+                "d":{"a":1}
+            }, directed=True, valued=True)
+
+        self.assertEqual(dg.shortest_path("a", "d"), (6, ["a", "b", "c", "d"]))
+        self.assertEqual(dg.bidirectional_dijkstra("a", "d"), (6, ["a", "b", "c", "d"]))
+        self.assertEqual(dg.shortest_path("d", "c"), (4, ["d", "a", "b", "c"]))
+        self.assertEqual(dg.bidirectional_dijkstra("d", "c"), (4, ["d", "a", "b", "c"]))
+
+    def test_random_grid_shortest_paths(self):
+        rng = Random(7)
+        graph = Graph(valued=True)
+        for x in range(12):
+            for y in range(12):
+                graph.add_vertex((x, y))
+                if x:
+                    graph.connect((x - 1, y), (x, y), rng.randint(1, 9))
+                if y:
+                    graph.connect((x, y - 1), (x, y), rng.randint(1, 9))
+        distances, _ = graph.dijkstra((0, 0))
+        manhattan = lambda v, t: abs(v[0] - t[0]) + abs(v[1] - t[1])
+        for target in [(11, 11), (5, 7), (0, 11)]:
+            expected = distances[target]
+            self.assertEqual(graph.bidirectional_dijkstra((0, 0), target)[0], expected)
+            self.assertEqual(graph.astar((0, 0), target, manhattan)[0], expected)
+            length, path = graph.shortest_path((0, 0), target)
+            self.assertEqual(length, expected)
+            self.assertEqual(sum(graph.get_value(path[i], path[i + 1])
+                for i in range(len(path) - 1)), expected)
+
+    def test_bellman_ford(self):
+        dg = Graph({
+                "a":{"b":4, "c":2},
+                "b":{"d":-3},
+                "c":{"b":1},
+                "d":{}
+            }, directed=True, valued=True)
+
+        distances, previous = dg.bellman_ford("a")
+        self.assertEqual(distances, {"a":0, "b":3, "c":2, "d":0})
+        self.assertEqual(previous["b"], "c")
+        self.assertRaises(ValueError, dg.dijkstra, "a")
+
+        dg.connect("d", "c", 1)
+        self.assertRaises(NegativeCycle, dg.bellman_ford, "a")
+
+    def test_all_pairs_distances(self):
+        rng = Random(3)
+        dg = Graph(directed=True, valued=True)
+        for i in range(15):
+            dg.add_vertex(i)
+        for _ in range(40):
+            dg.connect(rng.randrange(15), rng.randrange(15), rng.randint(1, 20))
+        dg.add_vertex("isolated")
+
+        vertices, fw = dg.all_pairs_distances("floyd-warshall")
+        self.assertEqual(vertices, list(range(15)) + ["isolated"])
+        _, dijkstra = dg.all_pairs_distances("dijkstra")
+        _, pooled = dg.all_pairs_distances("dijkstra", workers=2)
+        for i, v in enumerate(vertices):
+            distances, _ = dg.dijkstra(v)
+            for j, w in enumerate(vertices):
+                expected = distances.get(w, float("inf"))
+                self.assertEqual(fw[i][j], expected)
+                self.assertEqual(dijkstra[i][j], expected)
+                self.assertEqual(pooled[i][j], expected)
+
+    def test_all_pairs_negative(self):
+        dg = Graph({
+                "a":{"b":2},
+                "b":{"c":-1},
+                "c":{}
+            }, directed=True, valued=True)
+
+        _, matrix = dg.all_pairs_distances("floyd-warshall")
+        self.assertEqual(matrix[0][2], 1)
+        dg.connect("c", "a", -2)
+        self.assertRaises(NegativeCycle, dg.all_pairs_distances, "floyd-warshall")
+        self.assertRaises(ValueError, dg.all_pairs_distances, "johnson")
+
+    def test_critical_path(self):
+        dg = Graph({
+                "start":{"a":0, "b":0},
+                "a":{"c":3},
+                "b":{"c":2, "d":2},
+                "c":{"end":4},
+                "d":{"end":1},
+                "end":{}
+            }, directed=True, valued=True)
+
+        self.assertEqual(dg.critical_path(), (7, ["start", "a", "c", "end"]))
+        self.assertEqual(Graph(directed=True, valued=True).critical_path(), (0, []))
+        dg.connect("end", "start", 1)
+        self.assertRaises(CycleFound, dg.critical_path)
+        self.assertRaises(NotValued, Graph({"a":{}}, directed=True).critical_path)
+
+        negative = Graph({"a":{"b":-5}, "b":{"c":3}, "c":{}}, directed=True,
+            valued=True)
+        self.assertEqual(negative.critical_path(), (3, ["b", "c"]))
+        negative.add_edges_from([("a", "d", -1)])
+        negative.disconnect("b", "c")
+        self.assertEqual(negative.critical_path()[0], 0)
+
+    def test_minimum_spanning_tree(self):
+        graph = Graph({
+                "a":{"b":4, "h":8},
+                "b":{"a":4, "c":8, "h":11},
+                "c":{"b":8, "d":7, "f":4, "i":2},
+                "d":{"c":7, "e":9, "f":14},
+                "e":{"d":9, "f":10},
+                "f":{"c":4, "d":14, "e":10, "g":2},
+                "g":{"f":2, "h":1, "i":6},
+                "h":{"a":8, "b":11, "g":1, "i":7},
+                "i":{"c":2, "g":6, "h":7},
+                "x":{"y":5},
+                "y":{"x":5},
+                "z":{}
+            }, valued=True)
+
+        for algorithm in ("kruskal", "prim"):
+            tree = graph.minimum_spanning_tree(algorithm)
+            self.assertEqual(tree.get_vertices(), graph.get_vertices())
+            self.assertEqual(tree.size(), 9)
+            self.assertEqual(sum(value for _, _, value in tree.iter_edges()), 42)
+            self.assertFalse(tree.has_cycle())
+            self.assertEqual(tree.count_components(), graph.count_components())
+        self.assertEqual(len(list(graph.iter_spanning_edges("prim"))), 9)
+
+        self.assertRaises(ValueError, graph.iter_spanning_edges, "boruvka")
+        self.assertRaises(NotValued, Graph({"a":{}}).minimum_spanning_tree)
+        self.assertRaises(NotUndirected,
+            Graph({"a":{}}, directed=True, valued=True).minimum_spanning_tree)
+
 if __name__ == "__main__":
     main()
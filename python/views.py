@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+#   Read-only views of a Graph (see graph.py). A view is backed by
+#   the structures of the graph itself, nothing is copied when it
+#   is created and the changes made in the graph are seen by it.
+#
+# :author: Caique Marques
+# :license: Gnu General Public License version 3
+#
+from collections.abc import Set
+
+class AdjacencyView(Set):
+    # A set-like view of the keys of a dict (or of a set), as
+    # the vertices of a graph or the adjacents of a vertex.
+    # len() and "in" cost O(1) and the iteration is lazy. The
+    # set operations (&, |, -, ^) return new sets.
+
+    __slots__ = ("_container",)
+
+    def __init__(self, container):
+        self._container = container
+
+    def __len__(self):
+        return len(self._container)
+
+    def __contains__(self, vertex):
+        return vertex in self._container
+
+    def __iter__(self):
+        return iter(self._container)
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, set(self._container))
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)